@@ -1,12 +1,14 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
-    ['cosmic_defender.py'],
+    ['launch.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # Screens and persistence are imported lazily (importlib), invisible to the analysis
+    hiddenimports=collect_submodules('cosmic_defender'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
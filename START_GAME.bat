@@ -16,7 +16,7 @@ if errorlevel 1 (
 )
 
 echo Lancement du jeu...
-python cosmic_defender.py
+python -m cosmic_defender
 
 echo.
 echo Merci d'avoir joue !
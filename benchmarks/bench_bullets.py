@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark du rendu des tirs ennemis
+Compare l'ancien rendu (un pygame.draw.circle par point de traînée avec calcul
+de couleur, un pygame.draw.ellipse par tir) aux sprites pré-rendus par couleur
+et par position de traînée (cosmic_defender.assets.trail / ellipse)
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Headless by default (CI); set SDL_VIDEODRIVER to measure against a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from cosmic_defender.constants import RED, PURPLE, ORANGE, YELLOW
+from cosmic_defender.entities import Bullet
+from cosmic_defender.render_queue import RenderQueue
+
+
+def giga_boss_bullets(count, width, height):
+    """Enemy bullets with full trails, in the Giga Boss colours"""
+    bullets = []
+    for _ in range(count):
+        angle = random.uniform(0, 2 * math.pi)
+        bullet = Bullet(random.uniform(100, width - 100), random.uniform(100, height - 100),
+                        (math.cos(angle) * 300, math.sin(angle) * 300),
+                        color=random.choice([RED, PURPLE, ORANGE, YELLOW]), is_player_bullet=False)
+        for _ in range(bullet.trail_max_length):
+            bullet.update(1 / 60, width, height)
+        bullets.append(bullet)
+    return bullets
+
+
+def draw_primitives(screen, bullets):
+    """Bullet.draw before the pre-rendered sprites"""
+    for bullet in bullets:
+        for i, (trail_x, trail_y) in enumerate(bullet.trail):
+            alpha = (i + 1) / len(bullet.trail)
+            trail_color = tuple(int(c * alpha) for c in bullet.color)
+            trail_size = int(2 * alpha) + 1
+            pygame.draw.circle(screen, trail_color, (int(trail_x), int(trail_y)), trail_size)
+        pygame.draw.ellipse(screen, bullet.color, bullet.rect)
+
+
+def draw_sprites(screen, bullets):
+    queue = RenderQueue()
+    for bullet in bullets:
+        bullet.draw(queue)
+    queue.flush(screen)
+
+
+def best_of(function, screen, bullets, frames, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(frames):
+            function(screen, bullets)
+        times.append((time.perf_counter() - start) / frames)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="*", default=[50, 200, 800])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((1000, 700))
+    random.seed(1)
+
+    print(f"{'bullets':>8}{'primitives (ms)':>17}{'sprites (ms)':>14}{'speedup':>9}")
+    for count in args.counts:
+        bullets = giga_boss_bullets(count, *screen.get_size())
+        primitives = best_of(draw_primitives, screen, bullets, args.frames, args.repeat)
+        sprites = best_of(draw_sprites, screen, bullets, args.frames, args.repeat)
+        print(f"{count:>8}{primitives * 1000:>17.3f}{sprites * 1000:>14.3f}{primitives / sprites:>8.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark du temps d'import du jeu
+Chaque module est importé dans un interpréteur neuf ; on mesure le temps
+d'import et on vérifie si pygame a été chargé et si une fenêtre a été ouverte
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "cosmic_defender",
+    "cosmic_defender.leaderboard_merge",
+    "cosmic_defender.github",
+    "cosmic_defender.entities",
+    "cosmic_defender.game",
+    "cosmic_defender.screens.rules",
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+pygame = sys.modules.get("pygame")
+display = bool(pygame and pygame.display.get_init() and pygame.display.get_surface())
+print(elapsed * 1000, "pygame" in sys.modules, display)
+"""
+
+
+def measure(module, repeat):
+    """Median import time (ms) of `module` in fresh interpreters"""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module)], cwd=GAME_DIR, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        elapsed, loads_pygame, opens_display = output.split()
+        samples.append(float(elapsed))
+    return statistics.median(samples), loads_pygame == "True", opens_display == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    # Compile once so every run reads the .pyc, like a normal install
+    subprocess.run([sys.executable, "-m", "compileall", "-q", GAME_DIR], check=True, stdout=subprocess.DEVNULL)
+
+    print(f"{'module':<36}{'median (ms)':>12}{'pygame':>8}{'display':>9}")
+    for module in args.modules:
+        try:
+            elapsed, loads_pygame, opens_display = measure(module, args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"{module:<36}{'import failed':>12}")
+            continue
+        print(f"{module:<36}{elapsed:>12.1f}{'yes' if loads_pygame else 'no':>8}{'yes' if opens_display else 'no':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la fusion du leaderboard
+Compare l'ancien algorithme (extend + tri complet + slice) au merge top-K
+sur 10^6 scores en entrée
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cosmic_defender.leaderboard_merge import DEFAULT_LIMIT, merge_leaderboard
+
+
+def make_scores(count, players=5000, seed=42):
+    """Generate fake score entries, with ~5% re-uploads of the same score"""
+    rng = random.Random(seed)
+    scores = []
+    for i in range(count):
+        if scores and rng.random() < 0.05:
+            scores.append(dict(rng.choice(scores)))
+            continue
+        scores.append({
+            "player_id": f"player-{rng.randrange(players)}",
+            "name": f"P{i}",
+            "score": rng.randrange(200000),
+            "wave": rng.randrange(1, 60),
+            "mode": rng.choice(("normal", "infinite")),
+            "timestamp": f"2025-10-01T12:00:00.{i:06d}",
+        })
+    return scores
+
+
+def naive_merge(existing_scores, new_scores, limit):
+    """Previous upload_leaderboard behaviour (no dedupe)"""
+    merged = list(existing_scores)
+    merged.extend(new_scores)
+    merged.sort(key=lambda x: x.get('score', 0), reverse=True)
+    return merged[:limit]
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000, help="number of input scores")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Generating {args.count} scores...")
+    new_scores = make_scores(args.count)
+    existing_scores = naive_merge([], make_scores(args.limit, seed=7), args.limit)
+
+    naive_time, naive_result = timed(naive_merge, existing_scores, new_scores, args.limit, repeat=args.repeat)
+    merge_time, merge_result = timed(merge_leaderboard, existing_scores, new_scores, args.limit, repeat=args.repeat)
+    mode_time, _ = timed(merge_leaderboard, existing_scores, new_scores, args.limit,
+                         per_mode_limit=args.limit // 2, repeat=args.repeat)
+
+    naive_unique = len({(s.get('player_id'), s.get('timestamp')) for s in naive_result})
+    print(f"{'algorithm':<24}{'best (ms)':>12}{'unique kept':>14}")
+    print(f"{'sort + slice':<24}{naive_time * 1000:>12.1f}{naive_unique:>14}")
+    print(f"{'heap top-K':<24}{merge_time * 1000:>12.1f}{len(merge_result):>14}")
+    print(f"{'heap top-K per mode':<24}{mode_time * 1000:>12.1f}{'':>14}")
+    print(f"speedup: x{naive_time / merge_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la file de rendu
+Compare un blit par entité (ancien draw) à la soumission par couche avec
+Surface.blits (cosmic_defender.render_queue), pour un nombre croissant
+d'ennemis et de particules
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Headless by default (CI); set SDL_VIDEODRIVER to measure against a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from cosmic_defender import assets
+from cosmic_defender.render_queue import RenderQueue, LAYER_ENEMIES, LAYER_PARTICLES
+
+FIGHTER = "assets/Enemies/Designs - Base/PNGs/Nairan - Fighter - Base.png"
+
+
+def entities(count, width, height):
+    """(sprite, center) pairs: one fighter for every nine particles"""
+    fighter = assets.image(FIGHTER, (60, 60))
+    dot = assets.dot((255, 165, 0), 3)
+    result = []
+    for i in range(count):
+        sprite, layer = (fighter, LAYER_ENEMIES) if i % 10 == 0 else (dot, LAYER_PARTICLES)
+        result.append((layer, sprite, (random.uniform(0, width), random.uniform(0, height))))
+    return result
+
+
+def per_entity(screen, items):
+    for _, sprite, (x, y) in items:
+        screen.blit(sprite, sprite.get_rect(center=(int(x), int(y))))
+
+
+def queued(screen, items):
+    queue = RenderQueue()
+    for layer, sprite, center in items:
+        queue.blit(layer, sprite, center)
+    queue.flush(screen)
+
+
+def best_of(function, screen, items, frames, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(frames):
+            function(screen, items)
+        times.append((time.perf_counter() - start) / frames)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="*", default=[50, 200, 1000, 3000])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.chdir(GAME_DIR)
+    pygame.display.init()
+    screen = pygame.display.set_mode((1000, 700))
+    random.seed(1)
+
+    print(f"{'entities':>9}{'per entity (ms)':>17}{'blits (ms)':>12}{'speedup':>9}")
+    for count in args.counts:
+        items = entities(count, *screen.get_size())
+        single = best_of(per_entity, screen, items, args.frames, args.repeat)
+        batched = best_of(queued, screen, items, args.frames, args.repeat)
+        print(f"{count:>9}{single * 1000:>17.3f}{batched * 1000:>12.3f}{single / batched:>8.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
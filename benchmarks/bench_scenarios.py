@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Benchmark de scénarios de jeu
+Pilote CosmicDefender (graine fixe, pas de temps fixe, pilotes SDL factices)
+dans des situations figées : vague 1 au repos, vague 9 de campagne à
+25 ennemis, vague 31 en infini (pas de Giga Boss), Giga Boss en motif
+circulaire, 500 particules, vague 25 jouée par le pilote automatique.
+Mesure update / draw / present de chaque frame (FrameStats) et donne
+moyenne, p95 et p99. Les résultats vont dans un JSON qui peut être comparé
+à une baseline sauvegardée (code de sortie 1 en cas de régression).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Headless by default (CI); set SDL_VIDEODRIVER to measure against a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from cosmic_defender import CosmicDefender
+from cosmic_defender.bot import BotPilot
+from cosmic_defender.clock import FixedClock
+from cosmic_defender.constants import FPS, GameState, PowerUpType
+from cosmic_defender.entities import Enemy, Particle, PowerUp
+from cosmic_defender.frame_stats import PHASES, SECTIONS
+
+STATS = ("mean", "p95", "p99")
+DEFAULT_THRESHOLD = 0.25  # Fail when a phase gets 25% slower than the baseline...
+MIN_DELTA_MS = 0.1  # ... and at least this much slower (noise on tiny timings)
+
+
+def keep_alive(game):
+    """Per-frame hook: the player never dies, so the scenario stays the same"""
+    game.player.health = game.player.max_health
+    if game.state == GameState.GAME_OVER:
+        game.state = GameState.PLAYING_INFINITE if game.game_mode == "infinite" else GameState.PLAYING
+
+
+def place_enemies(game, count, types=("basic", "fast", "tank")):
+    for i in range(count):
+        x = random.randint(50, game.current_width - 50)
+        y = random.randint(40, game.current_height // 2)
+        game.enemies.append(Enemy(x, y, types[i % len(types)]))
+
+
+def hold_wave(game):
+    """Stop wave progression: the spawner keeps refilling the current wave"""
+    game.enemies_spawned = 0
+    game.enemies_per_wave = 10 ** 6
+
+
+def wave1_idle(game):
+    game.start_game("normal")
+
+    def hook(game):
+        keep_alive(game)
+        hold_wave(game)
+    return hook
+
+
+def campaign_wave9(game):
+    game.start_game("normal")
+    game.wave = 9
+    game.spawn_cooldown = 0.25
+    place_enemies(game, 25)
+    game.power_ups.append(PowerUp(game.current_width // 3, 100, PowerUpType.SHIELD))
+
+    def hook(game):
+        keep_alive(game)
+        hold_wave(game)
+    return hook
+
+
+def infinite_wave31(game):
+    game.start_game("infinite")
+    game.wave = 31  # Not a Giga Boss wave
+    game.spawn_cooldown = 0.15
+    place_enemies(game, 30, ("basic", "fast", "tank", "boss"))
+
+    def hook(game):
+        keep_alive(game)
+        hold_wave(game)
+    return hook
+
+
+def giga_boss_circle(game):
+    game.start_game("infinite")
+    game.wave = 10
+    game.spawn_giga_boss()
+    game.giga_boss.y = 180
+
+    def hook(game):
+        keep_alive(game)
+        if game.giga_boss:
+            game.giga_boss.current_pattern = 1  # Circle pattern, 8 bullets every 0.1 s
+            game.giga_boss.pattern_timer = (game.frame_count / FPS) % game.giga_boss.pattern_duration
+            game.giga_boss.y = 180
+            game.giga_boss.health = game.giga_boss.max_health
+    return hook
+
+
+def particles_500(game):
+    game.start_game("normal")
+    game.particles = [Particle(random.uniform(0, game.current_width), random.uniform(0, game.current_height),
+                               random.choice([(255, 165, 0), (255, 0, 0), (128, 0, 128)]),
+                               (random.uniform(-20, 20), random.uniform(-20, 20)), 10 ** 6)
+                      for _ in range(500)]
+
+    def hook(game):
+        keep_alive(game)
+        hold_wave(game)
+        game.spawn_timer = 0  # No enemies: particles only
+    return hook
+
+
+def bot_wave25(game):
+    """Late infinite wave flown by the bot: real moves, fire, dashes and pickups"""
+    game.start_game("infinite")
+    game.wave = 25
+    game.enemies_per_wave = 120
+    game.spawn_cooldown = 0.15
+    game.pilot = BotPilot()
+    return keep_alive
+
+
+SCENARIOS = {
+    "wave1_idle": wave1_idle,
+    "campaign_wave9": campaign_wave9,
+    "infinite_wave31": infinite_wave31,
+    "giga_boss_circle": giga_boss_circle,
+    "particles_500": particles_500,
+    "bot_wave25": bot_wave25,
+}
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {"mean": statistics.fmean(ordered), "p95": percentile(ordered, 0.95), "p99": percentile(ordered, 0.99)}
+
+
+def run_scenario(name, frames, warmup, seed):
+    """Drive a fresh game through scenario `name`; returns its stats in ms"""
+    random.seed(seed)
+    game = CosmicDefender(quality="high")
+    game.clock = FixedClock()
+    hook = SCENARIOS[name](game)
+
+    samples = {phase: [] for phase in PHASES}
+    samples["frame"] = []
+    section_samples = {section: [] for section in SECTIONS}
+    entities = []
+    for frame in range(warmup + frames):
+        hook(game)
+        game.run_frame()
+        if frame < warmup:
+            continue
+        current = game.frame_stats.current
+        for phase, sections in PHASES.items():
+            samples[phase].append(sum(current[section] for section in sections))
+        samples["frame"].append(sum(current.values()))
+        for section in SECTIONS:
+            section_samples[section].append(current[section])
+        entities.append(len(game.enemies) + len(game.bullets) + len(game.enemy_bullets)
+                        + len(game.particles) + len(game.power_ups))
+
+    if game.github_uploader:
+        game.github_uploader.outbox.stop(timeout=1)
+    result = {phase: summarize(values) for phase, values in samples.items()}
+    result["sections"] = {section: statistics.fmean(values) for section, values in section_samples.items()}
+    result["entities"] = statistics.fmean(entities)
+    return result
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Phases slower than the baseline: [(scenario, phase, stat, baseline ms, current ms)]"""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if not reference:
+            continue
+        for phase in ("update", "draw"):
+            for stat in ("mean", "p95"):
+                before, after = reference[phase][stat], result[phase][stat]
+                if after > before * (1 + threshold) and after - before > min_delta_ms:
+                    regressions.append((name, phase, stat, before, after))
+    return regressions
+
+
+def print_results(results):
+    print(f"{'scenario':<18}{'entities':>9}" + "".join(f"{phase + ' ' + stat:>14}" for phase in PHASES for stat in STATS))
+    for name, result in results["scenarios"].items():
+        row = f"{name:<18}{result['entities']:>9.0f}"
+        row += "".join(f"{result[phase][stat]:>14.3f}" for phase in PHASES for stat in STATS)
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help=f"scénarios à lancer parmi {', '.join(SCENARIOS)} (tous par défaut)")
+    parser.add_argument("--frames", type=int, default=300, help="frames mesurées par scénario")
+    parser.add_argument("--warmup", type=int, default=30, help="frames ignorées au début")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="résultats JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="ralentissement relatif toléré (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_DELTA_MS)
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"scénario inconnu : {', '.join(unknown)}")
+
+    # Paths given on the command line are relative to where the script was started
+    caller_dir = os.getcwd()
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    # Fresh working directory: no scores, player id or outbox from a real install
+    work_dir = tempfile.mkdtemp(prefix="cosmic_bench_")
+    os.symlink(os.path.join(GAME_DIR, "assets"), os.path.join(work_dir, "assets"))
+    os.chdir(work_dir)
+
+    results = {
+        "machine": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                    "platform": platform.platform(), "processor": platform.processor()},
+        "settings": {"frames": args.frames, "warmup": args.warmup, "seed": args.seed,
+                     "video_driver": os.environ["SDL_VIDEODRIVER"]},
+        "scenarios": {},
+    }
+    try:
+        for name in args.scenarios or SCENARIOS:
+            results["scenarios"][name] = run_scenario(name, args.frames, args.warmup, args.seed)
+    finally:
+        pygame.quit()
+        os.chdir(caller_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_results(results)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Résultats écrits dans {args.output}")
+
+    if baseline_path:
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.threshold:.0%} :")
+            for name, phase, stat, before, after in regressions:
+                print(f"   {name} {phase} {stat}: {before:.3f} ms -> {after:.3f} ms ({after / before - 1:+.0%})")
+            sys.exit(1)
+        print(f"\n✅ Aucune régression au-delà de {args.threshold:.0%} par rapport à {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
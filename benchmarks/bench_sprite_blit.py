@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark des blits de sprites
+Compare les surfaces telles que chargées par pygame.image.load aux surfaces
+converties au format de l'écran (cosmic_defender.assets)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Headless by default (CI); set SDL_VIDEODRIVER to measure against a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from cosmic_defender import assets
+
+# (label, sheet, frame count, size) - the sizes used in game
+SPRITES = [
+    ("player ship 48px", "assets/Main Ship - Bases/PNGs/Main Ship - Base - Full health.png", 1, (48, 48)),
+    ("power-up 40px", "assets/Weapons/PNGs/Pickup Icon - Weapons - Rocket.png", 15, (40, 40)),
+    ("fighter 60px", "assets/Enemies/Designs - Base/PNGs/Nairan - Fighter - Base.png", 1, (60, 60)),
+    ("frigate 90px", "assets/Enemies/Designs - Base/PNGs/Nairan - Frigate - Base.png", 1, (90, 90)),
+    ("battlecruiser 150px", "assets/Enemies/Weapons/PNGs/Nairan - Battlecruiser - Weapons.png", 9, (150, 150)),
+    ("dreadnought 240px", "assets/Enemies/Weapons/PNGs/Nairan - Dreadnought - Weapons.png", 34, (240, 240)),
+]
+
+
+def raw_sprite(path, count, size):
+    """Sprite built like the game did before the asset pipeline (no conversion)"""
+    sheet = pygame.image.load(path)
+    frame_width = sheet.get_width() // count
+    frame = sheet.subsurface(pygame.Rect(0, 0, frame_width, sheet.get_height()))
+    return pygame.transform.scale(frame, size)
+
+
+def time_blits(screen, sprite, count):
+    width, height = screen.get_size()
+    start = time.perf_counter()
+    for i in range(count):
+        screen.blit(sprite, ((i * 37) % width, (i * 53) % height))
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000, help="blits per sprite")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.chdir(GAME_DIR)
+    pygame.display.init()
+    screen = pygame.display.set_mode((1000, 700))
+
+    print(f"{'sprite':<24}{'raw (us)':>10}{'converted (us)':>16}{'speedup':>9}")
+    for label, path, count, size in SPRITES:
+        raw = raw_sprite(path, count, size)
+        converted = assets.frame(path, 0, count, size)
+        raw_time = min(time_blits(screen, raw, args.count) for _ in range(args.repeat))
+        converted_time = min(time_blits(screen, converted, args.count) for _ in range(args.repeat))
+        print(f"{label:<24}{raw_time * 1e6:>10.2f}{converted_time * 1e6:>16.2f}{raw_time / converted_time:>8.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
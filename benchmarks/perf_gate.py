@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Garde-fou de performance
+Relance plusieurs fois les scénarios de bench_scenarios (une partie neuve par
+scénario et par run, runs entrelacés) et le démarrage jusqu'au menu dans des
+interpréteurs neufs. Pour chaque mesure, on garde la médiane des runs et un
+intervalle de confiance à 95 % (bootstrap), puis on compare à la baseline de
+cette machine : les baselines sont rangées par empreinte (processeur, nombre
+de coeurs, système, Python, pygame, pilote vidéo) dans un seul JSON.
+Une régression est significative quand les intervalles ne se recouvrent pas
+et que l'écart dépasse les seuils ; update_game, draw et le temps de
+démarrage sont vérifiés (code de sortie 1), et la section de FrameStats (ou
+la phase de démarrage) qui a le plus bougé est signalée.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+from bench_scenarios import GAME_DIR, SCENARIOS, run_scenario
+
+import pygame
+
+DEFAULT_BASELINES = os.path.join(GAME_DIR, "benchmarks", "perf_baselines.json")
+RUNS = 5
+CONFIDENCE = 0.95
+RESAMPLES = 2000
+THRESHOLD = 0.10  # Significant only above 10% slower...
+MIN_DELTA_MS = 0.05  # ... and this many ms per frame
+STARTUP_MIN_DELTA_MS = 25.0  # ... or this many ms to reach the menu
+STARTUP = "startup"
+
+STARTUP_PROBE = """
+import json, sys, time
+origin = time.perf_counter()
+sys.path.insert(0, {game_dir!r})
+from cosmic_defender.startup_profiler import startup_profiler
+startup_profiler.enable(origin)
+start = time.perf_counter()
+import pygame
+startup_profiler.record("imports", "pygame", time.perf_counter() - start)
+start = time.perf_counter()
+from cosmic_defender import CosmicDefender
+startup_profiler.record("imports", "cosmic_defender", time.perf_counter() - start)
+game = CosmicDefender(quality="high")
+with startup_profiler.phase("first_frame"):
+    game.run_frame()
+print("STARTUP", json.dumps({{"time_to_menu": startup_profiler.time_to_first_frame(), "sections": startup_profiler.totals()}}))
+if game.github_uploader:
+    game.github_uploader.outbox.stop(timeout=1)
+pygame.quit()
+"""
+
+
+def cpu_model():
+    model = platform.processor()
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return model or platform.machine()
+
+
+def machine_fingerprint():
+    """(short key, description) of what the timings depend on besides the code"""
+    machine = {
+        "cpu": cpu_model(),
+        "cpus": os.cpu_count(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "video_driver": os.environ["SDL_VIDEODRIVER"],
+    }
+    key = hashlib.sha1(json.dumps(machine, sort_keys=True).encode()).hexdigest()[:12]
+    return key, machine
+
+
+def bootstrap_median(values, confidence=CONFIDENCE, resamples=RESAMPLES):
+    """{"median", "low", "high", "runs"}: the median of the runs and its confidence interval"""
+    rng = random.Random(0)  # Same interval for the same runs
+    medians = sorted(statistics.median(rng.choices(values, k=len(values))) for _ in range(resamples))
+    tail = (1 - confidence) / 2
+    return {
+        "median": statistics.median(values),
+        "low": medians[int(tail * resamples)],
+        "high": medians[min(resamples - 1, int((1 - tail) * resamples))],
+        "runs": list(values),
+    }
+
+
+def measure_startup(work_dir):
+    """Time to the first menu frame in a fresh interpreter, with its phases (ms)"""
+    output = subprocess.run([sys.executable, "-c", STARTUP_PROBE.format(game_dir=GAME_DIR)], cwd=work_dir,
+                            env=os.environ, capture_output=True, text=True, check=True).stdout
+    line = next(line for line in output.splitlines() if line.startswith("STARTUP "))
+    return json.loads(line.split(" ", 1)[1])
+
+
+def collect(names, runs, frames, warmup, seed, startup, work_dir):
+    """Run everything `runs` times; returns {group: {"gated": {metric: summary}, "sections": {...}}}"""
+    samples = {}
+
+    def add(group, kind, metric, value):
+        samples.setdefault(group, {"gated": {}, "sections": {}})[kind].setdefault(metric, []).append(value)
+
+    for run in range(runs):
+        print(f"⏱ Run {run + 1}/{runs}", flush=True)
+        if startup:
+            result = measure_startup(work_dir)
+            add(STARTUP, "gated", "time_to_menu", result["time_to_menu"])
+            for category, ms in result["sections"].items():
+                add(STARTUP, "sections", category, ms)
+        for name in names:
+            result = run_scenario(name, frames, warmup, seed)
+            add(name, "gated", "update_game", result["update"]["mean"])
+            add(name, "gated", "draw", result["draw"]["mean"])
+            for section, ms in result["sections"].items():
+                add(name, "sections", section, ms)
+
+    return {group: {kind: {metric: bootstrap_median(values) for metric, values in metrics.items()}
+                    for kind, metrics in kinds.items()}
+            for group, kinds in samples.items()}
+
+
+def verdict(before, after, threshold, min_delta_ms):
+    """"slower", "faster" or "~" (within noise or thresholds)"""
+    delta = after["median"] - before["median"]
+    relative = delta / before["median"] if before["median"] else 0.0
+    if after["low"] > before["high"] and relative > threshold and delta > min_delta_ms:
+        return "slower"
+    if after["high"] < before["low"] and relative < -threshold and -delta > min_delta_ms:
+        return "faster"
+    return "~"
+
+
+def moved_most(before, after):
+    """(section, baseline ms, current ms) whose median changed most, None without common sections"""
+    common = [section for section in after if section in before]
+    if not common:
+        return None
+    section = max(common, key=lambda s: abs(after[s]["median"] - before[s]["median"]))
+    return section, before[section]["median"], after[section]["median"]
+
+
+def compare(current, baseline, threshold, min_delta_ms, startup_min_delta_ms):
+    """Diff rows [(group, metric, before, after, verdict)] and per-group movers {group: moved_most}"""
+    rows, movers = [], {}
+    for group, kinds in current.items():
+        reference = baseline.get(group)
+        if not reference:
+            continue
+        min_delta = startup_min_delta_ms if group == STARTUP else min_delta_ms
+        for metric, after in kinds["gated"].items():
+            before = reference["gated"].get(metric)
+            if before:
+                rows.append((group, metric, before, after, verdict(before, after, threshold, min_delta)))
+        movers[group] = moved_most(reference["sections"], kinds["sections"])
+    return rows, movers
+
+
+def interval(summary):
+    return f"{summary['median']:.3f} [{summary['low']:.3f}-{summary['high']:.3f}]"
+
+
+def print_diff(rows, movers):
+    marks = {"slower": "❌ slower", "faster": "✅ faster", "~": "~"}
+    print(f"\n{'group':<18}{'metric':<14}{'baseline [95% CI]':>28}{'current [95% CI]':>28}{'delta':>9}  status")
+    for group, mover in movers.items():
+        for row_group, metric, before, after, status in rows:
+            if row_group != group:
+                continue
+            change = after["median"] / before["median"] - 1 if before["median"] else 0.0
+            print(f"{group:<18}{metric:<14}{interval(before):>28}{interval(after):>28}{change:>+9.1%}  {marks[status]}")
+        if mover:
+            section, was, now = mover
+            print(f"{'':<18}↳ moved most: {section} {was:.3f} -> {now:.3f} ms ({now - was:+.3f} ms)")
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {"machines": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def machine_baseline(path, key):
+    """This machine's baseline entry, None when only other machines (or none) were recorded"""
+    return load_baselines(path)["machines"].get(key)
+
+
+def save_baseline(path, key, machine, settings, current):
+    """Store `current` as this machine's baseline; groups not run this time are kept"""
+    baselines = load_baselines(path)
+    entry = baselines["machines"].setdefault(key, {"groups": {}})
+    entry.update(machine=machine, settings=settings, saved_at=datetime.now().isoformat(timespec="seconds"))
+    entry["groups"].update(current)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2)
+    print(f"\n💾 Baseline de la machine {key} écrite dans {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help=f"scénarios à lancer parmi {', '.join(SCENARIOS)} (tous par défaut)")
+    parser.add_argument("--runs", type=int, default=RUNS, help="répétitions de chaque mesure")
+    parser.add_argument("--frames", type=int, default=200, help="frames mesurées par scénario et par run")
+    parser.add_argument("--warmup", type=int, default=30, help="frames ignorées au début")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-startup", action="store_true", help="ne pas mesurer le démarrage")
+    parser.add_argument("--baselines", default=DEFAULT_BASELINES, help="JSON des baselines par machine")
+    parser.add_argument("--save", action="store_true", help="enregistrer ces mesures comme baseline de cette machine")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="ralentissement relatif minimal d'une régression (0.10 = 10%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_DELTA_MS, help="écart minimal par frame")
+    parser.add_argument("--startup-min-delta-ms", type=float, default=STARTUP_MIN_DELTA_MS,
+                        help="écart minimal du temps de démarrage")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"scénario inconnu : {', '.join(unknown)}")
+    if args.runs < 3:
+        parser.error("--runs doit valoir au moins 3 pour un intervalle de confiance")
+
+    key, machine = machine_fingerprint()
+    settings = {"frames": args.frames, "warmup": args.warmup, "seed": args.seed, "runs": args.runs}
+    print(f"🖥 Machine {key} : {machine['cpu']} x{machine['cpus']}, Python {machine['python']}, "
+          f"pygame {machine['pygame']}, vidéo {machine['video_driver']}")
+
+    # Relative to where the script was started, not to the working directory below
+    caller_dir = os.getcwd()
+    baselines_path = os.path.abspath(args.baselines)
+
+    # Fresh working directory: no scores, player id or outbox from a real install
+    work_dir = tempfile.mkdtemp(prefix="cosmic_gate_")
+    os.symlink(os.path.join(GAME_DIR, "assets"), os.path.join(work_dir, "assets"))
+    os.chdir(work_dir)
+    try:
+        current = collect(args.scenarios or list(SCENARIOS), args.runs, args.frames, args.warmup, args.seed,
+                          not args.no_startup, work_dir)
+    finally:
+        pygame.quit()
+        os.chdir(caller_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.save:
+        save_baseline(baselines_path, key, machine, settings, current)
+        return
+
+    entry = machine_baseline(baselines_path, key)
+    if not entry:
+        print(f"\n⚠ Aucune baseline pour la machine {key} dans {baselines_path} : relancer avec --save")
+        sys.exit(2)
+    if entry["settings"] != settings:
+        print(f"⚠ Baseline mesurée avec d'autres réglages ({entry['settings']}) : comparaison moins fiable")
+
+    rows, movers = compare(current, entry["groups"], args.threshold, args.min_delta_ms, args.startup_min_delta_ms)
+    if not rows:
+        print(f"\n⚠ Rien à comparer : aucun de ces scénarios dans la baseline du {entry['saved_at']}")
+        sys.exit(2)
+    print(f"\nComparaison à la baseline du {entry['saved_at']} (médiane de {args.runs} runs, ms)")
+    print_diff(rows, movers)
+
+    # Frame sections only: startup phases are hundreds of ms and listed in their own row
+    moved = [(group, *mover) for group, mover in movers.items() if mover and group != STARTUP]
+    if moved:
+        group, section, was, now = max(moved, key=lambda m: abs(m[3] - m[2]))
+        print(f"\n🔎 Section qui a le plus bougé : {section} dans {group} ({now - was:+.3f} ms par frame, "
+              f"{(now / was - 1) if was else 0:+.0%})")
+
+    regressions = [row for row in rows if row[4] == "slower"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) significative(s) :")
+        for group, metric, before, after, _ in regressions:
+            print(f"   {group} {metric}: {before['median']:.3f} ms -> {after['median']:.3f} ms "
+                  f"({after['median'] / before['median'] - 1:+.0%})")
+        sys.exit(1)
+    print("\n✅ Aucune régression significative")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test d'endurance mémoire
+Joue une partie infinie sans fenêtre (graine fixe, pas de temps fixe) sur
+N vagues : le joueur ne meurt pas et chaque ennemi à l'écran reçoit une balle
+du joueur, ce qui passe par le vrai chemin des kills (score, explosions,
+bonus, vibrations). Avec --bot, le pilote automatique joue seul à la place
+(déplacements, tirs, dash, bonus ramassés), plus lent mais plus réaliste. Le moniteur mémoire prend un instantané tracemalloc à
+chaque vague ; code de sortie 1 si la mémoire Python suivie grossit de plus
+du seuil entre la fin de l'échauffement et la dernière vague.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+from bench_scenarios import GAME_DIR, keep_alive
+
+import pygame
+
+from cosmic_defender import CosmicDefender
+from cosmic_defender.bot import BotPilot
+from cosmic_defender.clock import FixedClock
+from cosmic_defender.entities import Bullet
+from cosmic_defender.memory_monitor import memory_monitor
+
+MAX_GROWTH_MB = 4.0
+WARMUP_WAVES = 3  # Caches (sprites, trails, fonts) fill during the first waves
+FRAMES_PER_WAVE = 3000  # Give up if a wave takes longer than this on average
+
+
+def shoot_visible_enemies(game):
+    """One player bullet on each enemy on screen, every few frames"""
+    if game.frame_count % 6:
+        return
+    targets = [enemy for enemy in game.enemies if 0 <= enemy.y <= game.current_height]
+    if game.giga_boss:
+        targets.append(game.giga_boss)
+    for target in targets:
+        game.bullets.append(Bullet(target.x, target.y + 20, (0, -500)))
+
+
+def soak(waves, warmup_waves, seed, bot=False):
+    """Play until `warmup_waves + waves` waves are done; returns True once reached"""
+    random.seed(seed)
+    game = CosmicDefender(quality="high")
+    game.clock = FixedClock()
+    game.start_game("infinite")
+    if bot:
+        game.pilot = BotPilot()
+    memory_monitor.enable()
+
+    target = 1 + warmup_waves + waves
+    for _ in range(FRAMES_PER_WAVE * (warmup_waves + waves)):
+        keep_alive(game)
+        if not bot:
+            shoot_visible_enemies(game)
+        game.spawn_timer = max(game.spawn_timer, game.spawn_cooldown)  # Next enemy right away
+        game.run_frame()
+        if game.wave >= target:
+            break
+
+    if game.github_uploader:
+        game.github_uploader.outbox.stop(timeout=1)
+    return game.wave >= target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--waves", type=int, default=20, help="vagues mesurées après l'échauffement")
+    parser.add_argument("--warmup-waves", type=int, default=WARMUP_WAVES)
+    parser.add_argument("--max-growth-mb", type=float, default=MAX_GROWTH_MB,
+                        help="croissance tolérée de la mémoire suivie sur les vagues mesurées")
+    parser.add_argument("--max-rss-growth-mb", type=float,
+                        help="croissance tolérée du RSS (pixels des surfaces compris), non vérifiée par défaut")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bot", action="store_true", help="le pilote automatique joue au lieu des tirs assistés")
+    args = parser.parse_args()
+
+    caller_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="cosmic_soak_")
+    os.symlink(os.path.join(GAME_DIR, "assets"), os.path.join(work_dir, "assets"))
+    os.chdir(work_dir)
+    try:
+        finished = soak(args.waves, args.warmup_waves, args.seed, args.bot)
+        print(memory_monitor.report())
+        growth = memory_monitor.growth(args.waves)
+        rss_growth = memory_monitor.growth(args.waves, "rss")
+    finally:
+        memory_monitor.disable()
+        pygame.quit()
+        os.chdir(caller_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not finished:
+        print(f"\n❌ Les {args.warmup_waves + args.waves} vagues n'ont pas été atteintes")
+        sys.exit(2)
+    print(f"\nCroissance sur {args.waves} vagues : {growth / 2 ** 20:+.2f} MB suivis, "
+          f"{rss_growth / 2 ** 20:+.2f} MB RSS")
+    if growth > args.max_growth_mb * 2 ** 20:
+        print(f"❌ Au-delà du seuil de {args.max_growth_mb:.1f} MB")
+        sys.exit(1)
+    if args.max_rss_growth_mb is not None and rss_growth > args.max_rss_growth_mb * 2 ** 20:
+        print(f"❌ RSS au-delà du seuil de {args.max_rss_growth_mb:.1f} MB")
+        sys.exit(1)
+    print(f"✅ Sous le seuil de {args.max_growth_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Configuration pytest : pygame sans fenêtre ni son (pilotes SDL factices) et
+fixtures partagées (faux serveur GitHub, uploader de test, partie dans un
+dossier temporaire)
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def fake_api():
+    from fake_github_api import FakeGitHubAPI
+    with FakeGitHubAPI() as api:
+        yield api
+
+
+@pytest.fixture
+def make_uploader(tmp_path):
+    """Builds uploaders whose ETag cache and outbox live in tmp_path, under a per-name prefix"""
+    from cosmic_defender import GitHubUploader
+    from cosmic_defender.leaderboard_cache import LeaderboardCache
+    from cosmic_defender.upload_outbox import UploadOutbox
+
+    def make(api_url, name="outbox"):
+        uploader = GitHubUploader()
+        uploader.config.update({"username": "test", "repository": "leaderboard", "token": "test-token"})
+        uploader.api_url = api_url
+        uploader.cache = LeaderboardCache(str(tmp_path / f"{name}_cache.json"))
+        uploader.outbox = UploadOutbox(uploader, directory=str(tmp_path / name), base_delay=0.01, max_delay=0.05)
+        return uploader
+    return make
+
+
+@pytest.fixture
+def scratch_dir(tmp_path, monkeypatch):
+    """tmp_path with the game's assets, as working directory: player_id.txt and friends stay out of the repo"""
+    (tmp_path / "assets").symlink_to(os.path.join(GAME_DIR, "assets"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def game(scratch_dir):
+    from cosmic_defender import CosmicDefender
+    game = CosmicDefender(quality="high")
+    yield game
+    if game.github_uploader:
+        game.github_uploader.outbox.stop(timeout=1)
@@ -0,0 +1,49 @@
+"""
+Cosmic Defender
+Les sous-modules sont importés au premier accès (PEP 562) : importer le
+paquet ne charge ni pygame ni le réseau, et `from cosmic_defender import Enemy`
+ne charge que les entités.
+"""
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "CosmicDefender": "game",
+    "init_subsystems": "game",
+    "REQUIRED_SUBSYSTEMS": "game",
+    "LAZY_SUBSYSTEMS": "game",
+    "Particle": "entities",
+    "Bullet": "entities",
+    "Enemy": "entities",
+    "PowerUp": "entities",
+    "Player": "entities",
+    "GigaBoss": "entities",
+    "Button": "ui",
+    "GitHubUploader": "github",
+    "HAS_REQUESTS": "github",
+    "LEADERBOARD_LIMIT": "github",
+    "LEADERBOARD_FILE": "github",
+    "GITHUB_API_URL": "github",
+    "GITHUB_CONFIG_FILE": "github",
+    "GlobalLeaderboard": "global_leaderboard",
+    "SCREEN_WIDTH": "constants",
+    "SCREEN_HEIGHT": "constants",
+    "FPS": "constants",
+    "GameState": "constants",
+    "PowerUpType": "constants",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
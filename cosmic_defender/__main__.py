@@ -0,0 +1,8 @@
+"""
+python -m cosmic_defender
+"""
+from .game import CosmicDefender
+
+if __name__ == "__main__":
+    game = CosmicDefender()
+    game.run()
@@ -0,0 +1,240 @@
+"""
+Chargement et conversion des sprites
+Chaque image est lue une seule fois, découpée / redimensionnée puis convertie
+au format de l'écran (convert / convert_alpha) dès que la fenêtre existe.
+Sans conversion, chaque blit refait la conversion de pixels à la volée.
+
+Les sprites du jeu suivent la résolution (échelle par rapport à 1000x700) ;
+chaque variante est générée une fois et gardée dans un cache LRU borné.
+Les aperçus de l'interface ont des tailles fixes, pré-générées et jamais évincées.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from .trace import tracer, traced
+
+MAX_CACHE_BYTES = 128 * 1024 * 1024
+MIN_SCALE = 0.5
+MAX_SCALE = 3.0
+
+_sources = {}  # path -> surface as loaded from disk
+_sprites = OrderedDict()  # (path, index, count, size) -> sprite, least recently used first
+_sprite_bytes = 0
+_pinned = {}  # UI previews at fixed sizes, never evicted
+_dots = {}  # (color, radius) -> filled circle sprite
+_ellipses = {}  # (color, size) -> filled ellipse sprite
+_trails = {}  # (color, length) -> trail sprites, oldest first
+_display_format = None  # format the cached sprites were converted for
+_scale = 1.0
+
+
+def display_format():
+    """(bitsize, masks) of the display surface, None while there is no window"""
+    if not pygame.display.get_init():
+        return None
+    surface = pygame.display.get_surface()
+    if surface is None:
+        return None
+    return surface.get_bitsize(), surface.get_masks()
+
+
+def to_display_format(surface):
+    """Convert a surface for fast blits; unchanged when no window exists yet"""
+    if display_format() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def scale_for(width, height):
+    """Sprite scale for a window size, in steps of 0.25 so a drag yields few variants"""
+    scale = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+    return min(MAX_SCALE, max(MIN_SCALE, round(scale * 4) / 4))
+
+
+def set_scale(scale):
+    """Use `scale` for sprites fetched from now on; True if it changed"""
+    global _scale
+    if scale == _scale:
+        return False
+    _scale = scale
+    return True
+
+
+def get_scale():
+    return _scale
+
+
+def scaled(length):
+    """Game-space length at the current scale (hitboxes, bars)"""
+    return max(1, round(length * _scale))
+
+
+def scaled_size(size):
+    if size is None or _scale == 1.0:
+        return size
+    return (max(1, round(size[0] * _scale)), max(1, round(size[1] * _scale)))
+
+
+def load(path):
+    """Raw image from disk, read once"""
+    source = _sources.get(path)
+    if source is None:
+        with tracer.span("image load", "assets", path=path):
+            source = _sources[path] = pygame.image.load(path)
+    return source
+
+
+def frame(path, index=0, count=1, size=None):
+    """Frame `index` of a horizontal sprite sheet of `count` frames
+
+    `size` is the size at 1000x700; the sprite is scaled for the current resolution.
+    """
+    key = (path, index, count, scaled_size(size))
+    sprite = _sprites.get(key)
+    if sprite is not None:
+        _sprites.move_to_end(key)
+        return sprite
+    sprite = _build(*key)
+    _store(key, sprite)
+    return sprite
+
+
+def image(path, size=None):
+    return frame(path, 0, 1, size)
+
+
+def frames(path, count, size=None):
+    return [frame(path, i, count, size) for i in range(count)]
+
+
+def preview(path, index=0, count=1, size=30):
+    """Square UI preview at a fixed pixel size (independent of the sprite scale)"""
+    key = (path, index, count, (size, size))
+    sprite = _pinned.get(key)
+    if sprite is None:
+        sprite = _pinned[key] = _build(*key)
+    return sprite
+
+
+def pregenerate_previews(sheets, sizes):
+    """Build every (sheet frame, size) preview up front; sheets are (path, index, count)"""
+    for path, index, count in sheets:
+        for size in sizes:
+            preview(path, index, count, size)
+
+
+def dot(color, radius):
+    """Filled circle sprite (particles, trails), drawn once per colour and radius"""
+    key = (color, radius)
+    sprite = _dots.get(key)
+    if sprite is None:
+        surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        sprite = _dots[key] = to_display_format(surface)
+    return sprite
+
+
+def ellipse(color, size):
+    """Filled ellipse sprite (bullets), drawn once per colour and size"""
+    key = (color, size)
+    sprite = _ellipses.get(key)
+    if sprite is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(surface, color, surface.get_rect())
+        sprite = _ellipses[key] = to_display_format(surface)
+    return sprite
+
+
+def trail(color, length):
+    """Sprites of a bullet trail of `length` positions, oldest (darkest, smallest) first"""
+    key = (color, length)
+    sprites = _trails.get(key)
+    if sprites is None:
+        sprites = _trails[key] = []
+        for i in range(length):
+            alpha = (i + 1) / length
+            sprites.append(dot(tuple(int(c * alpha) for c in color), int(2 * alpha) + 1))
+    return sprites
+
+
+def cache_info():
+    """Cached sprite count and size in bytes (LRU part only)"""
+    return len(_sprites), _sprite_bytes
+
+
+def surface_counts():
+    """Cached surfaces per cache (memory monitor)"""
+    return {
+        "sprites": len(_sprites),
+        "previews": len(_pinned),
+        "sources": len(_sources),
+        "dots": len(_dots),
+        "ellipses": len(_ellipses),
+        "trails": sum(len(sprites) for sprites in _trails.values()),
+    }
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _store(key, sprite):
+    global _sprite_bytes
+    _sprites[key] = sprite
+    _sprite_bytes += _surface_bytes(sprite)
+    # Evicted sprites stay valid for the entities still holding them
+    while _sprite_bytes > MAX_CACHE_BYTES and len(_sprites) > 1:
+        _, evicted = _sprites.popitem(last=False)
+        _sprite_bytes -= _surface_bytes(evicted)
+
+
+@traced("sprite build", "assets")
+def _build(path, index, count, size):
+    global _display_format
+    surface = load(path)
+    if count > 1:
+        frame_width = surface.get_width() // count
+        surface = surface.subsurface(pygame.Rect(index * frame_width, 0, frame_width, surface.get_height()))
+    if size:
+        surface = pygame.transform.scale(surface, size)
+    if _display_format is None:
+        _display_format = display_format()
+    return to_display_format(surface)
+
+
+def reconvert():
+    """Drop the converted sprites if the display format changed (new window, fullscreen)
+
+    Returns True when they were dropped; entities holding sprites must then
+    fetch them again (load_sprites), which rebuilds only what is in use.
+    """
+    global _display_format, _sprite_bytes
+    current = display_format()
+    if current == _display_format:
+        return False
+    _display_format = current
+    _sprites.clear()
+    _sprite_bytes = 0
+    _pinned.clear()
+    _dots.clear()
+    _ellipses.clear()
+    _trails.clear()
+    return True
+
+
+def clear():
+    """Forget every loaded image (tests, tools)"""
+    global _display_format, _sprite_bytes, _scale
+    _sources.clear()
+    _sprites.clear()
+    _pinned.clear()
+    _dots.clear()
+    _ellipses.clear()
+    _trails.clear()
+    _sprite_bytes = 0
+    _display_format = None
+    _scale = 1.0
@@ -0,0 +1,111 @@
+"""
+Exécution des opérations réseau hors de la boucle de jeu
+Les tâches tournent sur un petit pool de threads daemon ; l'interface interroge
+leur état (pending / ok / failed) à chaque frame au lieu d'attendre.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+PENDING = "pending"
+OK = "ok"
+FAILED = "failed"
+
+
+class DaemonExecutor:
+    """Minimal executor whose workers are daemon threads
+
+    concurrent.futures.ThreadPoolExecutor joins its workers at interpreter
+    exit, so quitting the game would wait for a hung request to time out.
+    """
+
+    def __init__(self, max_workers=2, name="network"):
+        self.max_workers = max_workers
+        self.name = name
+        self._queue = queue.SimpleQueue()
+        self._threads = []
+        self._idle_workers = 0
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        with self._lock:
+            if self._idle_workers == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker, name=f"{self.name}-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            future, func, args, kwargs = self._queue.get()
+            with self._lock:
+                self._idle_workers -= 1
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Shared executor for every background network call"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = DaemonExecutor()
+        return _executor
+
+
+class BackgroundTask:
+    """A call running on the shared executor, polled by the game loop
+
+    Functions returning (success, message), like GitHubUploader.test_connection,
+    map to ok/failed; any other return value counts as ok.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.future = get_executor().submit(func, *args, **kwargs)
+
+    @property
+    def state(self):
+        if not self.future.done():
+            return PENDING
+        if self.future.exception() is not None:
+            return FAILED
+        result = self.future.result()
+        if isinstance(result, tuple) and result and not result[0]:
+            return FAILED
+        return OK
+
+    @property
+    def message(self):
+        """Result message once finished, "" while pending"""
+        if not self.future.done():
+            return ""
+        error = self.future.exception()
+        if error is not None:
+            return f"Error: {error}"
+        result = self.future.result()
+        if isinstance(result, tuple) and len(result) > 1:
+            return result[1]
+        return ""
+
+    def is_pending(self):
+        return not self.future.done()
+
+    def wait(self, timeout=None):
+        """Block until done (tools and tests only, never from the game loop)"""
+        try:
+            self.future.exception(timeout)
+        except Exception:
+            pass
+        return self.future.done()
@@ -0,0 +1,261 @@
+"""
+Pilote automatique
+Remplace le clavier et la manette dans Player.update : à chaque frame, les
+9 directions possibles sont simulées sur un court horizon contre la course
+des balles ennemies, des ennemis et du Giga Boss (collisions balayées entre
+deux pas, pour que rien ne passe au travers), pondérée par les dégâts de
+chaque menace. Quand aucune ligne droite n'est sûre, le pilote cherche un
+virage en cours de route, puis dashe en dernier recours ; il reste loin des
+bords, va chercher les bonus et tire là où l'ennemi sera quand ses balles
+arriveront. Sans hasard propre : avec la même graine du jeu, une partie se
+rejoue à l'identique (launch.py --bot, benchmarks).
+"""
+import math
+
+from .constants import GameState
+
+DIRECTIONS = [(dx, dy) for dy in (0, -1, 1) for dx in (0, -1, 1)]  # Keyboard moves, (0, 0) first
+HORIZON = 0.8  # Seconds of lookahead
+STEP = 0.1
+SPLIT = 0.3  # When every straight move is hit, plans may turn after this long
+MARGIN = 2  # Extra pixels kept between the ship and a threat
+DANGER_COST = 1000  # Pixels of detour worth one point of damage taken STEP ahead of now
+WALL_MARGIN = 250  # Side strips the ship avoids when nothing forces it there
+ROOM_COST = 2  # Cost per pixel a plan ends inside those strips or in the top half
+HOME_MARGIN = 90  # Preferred distance from the bottom edge
+TOP_SHARE = 0.5  # Plans ending above this share of the height count as cornered
+POWER_UP_MIN_Y = 0.5  # Power-ups are chased once below this share of the height
+DASH_TIME = 0.2  # Player.dash lasts 0.2 s
+BULLET_SPEED = 600  # Player.get_bullets, laser excepted
+ENEMY_DAMAGE = 10  # update_game: ramming an enemy
+GIGA_BOSS_DAMAGE = 100  # update_game: 20 on every frame the ship touches the Giga Boss
+
+
+def enemy_velocity(enemy, player):
+    """Velocity Enemy.update gives this enemy right now"""
+    if enemy.enemy_type == "boss":
+        return math.sin(enemy.y * 0.01) * 50, enemy.speed * 0.5
+    angle = math.atan2(player.y - enemy.y, player.x - enemy.x)
+    return math.cos(angle) * enemy.speed * 0.3, enemy.speed
+
+
+def threats(game):
+    """(x, y, vx, vy, half width, half height, damage) of everything that can reach the ship within HORIZON"""
+    player = game.player
+    travel = player.speed * 1.5 * HORIZON + player.dash_speed * DASH_TIME + player.size + MARGIN
+    found = []
+
+    def add(x, y, vx, vy, half_width, half_height, damage):
+        # Closest point of the threat's straight course to the ship, against the farthest the ship can go
+        course_x, course_y = vx * HORIZON, vy * HORIZON
+        length = course_x * course_x + course_y * course_y
+        along = 0.0 if length == 0 else max(0.0, min(1.0, ((player.x - x) * course_x + (player.y - y) * course_y) / length))
+        reach = travel + max(half_width, half_height)
+        if math.hypot(x + course_x * along - player.x, y + course_y * along - player.y) < reach:
+            found.append((x, y, vx, vy, half_width, half_height, damage))
+
+    for bullet in game.enemy_bullets:
+        add(bullet.x, bullet.y, bullet.vx, bullet.vy, bullet.rect.width / 2, bullet.rect.height / 2, bullet.damage)
+    for enemy in game.enemies:
+        if not enemy.is_destroyed:
+            add(enemy.x, enemy.y, *enemy_velocity(enemy, player), enemy.rect.width / 2, enemy.rect.height / 2,
+                ENEMY_DAMAGE)
+    if game.giga_boss and not game.giga_boss.is_destroyed:
+        boss = game.giga_boss
+        vx = math.cos(boss.movement_timer * 0.5) * 100  # Derivative of its sine sweep
+        add(boss.x, boss.y, vx, boss.speed * 0.3, boss.rect.width / 2, boss.rect.height / 2, GIGA_BOSS_DAMAGE)
+    return found
+
+
+def entry_time(rx, ry, dx, dy, reach_x, reach_y, start, end):
+    """First time in [start, end] when a point at (rx, ry) + (dx, dy) * (t - start) is inside the box, else None"""
+    low, high = start, end
+    for position, delta, reach in ((rx, dx, reach_x), (ry, dy, reach_y)):
+        if delta == 0:
+            if abs(position) >= reach:
+                return None
+            continue
+        enter = start + (-reach - position) / delta
+        leave = start + (reach - position) / delta
+        if enter > leave:
+            enter, leave = leave, enter
+        low, high = max(low, enter), min(high, leave)
+        if low >= high:
+            return None
+    return low
+
+
+class BotPilot:
+    """AI pilot read by Player.update (move) and update_game (shoot)"""
+
+    def __init__(self, max_wave=None, quit_at_end=False):
+        self.move = (0, 0)
+        self.shoot = False
+        self.max_wave = max_wave  # End the run once this wave is reached
+        self.quit_at_end = quit_at_end  # launch.py --bot: quit at game over, victory or max_wave
+        self.dashes = 0
+
+    def path(self, player, legs, width, height, origin=None, until=HORIZON):
+        """(t, x, y) of the ship at every STEP of a plan of (direction, speed, until) legs, clamped like Player.update"""
+        t, x, y = origin or (0.0, player.x, player.y)
+        points = [(t, x, y)]
+        legs = iter(legs)
+        direction, speed, leg_end = next(legs)
+        while t < until - 1e-9:
+            while t >= leg_end - 1e-9:
+                direction, speed, leg_end = next(legs, ((0, 0), 0, HORIZON))
+            x = max(player.size, min(width - player.size, x + direction[0] * speed * STEP))
+            y = max(player.size, min(height - player.size, y + direction[1] * speed * STEP))
+            t += STEP
+            points.append((t, x, y))
+        return points
+
+    def courses(self, player, found):
+        """Threats with their reach around the ship and the bounds of their course over HORIZON"""
+        courses = []
+        for x, y, vx, vy, half_width, half_height, damage in found:
+            end_x, end_y = x + vx * HORIZON, y + vy * HORIZON
+            courses.append((x, y, vx, vy, half_width + player.size + MARGIN, half_height + player.size + MARGIN, damage,
+                            min(x, end_x), max(x, end_x), min(y, end_y), max(y, end_y)))
+        return courses
+
+    def danger(self, points, courses, missed=None):
+        """Damage along a path, swept between steps; sooner hits weigh more. Courses never hit go to `missed`"""
+        # Bounds of every step, then of the whole path (comparisons, not min/max: this runs a lot)
+        steps = []
+        for (start, x0, y0), (end, x1, y1) in zip(points, points[1:]):
+            steps.append((start, end, x0, y0, x1, y1, x0 if x0 < x1 else x1, x1 if x0 < x1 else x0,
+                          y0 if y0 < y1 else y1, y1 if y0 < y1 else y0))
+        left = min(step[6] for step in steps)
+        right = max(step[7] for step in steps)
+        top = min(step[8] for step in steps)
+        bottom = max(step[9] for step in steps)
+        total = 0.0
+        for course in courses:
+            bx, by, vx, vy, reach_x, reach_y, damage, course_left, course_right, course_top, course_bottom = course
+            # Whole course against the whole path first: most threats never come close
+            if (course_left - right >= reach_x or left - course_right >= reach_x or
+                    course_top - bottom >= reach_y or top - course_bottom >= reach_y):
+                if missed is not None:
+                    missed.append(course)
+                continue
+            for start, end, x0, y0, x1, y1, step_left, step_right, step_top, step_bottom in steps:
+                # Same test per step before solving for the entry time
+                tx0, tx1 = bx + vx * start, bx + vx * end
+                if vx >= 0:
+                    if tx0 - step_right >= reach_x or step_left - tx1 >= reach_x:
+                        continue
+                elif tx1 - step_right >= reach_x or step_left - tx0 >= reach_x:
+                    continue
+                ty0, ty1 = by + vy * start, by + vy * end
+                if vy >= 0:
+                    if ty0 - step_bottom >= reach_y or step_top - ty1 >= reach_y:
+                        continue
+                elif ty1 - step_bottom >= reach_y or step_top - ty0 >= reach_y:
+                    continue
+                span = end - start
+                hit = entry_time(tx0 - x0, ty0 - y0, vx - (x1 - x0) / span, vy - (y1 - y0) / span,
+                                 reach_x, reach_y, start, end)
+                if hit is not None:
+                    total += (HORIZON + STEP - hit) * damage
+                    break
+            else:
+                if missed is not None:
+                    missed.append(course)
+        return total
+
+    def cornered(self, points, width, height):
+        """How far the end of a path is inside the side strips or the top half"""
+        _, x, y = points[-1]
+        # Walls and the top half leave fewer ways out: aimed fire corners a ship there
+        return max(0, WALL_MARGIN - min(x, width - x)) + max(0, height * TOP_SHARE - y)
+
+    def risk(self, player, legs, courses, width, height):
+        """(hits, cost) of a plan: the cost adds how cornered the plan leaves the ship"""
+        points = self.path(player, legs, width, height)
+        hits = self.danger(points, courses) if courses else 0.0
+        return hits, hits * DANGER_COST + self.cornered(points, width, height) * ROOM_COST
+
+    def escape(self, player, first, courses, width, height):
+        """Risk of the best plan starting with the `first` leg then turning"""
+        head = self.path(player, [first], width, height, until=first[2])
+        missed = []
+        head_hits = self.danger(head, courses, missed)
+        best = None
+        for then in DIRECTIONS:
+            tail = self.path(player, [(then, player.speed, HORIZON)], width, height, origin=head[-1])
+            hits = head_hits + (self.danger(tail, missed) if missed else 0.0)
+            risk = hits, hits * DANGER_COST + self.cornered(tail, width, height) * ROOM_COST
+            if best is None or risk[1] < best[1]:
+                best = risk
+        return best
+
+    def goal(self, game):
+        """Point to head for: a falling power-up, else where the shots meet the lowest enemy"""
+        player = game.player
+        height = game.current_height
+        home_y = height - HOME_MARGIN
+        power_ups = [p for p in game.power_ups if p.y > height * POWER_UP_MIN_Y]
+        if power_ups:
+            target = min(power_ups, key=lambda p: abs(p.x - player.x) + abs(p.y - player.y))
+            return target.x, target.y
+        if game.giga_boss:
+            boss = game.giga_boss
+            # Its sweep is a known sine: aim where it will be when the shots get there
+            flight = max(0.0, home_y - boss.y) / BULLET_SPEED
+            x = boss.center_x + math.sin((boss.movement_timer + flight) * 0.5) * 200
+            return max(boss.size, min(game.current_width - boss.size, x)), home_y
+        alive = [enemy for enemy in game.enemies if not enemy.is_destroyed and enemy.y > 0]
+        if alive:
+            target = max(alive, key=lambda enemy: enemy.y - abs(enemy.x - player.x) * 0.5)
+            vx, vy = enemy_velocity(target, player)
+            flight = max(0.0, home_y - target.y) / (BULLET_SPEED + vy)
+            return target.x + vx * flight, home_y
+        return game.current_width / 2, home_y
+
+    def think(self, game):
+        """Pick this frame's move, fire and dash (before Player.update)"""
+        player = game.player
+        width, height = game.current_width, game.current_height
+        courses = self.courses(player, threats(game))
+        goal_x, goal_y = self.goal(game)
+
+        risks = {direction: self.risk(player, [(direction, player.speed, HORIZON)], courses, width, height)
+                 for direction in DIRECTIONS}
+        if min(hits for hits, _ in risks.values()) > 0:
+            # Every straight move gets hit: look for a turn on the way out
+            risks = {direction: self.escape(player, (direction, player.speed, SPLIT), courses, width, height)
+                     for direction in DIRECTIONS}
+
+        best, best_cost = (0, 0), None
+        for direction in DIRECTIONS:
+            end_x = player.x + direction[0] * player.speed * STEP
+            end_y = player.y + direction[1] * player.speed * STEP
+            cost = risks[direction][1] + abs(goal_x - end_x) + abs(goal_y - end_y)
+            if direction != self.move:
+                cost += 1  # Keep the current move on ties: no jitter
+            if best_cost is None or cost < best_cost:
+                best, best_cost = direction, cost
+
+        hits, cost = risks[best]
+        if hits > 0 and player.can_dash():
+            # No safe move: the dash covers 160 px in 0.2 s
+            options = [(self.escape(player, (d, player.dash_speed, DASH_TIME), courses, width, height), d)
+                       for d in DIRECTIONS[1:]]
+            (dash_hits, dash_cost), dash_direction = min(options, key=lambda option: option[0][1])
+            if dash_hits < hits and dash_cost < cost and player.dash(*dash_direction):
+                self.dashes += 1
+
+        self.move = best
+        self.shoot = bool(game.enemies or game.giga_boss)
+
+    def after_frame(self, game):
+        """launch.py --bot: report and quit when the run is over"""
+        if not self.quit_at_end:
+            return
+        reached = self.max_wave is not None and game.wave >= self.max_wave
+        if reached or game.state in [GameState.GAME_OVER, GameState.VICTORY]:
+            outcome = f"vague {self.max_wave} atteinte" if reached else game.state.name.lower()
+            print(f"🤖 Bot : {outcome} - vague {game.wave}, score {game.score}, "
+                  f"{game.frame_count} frames, {self.dashes} dash(s)")
+            game.running = False
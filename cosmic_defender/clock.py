@@ -0,0 +1,25 @@
+"""
+Horloge à pas fixe
+Remplace pygame.time.Clock quand une partie doit se rejouer à l'identique
+(launch.py --seed, benchmarks, tests) : chaque frame dure exactement 1/FPS
+pour la simulation, quel que soit le temps réel écoulé.
+"""
+import pygame
+
+from .constants import FPS
+
+
+class FixedClock:
+    """Stands in for pygame.time.Clock: every frame lasts 1/FPS of game time"""
+
+    def __init__(self, pace=False):
+        # pace: still wait like a real clock (windowed play), without sleeping when headless
+        self.real_clock = pygame.time.Clock() if pace else None
+
+    def tick(self, framerate=0):
+        if self.real_clock:
+            self.real_clock.tick(framerate)
+        return 1000 / FPS
+
+    def get_fps(self):
+        return self.real_clock.get_fps() if self.real_clock else float(FPS)
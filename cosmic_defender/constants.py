@@ -0,0 +1,37 @@
+"""
+Constantes partagées de Cosmic Defender (sans pygame)
+"""
+from enum import Enum
+
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 700
+FPS = 60
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+ORANGE = (255, 165, 0)
+PURPLE = (128, 0, 128)
+
+class GameState(Enum):
+    MENU = 1
+    PLAYING = 2
+    PLAYING_INFINITE = 3
+    GAME_OVER = 4
+    VICTORY = 5
+    LEADERBOARD = 6
+    ENTER_NAME = 7
+    GITHUB_CONFIG = 8
+    PAUSED = 9
+    RULES = 10
+    SETTINGS = 11
+
+class PowerUpType(Enum):
+    RAPID_FIRE = 1
+    SHIELD = 2
+    MULTI_SHOT = 3
+    LASER = 4
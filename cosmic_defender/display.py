@@ -0,0 +1,88 @@
+"""
+Rendu à résolution logique fixe
+Le jeu est dessiné dans une surface de taille fixe (1000x700, 1280x720...)
+puis présenté à la fenêtre en une seule mise à l'échelle : par le GPU via
+pygame.SCALED quand SDL dispose d'un renderer, sinon par un seul
+pygame.transform.scale vers la fenêtre (bandes noires si le ratio diffère).
+Le coût de remplissage du jeu ne dépend plus de la résolution de l'écran.
+"""
+import pygame
+
+BORDER_COLOR = (0, 0, 0)
+
+
+def parse_size(text):
+    """'1280x720' -> (1280, 720)"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+class LogicalDisplay:
+    """Fixed-size drawing surface presented scaled to the window"""
+
+    def __init__(self, size):
+        self.size = tuple(size)
+        self.hardware_scaled = False
+        self.buffer = None  # Software fallback: the game draws here, present() scales it
+        self.viewport = pygame.Rect((0, 0), self.size)  # Buffer area inside the window
+        self.window_size = None  # Window size the viewport was computed for
+        self.borders = []  # Window areas outside the viewport, filled black
+
+    def set_mode(self, fullscreen=False):
+        """Open the window; returns the surface the game draws on (always self.size)"""
+        mode = pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE
+        try:
+            window = pygame.display.set_mode(self.size, mode | pygame.SCALED)
+            self.hardware_scaled = True
+            self.buffer = None
+            self.viewport = pygame.Rect((0, 0), self.size)
+            return window
+        except pygame.error:
+            # No renderer for SCALED (some drivers, fullscreen on dummy video)
+            pass
+        if fullscreen:
+            window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            window = pygame.display.set_mode(self.size, pygame.RESIZABLE)
+        self.hardware_scaled = False
+        self.buffer = pygame.Surface(self.size).convert(window)
+        self.update_viewport()
+        return self.buffer
+
+    def update_viewport(self):
+        """Largest area of the window with the logical aspect ratio, centered"""
+        window = pygame.display.get_surface()
+        if window is None or self.buffer is None:
+            return
+        window_width, window_height = self.window_size = window.get_size()
+        scale = min(window_width / self.size[0], window_height / self.size[1])
+        viewport = pygame.Rect(0, 0, round(self.size[0] * scale), round(self.size[1] * scale))
+        viewport.center = (window_width // 2, window_height // 2)
+        self.viewport = viewport.clip(window.get_rect())
+        self.borders = [rect for rect in (
+            pygame.Rect(0, 0, self.viewport.x, window_height),
+            pygame.Rect(self.viewport.right, 0, window_width - self.viewport.right, window_height),
+            pygame.Rect(0, 0, window_width, self.viewport.y),
+            pygame.Rect(0, self.viewport.bottom, window_width, window_height - self.viewport.bottom),
+        ) if rect.width > 0 and rect.height > 0]
+
+    def to_logical(self, pos):
+        """Window position -> position on the drawing surface (SDL maps it already with SCALED)"""
+        if self.buffer is None or self.viewport.size == self.size:
+            return (pos[0] - self.viewport.x, pos[1] - self.viewport.y)
+        return (int((pos[0] - self.viewport.x) * self.size[0] / self.viewport.width),
+                int((pos[1] - self.viewport.y) * self.size[1] / self.viewport.height))
+
+    def present(self):
+        """Show the frame: one scaled copy of the buffer, then flip"""
+        if self.buffer is not None:
+            window = pygame.display.get_surface()
+            if window.get_size() != self.window_size:
+                self.update_viewport()  # Window was resized
+            for border in self.borders:
+                window.fill(BORDER_COLOR, border)
+            if self.viewport.size == self.size:
+                window.blit(self.buffer, self.viewport)
+            else:
+                pygame.transform.scale(self.buffer, self.viewport.size, window.subsurface(self.viewport))
+        pygame.display.flip()
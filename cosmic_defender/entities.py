@@ -0,0 +1,700 @@
+"""
+Entités du jeu : joueur, ennemis, boss, tirs, bonus et particules
+Importable sans fenêtre ouverte (simulation, tests headless)
+"""
+import pygame
+import random
+import math
+
+from . import assets
+from .quality import quality_governor
+from .render_queue import LAYER_PLAYER, LAYER_BULLETS, LAYER_ENEMIES, LAYER_POWER_UPS, LAYER_PARTICLES, LAYER_OVERLAY
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, GREEN, YELLOW, CYAN, ORANGE, PURPLE, PowerUpType
+
+# Fading colours are rounded to this many steps so their dot sprites can be cached
+FADE_STEPS = 16
+
+
+def faded(color, alpha):
+    """`color` darkened by `alpha` (0..1), rounded to FADE_STEPS levels"""
+    level = round(alpha * FADE_STEPS)
+    return tuple(c * level // FADE_STEPS for c in color)
+
+class Particle:
+    def __init__(self, x, y, color, velocity, lifetime):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.vx, self.vy = velocity
+        self.lifetime = lifetime
+        self.age = 0
+
+    def update(self, dt):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.age += dt
+        return self.age < self.lifetime
+
+    def half_extent(self):
+        """Half width and height of what draw() covers (viewport culling)"""
+        return 3, 3
+
+    def draw(self, queue):
+        alpha = max(0, 1 - self.age / self.lifetime)
+        queue.blit(LAYER_PARTICLES, assets.dot(faded(self.color, alpha), 3), (self.x, self.y))
+
+class Bullet:
+    def __init__(self, x, y, velocity, damage=1, color=YELLOW, is_player_bullet=True):
+        self.x = x
+        self.y = y
+        self.vx, self.vy = velocity
+        self.damage = damage
+        self.color = color
+        self.rect = pygame.Rect(x-2, y-2, 4, 8)
+        self.is_player_bullet = is_player_bullet
+        self.trail = []  # Trail positions (only for enemy bullets)
+        self.trail_max_length = 8
+
+    def update(self, dt, screen_width, screen_height):
+        # Add current position to trail (only for enemy bullets)
+        if not self.is_player_bullet:
+            self.trail.append((self.x, self.y))
+            max_length = min(self.trail_max_length, quality_governor.tier.bullet_trail)
+            if len(self.trail) > max_length:
+                del self.trail[:len(self.trail) - max_length]
+
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rect.center = (int(self.x), int(self.y))
+        return 0 <= self.x <= screen_width and 0 <= self.y <= screen_height
+
+    def half_extent(self):
+        """Half width and height of what draw() covers, trail included"""
+        if not self.trail:
+            return 4, 4
+        trail_x, trail_y = self.trail[0]
+        return abs(self.x - trail_x) + 4, abs(self.y - trail_y) + 4
+
+    def draw(self, queue):
+        # Draw trail only for enemy bullets (sprites pre-rendered per colour and trail slot)
+        if not self.is_player_bullet and self.trail:
+            queue.blit_all(LAYER_BULLETS, assets.trail(self.color, len(self.trail)), self.trail)
+
+        # Draw main bullet
+        queue.blit_at(LAYER_BULLETS, assets.ellipse(self.color, self.rect.size), self.rect.topleft)
+
+class Enemy:
+    def __init__(self, x, y, enemy_type="basic"):
+        self.x = x
+        self.y = y
+        self.enemy_type = enemy_type
+        self.health = 1
+        self.speed = 100
+        self.base_size = 20  # Hitbox side at 1000x700
+        self.color = RED
+        self.shoot_timer = 0
+        self.shoot_cooldown = 2.0
+        self.points = 10
+
+        # Load enemy images based on type
+        if enemy_type == "tank":
+            self.health = 3
+            self.speed = 50
+            self.base_size = 30
+            self.color = (150, 0, 0)
+            self.points = 25
+            self.max_health = 3
+            self.is_destroyed = False
+        elif enemy_type == "fast":
+            self.speed = 200
+            self.base_size = 15
+            self.color = (255, 100, 100)
+            self.shoot_cooldown = 1.5
+            self.points = 15
+            self.max_health = 1
+            self.is_destroyed = False
+        elif enemy_type == "boss":
+            self.health = 20
+            self.speed = 30
+            self.base_size = 50
+            self.color = (100, 0, 100)
+            self.shoot_cooldown = 0.5
+            self.points = 100
+            self.max_health = 20
+
+            # Battlecruiser animation (9 frames)
+            self.frame_index = 0
+            self.animation_timer = 0
+            self.animation_speed = 0.08
+
+            # Destruction animation (18 frames)
+            self.is_destroyed = False
+            self.destruction_frame_index = 0
+            self.destruction_animation_timer = 0
+            self.destruction_animation_speed = 0.05
+        else:  # basic/scout
+            self.max_health = 1
+            self.is_destroyed = False
+
+        self.load_sprites()
+
+    def load_sprites(self):
+        """Fetch this enemy's sprites from the asset cache (again after a display change)"""
+        # The hitbox follows the sprite scale so collisions match what is drawn
+        self.size = assets.scaled(self.base_size)
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.rect.center = (int(self.x), int(self.y))
+
+        if self.enemy_type == "boss":
+            self.frames = assets.frames("assets/Enemies/Weapons/PNGs/Nairan - Battlecruiser - Weapons.png", 9, (150, 150))
+            self.destruction_frames = assets.frames("assets/Enemies/Destruction/PNGs/Nairan - Battlecruiser  -  Destruction.png", 18, (150, 150))
+            return
+
+        if self.enemy_type == "tank":
+            self.image = assets.image("assets/Enemies/Designs - Base/PNGs/Nairan - Frigate - Base.png", (90, 90))  # +50%
+        elif self.enemy_type == "fast":
+            self.image = assets.image("assets/Enemies/Designs - Base/PNGs/Nairan - Scout - Base.png", (60, 60))  # +50%
+        else:  # basic/scout
+            self.image = assets.image("assets/Enemies/Designs - Base/PNGs/Nairan - Fighter - Base.png", (60, 60))  # +50%
+        self.frames = None
+        self.destruction_frames = None
+
+    def update(self, dt, player_x, player_y, screen_height):
+        # If in destruction animation, just update animation
+        if self.is_destroyed:
+            self.destruction_animation_timer += dt
+            if self.destruction_animation_timer >= self.destruction_animation_speed:
+                self.destruction_animation_timer = 0
+                self.destruction_frame_index += 1
+                if self.destruction_frame_index >= 18:
+                    return False  # Animation finished, remove enemy
+            return True  # Keep enemy to show destruction animation
+
+        if self.enemy_type == "boss":
+            self.y += self.speed * dt * 0.5
+            self.x += math.sin(self.y * 0.01) * 50 * dt
+
+            # Update animation for boss
+            self.animation_timer += dt
+            if self.animation_timer >= self.animation_speed:
+                self.animation_timer = 0
+                self.frame_index = (self.frame_index + 1) % 9
+        else:
+            angle = math.atan2(player_y - self.y, player_x - self.x)
+            self.x += math.cos(angle) * self.speed * dt * 0.3
+            self.y += self.speed * dt
+
+        self.rect.center = (int(self.x), int(self.y))
+        self.shoot_timer += dt
+
+        return self.y < screen_height + 50
+
+    def can_shoot(self):
+        if self.shoot_timer >= self.shoot_cooldown:
+            self.shoot_timer = 0
+            return True
+        return False
+
+    def take_damage(self, damage):
+        self.health -= damage
+        if self.health <= 0:
+            # Start destruction animation if available
+            if self.destruction_frames:
+                self.is_destroyed = True
+                return False  # Don't remove yet, play animation first
+            return True  # Remove immediately if no destruction animation
+        return False
+
+    def half_extent(self):
+        """Half width and height of the sprite (the boss health bar sits inside its top)"""
+        width, height = (self.frames[0] if self.frames else self.image).get_size()
+        return width // 2, height // 2
+
+    def draw(self, queue):
+        # Draw destruction animation if destroyed
+        if self.is_destroyed and self.destruction_frames:
+            if self.destruction_frame_index < len(self.destruction_frames):
+                queue.blit(LAYER_ENEMIES, self.destruction_frames[self.destruction_frame_index], (self.x, self.y))
+            return
+
+        # Draw enemy image or animation
+        if self.frames:
+            # Draw animation for boss
+            queue.blit(LAYER_ENEMIES, self.frames[self.frame_index], (self.x, self.y))
+        else:
+            # Draw static image for other enemies
+            queue.blit(LAYER_ENEMIES, self.image, (self.x, self.y))
+
+        # Draw health bar for boss (not during destruction)
+        if self.enemy_type == "boss" and not self.is_destroyed:
+            bar_width = assets.scaled(80)
+            bar_height = 6
+            bar_x = self.x - bar_width // 2
+            bar_y = self.y - self.half_extent()[1]
+
+            health_ratio = self.health / self.max_health
+            queue.draw(LAYER_OVERLAY, pygame.draw.rect, RED, (bar_x, bar_y, bar_width, bar_height))
+            queue.draw(LAYER_OVERLAY, pygame.draw.rect, GREEN, (bar_x, bar_y, bar_width * health_ratio, bar_height))
+            queue.draw(LAYER_OVERLAY, pygame.draw.rect, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+
+class PowerUp:
+    # 15-frame pickup animation per power-up type
+    SPRITE_SHEETS = {
+        PowerUpType.SHIELD: "assets/Shield Generators/PNGs/Pickup Icon - Shield Generator - All around shield.png",
+        PowerUpType.RAPID_FIRE: "assets/Weapons/PNGs/Pickup Icon - Weapons - Auto Cannons.png",
+        PowerUpType.LASER: "assets/Weapons/PNGs/Pickup Icon - Weapons - Big Space Gun 2000.png",
+        PowerUpType.MULTI_SHOT: "assets/Weapons/PNGs/Pickup Icon - Weapons - Rocket.png",
+    }
+
+    def __init__(self, x, y, power_type):
+        self.x = x
+        self.y = y
+        self.type = power_type
+        self.float_offset = 0
+
+        colors = {
+            PowerUpType.RAPID_FIRE: ORANGE,
+            PowerUpType.SHIELD: CYAN,
+            PowerUpType.MULTI_SHOT: GREEN,
+            PowerUpType.LASER: PURPLE
+        }
+        self.color = colors.get(power_type, WHITE)
+
+        self.load_sprites()
+
+        self.frame_index = 0
+        self.animation_timer = 0
+        self.animation_speed = 0.05  # Time per frame
+
+    def load_sprites(self):
+        """Fetch the pickup animation from the asset cache (again after a display change)"""
+        sheet = PowerUp.SPRITE_SHEETS.get(self.type)
+        self.frames = assets.frames(sheet, 15, (40, 40)) if sheet else None
+        self.size = assets.scaled(15)
+        self.rect = pygame.Rect(0, 0, self.size*2, self.size*2)
+        self.rect.center = (int(self.x), int(self.y))
+
+    def update(self, dt, screen_height):
+        self.float_offset += dt * 3
+        self.y += 50 * dt
+        self.rect.center = (int(self.x), int(self.y + math.sin(self.float_offset) * 3))
+
+        # Update animation for all power-ups
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.frame_index = (self.frame_index + 1) % 15
+
+        return self.y < screen_height + 20
+
+    def half_extent(self):
+        """Half width and height of the sprite, floating included"""
+        if self.frames:
+            width, height = self.frames[0].get_size()
+            return width // 2, height // 2 + 3
+        return self.size, self.size + 3
+
+    def draw(self, queue):
+        y_pos = int(self.y + math.sin(self.float_offset) * 3)
+
+        if self.frames:
+            # Draw animated power-up
+            queue.blit(LAYER_POWER_UPS, self.frames[self.frame_index], (self.x, y_pos))
+        else:
+            # Fallback to circles if no animation
+            queue.draw(LAYER_POWER_UPS, pygame.draw.circle, self.color, (int(self.x), y_pos), self.size)
+            queue.draw(LAYER_POWER_UPS, pygame.draw.circle, WHITE, (int(self.x), y_pos), self.size, 2)
+
+class Player:
+    def __init__(self, x, y, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        self.x = x
+        self.y = y
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.speed = 300
+
+        # Ship image, shield animation and collision size (at the display scale)
+        self.load_sprites()
+
+        self.shield_frame_index = 0
+        self.shield_animation_timer = 0
+        self.shield_animation_speed = 0.05  # Time per frame
+
+        self.health = 100
+
+        # Trail system
+        self.trail = []
+        self.trail_max_length = 15
+        self.trail_timer = 0
+        self.trail_spawn_rate = 0.02  # Spawn trail every 0.02s
+        self.max_health = 100
+        self.shield = 0
+        self.max_shield = 50
+
+        self.shoot_cooldown = 0.2
+        self.shoot_timer = 0
+        self.rapid_fire_timer = 0
+        self.multi_shot_timer = 0
+        self.laser_timer = 0
+
+        self.power_up_duration = 5.0
+
+        # Dash system
+        self.dash_speed = 800
+        self.dash_distance = 150
+        self.dash_cooldown = 2.0
+        self.dash_timer = 0
+        self.is_dashing = False
+        self.dash_direction = (0, 0)
+
+    def load_sprites(self):
+        """Fetch the ship and shield sprites from the asset cache (again after a display change)"""
+        self.image = assets.image("assets/Main Ship - Bases/PNGs/Main Ship - Base - Full health.png", (48, 48))
+        self.shield_frames = assets.frames("assets/Main Ship - Shields/PNGs/Main Ship - Shields - Round Shield.png", 12, (72, 72))
+        # Same scale as the enemy hitboxes: 24 at 1000x700, half the ship image
+        self.size = assets.scaled(24)
+        self.rect = pygame.Rect(0, 0, self.size*2, self.size*2)
+        self.rect.center = (int(self.x), int(self.y))
+
+    def update_screen_bounds(self, width, height):
+        self.screen_width = width
+        self.screen_height = height
+
+    def update(self, dt, joystick=None, pilot=None):
+        # Update dash cooldown timer
+        if self.dash_timer > 0:
+            self.dash_timer -= dt
+
+        # Check if player is moving
+        is_moving = False
+        move_x = 0
+        move_y = 0
+
+        # Handle dash movement
+        if self.is_dashing:
+            # Calculate dash movement with bounds checking
+            dash_move_x = self.dash_direction[0] * self.dash_speed * dt
+            dash_move_y = self.dash_direction[1] * self.dash_speed * dt
+
+            new_x = self.x + dash_move_x
+            new_y = self.y + dash_move_y
+
+            # Clamp to screen bounds
+            new_x = max(self.size, min(self.screen_width - self.size, new_x))
+            new_y = max(self.size, min(self.screen_height - self.size, new_y))
+
+            self.x = new_x
+            self.y = new_y
+
+            # Check if dash is complete
+            if self.dash_timer <= self.dash_cooldown - 0.2:  # Dash lasts 0.2s
+                self.is_dashing = False
+            is_moving = True
+        else:
+            # Normal movement
+            if pilot:
+                # Bot pilot (launch.py --bot) instead of keyboard and controller
+                move_x, move_y = pilot.move
+                is_moving = move_x != 0 or move_y != 0
+            else:
+                # Keyboard input
+                keys = pygame.key.get_pressed()
+                if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+                    move_x -= 1
+                    is_moving = True
+                if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+                    move_x += 1
+                    is_moving = True
+                if keys[pygame.K_UP] or keys[pygame.K_w]:
+                    move_y -= 1
+                    is_moving = True
+                if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+                    move_y += 1
+                    is_moving = True
+
+                # Controller input (analog stick)
+                if joystick:
+                    axis_x = joystick.get_axis(0)  # Left stick horizontal
+                    axis_y = joystick.get_axis(1)  # Left stick vertical
+
+                    # Apply deadzone
+                    deadzone = 0.15
+                    if abs(axis_x) > deadzone:
+                        move_x += axis_x
+                        is_moving = True
+                    if abs(axis_y) > deadzone:
+                        move_y += axis_y
+                        is_moving = True
+
+            # Apply movement
+            self.x += move_x * self.speed * dt
+            self.y += move_y * self.speed * dt
+
+            self.x = max(self.size, min(self.screen_width - self.size, self.x))
+            self.y = max(self.size, min(self.screen_height - self.size, self.y))
+
+        self.rect.center = (int(self.x), int(self.y))
+        self.shoot_timer += dt
+
+        # Update shield animation (frozen on low quality)
+        if self.shield > 0 and quality_governor.tier.shield_animation:
+            self.shield_animation_timer += dt
+            if self.shield_animation_timer >= self.shield_animation_speed:
+                self.shield_animation_timer = 0
+                self.shield_frame_index = (self.shield_frame_index + 1) % 12
+
+        # Update trail
+        self.trail_timer += dt
+        if is_moving and self.trail_timer >= self.trail_spawn_rate * quality_governor.tier.player_trail_interval:
+            self.trail.append({
+                'x': self.x,
+                'y': self.y,
+                'age': 0,
+                'lifetime': 0.3
+            })
+            self.trail_timer = 0
+
+        # Update and remove old trail particles
+        for particle in self.trail[:]:
+            particle['age'] += dt
+            if particle['age'] >= particle['lifetime']:
+                self.trail.remove(particle)
+
+        if self.rapid_fire_timer > 0:
+            self.rapid_fire_timer -= dt
+        if self.multi_shot_timer > 0:
+            self.multi_shot_timer -= dt
+        if self.laser_timer > 0:
+            self.laser_timer -= dt
+
+    def can_shoot(self):
+        cooldown = 0.1 if self.rapid_fire_timer > 0 else self.shoot_cooldown
+        if self.shoot_timer >= cooldown:
+            self.shoot_timer = 0
+            return True
+        return False
+
+    def get_bullets(self):
+        bullets = []
+        if self.laser_timer > 0:
+            bullets.append(Bullet(self.x, self.y - self.size, (0, -800), damage=3, color=PURPLE))
+        elif self.multi_shot_timer > 0:
+            bullets.extend([
+                Bullet(self.x, self.y - self.size, (0, -600)),
+                Bullet(self.x - 15, self.y - self.size, (-100, -600)),
+                Bullet(self.x + 15, self.y - self.size, (100, -600))
+            ])
+        else:
+            bullets.append(Bullet(self.x, self.y - self.size, (0, -600)))
+        return bullets
+
+    def can_dash(self):
+        return self.dash_timer <= 0 and not self.is_dashing
+
+    def dash(self, direction_x, direction_y):
+        if self.can_dash():
+            # Normalize direction
+            length = math.sqrt(direction_x**2 + direction_y**2)
+            if length > 0:
+                self.dash_direction = (direction_x / length, direction_y / length)
+                self.is_dashing = True
+                self.dash_timer = self.dash_cooldown
+                return True
+        return False
+
+    def activate_power_up(self, power_type):
+        if power_type == PowerUpType.RAPID_FIRE:
+            self.rapid_fire_timer = self.power_up_duration
+        elif power_type == PowerUpType.SHIELD:
+            self.shield = min(self.max_shield, self.shield + 25)
+        elif power_type == PowerUpType.MULTI_SHOT:
+            self.multi_shot_timer = self.power_up_duration
+        elif power_type == PowerUpType.LASER:
+            self.laser_timer = self.power_up_duration
+
+    def take_damage(self, damage):
+        if self.shield > 0:
+            shield_damage = min(self.shield, damage)
+            self.shield -= shield_damage
+            damage -= shield_damage
+
+        self.health -= damage
+        return self.health <= 0
+
+    def draw(self, queue):
+        # Draw trail first (behind player)
+        for particle in self.trail:
+            alpha = 1 - (particle['age'] / particle['lifetime'])
+            trail_size = int(self.size * alpha * 0.5)
+            if trail_size > 0:
+                queue.blit(LAYER_PLAYER, assets.dot(faded(GREEN, alpha * 0.6), trail_size), (particle['x'], particle['y']))
+
+        # Draw shield animation if active
+        if self.shield > 0:
+            queue.blit(LAYER_PLAYER, self.shield_frames[self.shield_frame_index], (self.x, self.y))
+
+        color = GREEN
+        if self.rapid_fire_timer > 0:
+            color = ORANGE
+        elif self.multi_shot_timer > 0:
+            color = GREEN
+        elif self.laser_timer > 0:
+            color = PURPLE
+
+        # Draw ship image
+        queue.blit(LAYER_PLAYER, self.image, (self.x, self.y))
+
+        # Draw dash cooldown bar
+        if self.dash_timer > 0:
+            bar_width = 40
+            bar_height = 4
+            bar_x = self.x - bar_width // 2
+            bar_y = self.y - self.size - 15
+
+            # Background bar (gray)
+            queue.draw(LAYER_OVERLAY, pygame.draw.rect, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+
+            # Cooldown progress (white)
+            progress = max(0, 1 - (self.dash_timer / self.dash_cooldown))
+            progress_width = int(bar_width * progress)
+            queue.draw(LAYER_OVERLAY, pygame.draw.rect, WHITE, (bar_x, bar_y, progress_width, bar_height))
+
+class GigaBoss:
+    def __init__(self, x, y, wave):
+        self.x = x
+        self.y = y
+        self.wave = wave
+        self.health = 50 + (wave // 10) * 25  # Health increases with waves
+        self.max_health = self.health
+        self.speed = 20
+        self.color = (150, 0, 150)
+        self.shoot_timer = 0
+        self.pattern_timer = 0
+        self.current_pattern = 0
+        self.pattern_duration = 3.0
+        self.points = 500 + (wave // 10) * 100
+
+        # Dreadnought animation (34 frames), destruction animation (18 frames) and hitbox
+        self.load_sprites()
+        self.frame_index = 0
+        self.animation_timer = 0
+        self.animation_speed = 0.05
+
+        self.is_destroyed = False
+        self.destruction_frame_index = 0
+        self.destruction_animation_timer = 0
+        self.destruction_animation_speed = 0.05
+
+        # Movement pattern
+        self.center_x = x
+        self.movement_timer = 0
+        self.direction = 1
+
+    def load_sprites(self):
+        """Fetch the dreadnought sprites from the asset cache (again after a display change)"""
+        self.frames = assets.frames("assets/Enemies/Weapons/PNGs/Nairan - Dreadnought - Weapons.png", 34, (240, 240))  # +50% from 160
+        self.destruction_frames = assets.frames("assets/Enemies/Destruction/PNGs/Nairan - Dreadnought -  Destruction.png", 18, (240, 240))
+        self.size = assets.scaled(80)
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.rect.center = (int(self.x), int(self.y))
+
+    def update(self, dt, player_x, player_y, screen_width, screen_height):
+        # If in destruction animation, just update animation
+        if self.is_destroyed:
+            self.destruction_animation_timer += dt
+            if self.destruction_animation_timer >= self.destruction_animation_speed:
+                self.destruction_animation_timer = 0
+                self.destruction_frame_index += 1
+                if self.destruction_frame_index >= 18:
+                    return False  # Animation finished, remove boss
+            return True  # Keep boss to show destruction animation
+
+        # Movement pattern - side to side
+        self.movement_timer += dt
+        self.x = self.center_x + math.sin(self.movement_timer * 0.5) * 200
+        self.x = max(self.size, min(screen_width - self.size, self.x))
+
+        # Slowly move down
+        self.y += self.speed * dt * 0.3
+
+        self.rect.center = (int(self.x), int(self.y))
+
+        # Update animation
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.frame_index = (self.frame_index + 1) % 34
+
+        # Pattern timing
+        self.pattern_timer += dt
+        if self.pattern_timer >= self.pattern_duration:
+            self.pattern_timer = 0
+            self.current_pattern = (self.current_pattern + 1) % 4
+
+        self.shoot_timer += dt
+        return self.y < screen_height + 100
+
+    def get_bullets(self, player_x, player_y):
+        bullets = []
+        if self.shoot_timer < 0.1:  # High fire rate
+            return bullets
+
+        self.shoot_timer = 0
+
+        if self.current_pattern == 0:  # Spray pattern
+            for i in range(-2, 3):
+                angle = math.atan2(player_y - self.y, player_x - self.x) + i * 0.3
+                velocity = (math.cos(angle) * 300, math.sin(angle) * 300)
+                bullets.append(Bullet(self.x, self.y + 30, velocity, color=PURPLE, is_player_bullet=False))
+
+        elif self.current_pattern == 1:  # Circle pattern
+            for i in range(8):
+                angle = (i / 8) * 2 * math.pi + self.pattern_timer
+                velocity = (math.cos(angle) * 200, math.sin(angle) * 200)
+                bullets.append(Bullet(self.x, self.y + 30, velocity, color=RED, is_player_bullet=False))
+
+        elif self.current_pattern == 2:  # Aimed burst
+            for _ in range(3):
+                angle = math.atan2(player_y - self.y, player_x - self.x) + random.uniform(-0.2, 0.2)
+                velocity = (math.cos(angle) * 400, math.sin(angle) * 400)
+                bullets.append(Bullet(self.x, self.y + 30, velocity, color=ORANGE, is_player_bullet=False))
+
+        else:  # Laser-like vertical shots
+            for i in range(-1, 2):
+                velocity = (i * 100, 350)
+                bullets.append(Bullet(self.x + i * 50, self.y + 30, velocity, color=YELLOW, is_player_bullet=False))
+
+        return bullets
+
+    def take_damage(self, damage):
+        self.health -= damage
+        if self.health <= 0:
+            self.is_destroyed = True
+            return False  # Don't remove yet, play animation first
+        return False
+
+    def half_extent(self):
+        """Half width and height of the sprite (the health bar sits inside its top)"""
+        width, height = self.frames[0].get_size()
+        return width // 2, height // 2
+
+    def draw(self, queue):
+        # Draw destruction animation if destroyed
+        if self.is_destroyed:
+            if self.destruction_frame_index < len(self.destruction_frames):
+                queue.blit(LAYER_ENEMIES, self.destruction_frames[self.destruction_frame_index], (self.x, self.y))
+            return
+
+        # Draw dreadnought animation
+        queue.blit(LAYER_ENEMIES, self.frames[self.frame_index], (self.x, self.y))
+
+        # Health bar (not during destruction)
+        bar_width = self.size * 2
+        bar_height = 8
+        bar_x = self.x - bar_width // 2
+        bar_y = self.y - self.half_extent()[1]
+
+        health_ratio = self.health / self.max_health
+        queue.draw(LAYER_OVERLAY, pygame.draw.rect, RED, (bar_x, bar_y, bar_width, bar_height))
+        queue.draw(LAYER_OVERLAY, pygame.draw.rect, GREEN, (bar_x, bar_y, bar_width * health_ratio, bar_height))
+        queue.draw(LAYER_OVERLAY, pygame.draw.rect, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
@@ -0,0 +1,61 @@
+"""
+Temps de frame par sous-système
+La boucle appelle lap(section) à la fin de chaque étape : le temps écoulé
+depuis l'étape précédente est attribué à cette section. Un appel à
+perf_counter par étape, assez léger pour rester actif en permanence
+(overlay F3, régulateur de qualité). Avec --trace, chaque étape devient
+aussi un span de la trace.
+"""
+import time
+from collections import deque
+
+from .trace import tracer
+
+# Display order of the breakdown
+SECTIONS = ("events", "player", "enemies", "collisions", "waves",
+            "background", "entities", "hud", "overlay", "present")
+# Sections making up each phase of a frame (benchmarks, telemetry)
+PHASES = {
+    "update": ("player", "enemies", "collisions", "waves"),
+    "draw": ("background", "entities", "hud", "overlay"),
+    "present": ("present",),
+}
+HISTORY = 120  # Frames kept for the graph
+SMOOTHING = 0.1  # Weight of the newest frame in the averages
+
+
+class FrameStats:
+    """Per-section work time of the current frame, history and smoothed averages"""
+
+    def __init__(self, history=HISTORY):
+        self.current = dict.fromkeys(SECTIONS, 0.0)  # ms, frame in progress
+        self.averages = dict.fromkeys(SECTIONS, 0.0)  # ms, exponential moving average
+        self.frame_times = deque(maxlen=history)  # ms of work per finished frame
+        self.last = None
+        self.frame_start = None
+
+    def start_frame(self):
+        for section in self.current:
+            self.current[section] = 0.0
+        self.last = self.frame_start = time.perf_counter()
+
+    def lap(self, section):
+        """Charge the time since the previous lap (or start_frame) to `section`"""
+        now = time.perf_counter()
+        self.current[section] += (now - self.last) * 1000
+        if tracer.enabled:
+            tracer.complete(section, "frame", self.last, now)
+        self.last = now
+
+    def end_frame(self):
+        """Close the frame; returns its total work time in ms"""
+        total = sum(self.current.values())
+        if tracer.enabled:
+            tracer.complete("frame", "frame", self.frame_start, self.last)
+        self.frame_times.append(total)
+        for section, elapsed in self.current.items():
+            self.averages[section] += (elapsed - self.averages[section]) * SMOOTHING
+        return total
+
+    def average_frame_ms(self):
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
@@ -0,0 +1,1082 @@
+"""
+Boucle principale de Cosmic Defender : initialisation, événements, mise à jour et menu
+"""
+import pygame
+import random
+import math
+import sys
+import time
+import importlib
+
+from . import assets
+from .display import LogicalDisplay
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, RED, GREEN, YELLOW, CYAN, ORANGE, PURPLE, GameState, PowerUpType
+from .entities import Particle, Bullet, Enemy, PowerUp, Player, GigaBoss
+from .ui import Button
+from .global_leaderboard import GlobalLeaderboard
+from .startup_profiler import startup_profiler
+from .quality import quality_governor
+from .render_queue import RenderQueue
+from .frame_stats import FrameStats
+from .hitch_detector import hitch_detector
+from .trace import tracer
+from .gc_policy import gc_policy
+from .memory_monitor import memory_monitor
+from .telemetry import telemetry
+
+# pygame.init() would also start audio, joystick and timer before the window
+# exists; the menu only needs these, the joystick is started after the first
+# frame and the mixer is never used
+REQUIRED_SUBSYSTEMS = ("display", "font")
+LAZY_SUBSYSTEMS = ("joystick",)
+
+# A window drag sends dozens of VIDEORESIZE events: the window is rebuilt once
+# no new one has arrived for this long (seconds)
+RESIZE_SETTLE = 0.2
+
+
+def init_subsystems(names=REQUIRED_SUBSYSTEMS):
+    """Initialise only the given pygame subsystems (idempotent)"""
+    for name in names:
+        module = getattr(pygame, name)
+        if not module.get_init():
+            with startup_profiler.phase("subsystems", name):
+                module.init()
+
+
+def delegate(module, name):
+    """Method forwarding to cosmic_defender.<module>.<name>(game, ...)
+
+    The module is imported on the first call, so screens the player never
+    opens are never loaded.
+    """
+    target = None
+
+    def method(self, *args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(f"{__package__}.{module}"), name)
+        return target(self, *args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+class CosmicDefender:
+    def __init__(self, lazy_subsystems=True, logical_size=None, quality="auto", gc_mode="gameplay"):
+        init_subsystems(REQUIRED_SUBSYSTEMS)
+        # Render quality: "auto" follows the frame time, or a fixed tier name
+        quality_governor.set_mode(quality)
+        # "gameplay": GC collections moved to wave transitions, pause and menu
+        gc_policy.set_mode(gc_mode)
+
+        self.fullscreen = False
+        self.pending_resize = None  # (width, height) waiting for RESIZE_SETTLE
+        self.resize_deadline = 0
+        # Fixed logical resolution: drawn at that size whatever the window (None = native)
+        self.display = LogicalDisplay(logical_size) if logical_size else None
+        with startup_profiler.phase("display", "set_mode"):
+            if self.display:
+                self.screen = self.display.set_mode()
+            else:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+            pygame.display.set_caption("Cosmic Defender")
+        # Sprites loaded from now on are converted to the display format
+        assets.reconvert()
+        self.clock = pygame.time.Clock()
+        self.running = True
+        self.frame_count = 0
+        self.frame_stats = FrameStats()  # Work time per subsystem (F3 overlay, quality governor)
+        self.show_perf_overlay = False
+        self.perf_panel = None  # Cached text panel of the F3 overlay
+
+        # Controller/Gamepad support (started after the first frame unless eager)
+        self.joystick = None
+        self.lazy_subsystems = lazy_subsystems
+        if not lazy_subsystems:
+            self.init_joystick()
+
+        # Current screen dimensions (updated when switching modes)
+        self.current_width, self.current_height = self.screen.get_size()
+        assets.set_scale(assets.scale_for(self.current_width, self.current_height))
+
+        self.state = GameState.MENU
+        self.game_mode = "normal"  # "normal" or "infinite"
+        with startup_profiler.phase("assets", "player sprites"):
+            self.player = Player(self.current_width // 2, self.current_height - 100, self.current_width, self.current_height)
+        self.bullets = []
+        self.enemy_bullets = []
+        self.enemies = []
+        self.giga_boss = None
+        self.power_ups = []
+        self.particles = []
+        self.render_queue = RenderQueue()  # Entity sprites, submitted once per layer
+
+        self.score = 0
+        self.wave = 1
+        self.enemies_spawned = 0
+        self.enemies_per_wave = 10
+        self.spawn_timer = 0
+        self.spawn_cooldown = 1.0
+        self.enemies_killed = 0
+
+        # Pause state
+        self.previous_state = None
+        self.pause_buttons = []
+
+        # Screen shake
+        self.shake_offset_x = 0
+        self.shake_offset_y = 0
+        self.shake_intensity = 0
+        self.shake_duration = 0
+
+        # Background themes
+        self.current_background = 0
+        self.background_colors = [
+            (10, 10, 30),      # Dark blue - Space
+            (30, 10, 30),      # Purple - Nebula
+            (10, 30, 30),      # Cyan - Ice field
+            (30, 20, 10),      # Orange - Sun zone
+            (5, 5, 5),         # Black - Deep space
+        ]
+
+        with startup_profiler.phase("fonts"):
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 24)
+            self.big_font = pygame.font.Font(None, 72)
+        self.stars = [(random.randint(0, self.current_width), random.randint(0, self.current_height)) for _ in range(min(200, max(100, self.current_width // 10)))]
+
+        # Score system
+        self.scores_file = "scores.json"
+        self.web_scores_file = "web_scores.json"
+        self.player_name = ""
+        self.name_input_active = False
+        self.cursor_timer = 0
+
+        # Generate unique player ID for web leaderboard
+        with startup_profiler.phase("persistence", "player id"):
+            self.player_id = self.get_or_create_player_id()
+
+        # GitHub integration (before menu buttons)
+        with startup_profiler.phase("network", "github uploader"):
+            from .github import GitHubUploader, HAS_REQUESTS
+            self.github_uploader = GitHubUploader() if HAS_REQUESTS else None
+            if self.github_uploader and self.github_uploader.outbox.pending_count() > 0:
+                # Scores left from a previous session (crash, quit during upload)
+                self.github_uploader.outbox.start()
+
+        # Leaderboard screen: local scores.json or global board (cached, refreshed in background)
+        self.leaderboard_tab = "local"
+        self.global_leaderboard = GlobalLeaderboard()
+
+        # Control settings
+        with startup_profiler.phase("persistence", "controls"):
+            self.controls = self.load_controls()
+        self.waiting_for_key = None  # Track which control is being rebound
+        self.settings_buttons = []
+
+        # Bot pilot flying the ship instead of the player (launch.py --bot, benchmarks)
+        self.pilot = None
+
+        # Stress mode (launch.py --stress, T in settings): entity counts ramped until over budget
+        self.stress_test = None
+        self.stress_quit_when_done = False
+        self.stress_restore_quality = None
+
+        # Menu buttons (after GitHub uploader is initialized)
+        self.menu_buttons = []
+        self.create_menu_buttons()
+
+        # Everything loaded so far lives until exit: the GC no longer scans it
+        gc_policy.freeze()
+
+    def init_joystick(self):
+        """Start the joystick subsystem and pick up the first controller"""
+        init_subsystems(LAZY_SUBSYSTEMS)
+        if self.joystick is None and pygame.joystick.get_count() > 0:
+            self.joystick = pygame.joystick.Joystick(0)
+            self.joystick.init()
+            print(f"Controller detected: {self.joystick.get_name()}")
+
+    def create_menu_buttons(self):
+        button_width = 300
+        button_height = 50
+        center_x = self.current_width // 2
+        # Adjust start_y to be lower to avoid overlap with title
+        start_y = max(self.current_height // 2 - 20, 250)
+
+        self.menu_buttons = [
+            Button(center_x, start_y - 90, button_width, button_height, "CAMPAIGN MODE", self.font),
+            Button(center_x, start_y - 30, button_width, button_height, "INFINITE MODE", self.font),
+            Button(center_x, start_y + 30, button_width, button_height, "SETTINGS", self.font),
+            Button(center_x, start_y + 90, button_width, button_height, "RULES", self.font),
+            Button(center_x, start_y + 150, button_width, button_height, "LEADERBOARD", self.font),
+            Button(center_x, start_y + 210, button_width, button_height, "QUIT", self.font)
+        ]
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        self.pending_resize = None
+        if self.display:
+            # Same logical size in both modes: only the presentation changes
+            self.screen = self.display.set_mode(self.fullscreen)
+            self.current_width, self.current_height = self.screen.get_size()
+        elif self.fullscreen:
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.current_width, self.current_height = self.screen.get_size()
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+            self.current_width, self.current_height = SCREEN_WIDTH, SCREEN_HEIGHT
+        self.on_resolution_changed()
+
+    def apply_pending_resize(self):
+        """Rebuild the window for the last VIDEORESIZE once resizing has settled"""
+        if self.pending_resize is None or time.monotonic() < self.resize_deadline:
+            return
+        self.current_width, self.current_height = self.pending_resize
+        self.pending_resize = None
+        self.screen = pygame.display.set_mode((self.current_width, self.current_height), pygame.RESIZABLE)
+        self.on_resolution_changed()
+
+    def on_resolution_changed(self):
+        """Rebuild everything that depends on the window size"""
+        self.refresh_sprites()
+
+        # Regenerate stars for new screen size
+        self.stars = [(random.randint(0, self.current_width), random.randint(0, self.current_height)) for _ in range(min(200, max(100, self.current_width // 10)))]
+
+        # Update player bounds
+        if hasattr(self, 'player') and self.player:
+            self.player.update_screen_bounds(self.current_width, self.current_height)
+
+        # Recreate menu buttons for new screen size
+        self.create_menu_buttons()
+
+    def refresh_sprites(self):
+        """Hand live entities new sprites if the display format or the sprite scale changed"""
+        converted = assets.reconvert()
+        rescaled = assets.set_scale(assets.scale_for(self.current_width, self.current_height))
+        if not (converted or rescaled):
+            return
+        for entity in [self.player, self.giga_boss] + self.enemies + self.power_ups:
+            if entity:
+                entity.load_sprites()
+
+    def open_leaderboard(self, tab=None):
+        """Show the leaderboard screen; the global tab refreshes without blocking"""
+        if tab:
+            self.leaderboard_tab = tab
+        self.state = GameState.LEADERBOARD
+        if self.leaderboard_tab == "global":
+            self.global_leaderboard.refresh()
+
+    def spawn_enemy(self):
+        x = random.randint(50, self.current_width - 50)
+        y = -50
+
+        rand = random.random()
+        if self.wave >= 5 and rand < 0.1:
+            enemy_type = "boss"
+        elif rand < 0.2:
+            enemy_type = "tank"
+        elif rand < 0.4:
+            enemy_type = "fast"
+        else:
+            enemy_type = "basic"
+
+        self.enemies.append(Enemy(x, y, enemy_type))
+
+    def wave_transition(self):
+        """A new wave starts: lull in the action, safe for GC and memory snapshots"""
+        gc_policy.safe_point("wave")
+        memory_monitor.on_wave(self)
+
+    def spawn_giga_boss(self):
+        hitch_detector.note("giga boss spawn")
+        x = self.current_width // 2
+        y = -100
+        self.giga_boss = GigaBoss(x, y, self.wave)
+
+    def spawn_power_up(self, x, y):
+        if random.random() < 0.3:
+            hitch_detector.note("power-up spawn")
+            power_type = random.choice(list(PowerUpType))
+            self.power_ups.append(PowerUp(x, y, power_type))
+
+    def create_explosion(self, x, y, color=ORANGE, count=10):
+        tier = quality_governor.tier
+        count = min(max(1, round(count * tier.particle_scale)), tier.max_particles - len(self.particles))
+        for _ in range(count):
+            velocity = (random.uniform(-200, 200), random.uniform(-200, 200))
+            self.particles.append(Particle(x, y, color, velocity, random.uniform(0.5, 1.5)))
+
+    def add_screen_shake(self, intensity, duration=0.2):
+        """Add screen shake effect"""
+        self.shake_intensity = intensity
+        self.shake_duration = duration
+
+        # Controller rumble/vibration
+        if self.joystick:
+            try:
+                # Normalize intensity (0.0 to 1.0)
+                rumble_intensity = min(intensity / 20.0, 1.0)
+                # Rumble with low and high frequency motors
+                hitch_detector.note("rumble")
+                self.joystick.rumble(rumble_intensity, rumble_intensity, int(duration * 1000))
+            except:
+                pass  # Some controllers don't support rumble
+
+    def mouse_pos(self):
+        """Mouse position on the drawing surface"""
+        if self.display:
+            return self.display.to_logical(pygame.mouse.get_pos())
+        return pygame.mouse.get_pos()
+
+    def handle_events(self):
+        mouse_pos = self.mouse_pos()
+        mouse_clicked = False
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.VIDEORESIZE and not self.fullscreen and not self.display:
+                # Only remember the size; apply_pending_resize rebuilds once it settles
+                self.pending_resize = (event.w, event.h)
+                self.resize_deadline = time.monotonic() + RESIZE_SETTLE
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Left click
+                    mouse_clicked = True
+            elif event.type == pygame.JOYBUTTONDOWN:
+                # Controller START button (usually button 7 or 9)
+                if event.button in [7, 9]:  # START button
+                    if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+                        # Pause the game
+                        self.previous_state = self.state
+                        self.state = GameState.PAUSED
+                    elif self.state == GameState.PAUSED:
+                        # Resume the game
+                        self.state = self.previous_state
+                        self.previous_state = None
+                # Dash with A button (Xbox) / X button (PS) - Button 0
+                elif event.button == 0:  # A/X button
+                    if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+                        # Get current stick direction for dash
+                        if self.joystick:
+                            axis_x = self.joystick.get_axis(0)
+                            axis_y = self.joystick.get_axis(1)
+                            deadzone = 0.15
+                            dash_x = axis_x if abs(axis_x) > deadzone else 0
+                            dash_y = axis_y if abs(axis_y) > deadzone else 0
+                            if dash_x != 0 or dash_y != 0:
+                                self.player.dash(dash_x, dash_y)
+                            else:
+                                # If no stick input, dash forward (up)
+                                self.player.dash(0, -1)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F11:
+                    self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.show_perf_overlay = not self.show_perf_overlay
+                # Handle ENTER_NAME state first to prioritize text input
+                if self.state == GameState.ENTER_NAME:
+                    if event.key == pygame.K_ESCAPE:
+                        self.player_name = ""
+                        self.name_input_active = False
+                        self.state = GameState.MENU
+                    elif event.key == pygame.K_RETURN and len(self.player_name.strip()) > 0:
+                        self.save_score(self.player_name.strip(), self.score, self.wave, self.game_mode)
+                        web_score = self.save_web_score(self.player_name.strip(), self.score, self.wave, self.game_mode)
+
+                        # Upload automatique vers GitHub
+                        if self.github_uploader and self.github_uploader.is_configured():
+                            print("\n" + "="*60)
+                            print("📤 Upload automatique du score vers GitHub...")
+                            self.github_uploader.upload_async({"scores": [web_score]})
+                            print("="*60 + "\n")
+                        else:
+                            print("\n⚠️  GitHub non configuré - score sauvegardé localement uniquement\n")
+
+                        self.player_name = ""
+                        self.name_input_active = False
+                        self.open_leaderboard("local")
+                    elif event.key == pygame.K_BACKSPACE:
+                        self.player_name = self.player_name[:-1]
+                    elif len(self.player_name) < 20 and event.unicode.isprintable():
+                        self.player_name += event.unicode
+                elif self.state == GameState.GITHUB_CONFIG:
+                    # Text input screen: every key goes to the config fields
+                    self.handle_github_config_input(event)
+                elif event.key == pygame.K_ESCAPE:
+                    if self.fullscreen:
+                        self.toggle_fullscreen()
+                    elif self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+                        # Pause the game
+                        self.previous_state = self.state
+                        self.state = GameState.PAUSED
+                    elif self.state == GameState.PAUSED:
+                        # Resume the game
+                        self.state = self.previous_state
+                        self.previous_state = None
+                    elif self.state in [GameState.LEADERBOARD, GameState.RULES, GameState.SETTINGS]:
+                        self.state = GameState.MENU
+                    elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
+                        self.state = GameState.MENU
+                elif event.key == pygame.K_r:
+                    # Quick Restart (but not during name entry)
+                    if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE, GameState.PAUSED]:
+                        # Restart with the same mode
+                        self.start_game(self.game_mode)
+                    elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
+                        # Restart with the same mode
+                        self.start_game(self.game_mode)
+                elif event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
+                    # Dash with keyboard (SHIFT key)
+                    if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+                        keys = pygame.key.get_pressed()
+                        dash_x = 0
+                        dash_y = 0
+                        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+                            dash_x = -1
+                        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+                            dash_x = 1
+                        if keys[pygame.K_UP] or keys[pygame.K_w]:
+                            dash_y = -1
+                        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+                            dash_y = 1
+                        if dash_x != 0 or dash_y != 0:
+                            self.player.dash(dash_x, dash_y)
+                elif self.state == GameState.MENU:
+                    if event.key == pygame.K_SPACE:
+                        self.start_game("normal")
+                    elif event.key == pygame.K_l:  # L for Leaderboard
+                        self.open_leaderboard()
+                elif self.state == GameState.LEADERBOARD:
+                    if event.key in [pygame.K_TAB, pygame.K_LEFT, pygame.K_RIGHT]:
+                        self.open_leaderboard("global" if self.leaderboard_tab == "local" else "local")
+                    elif event.key == pygame.K_F5:
+                        self.global_leaderboard.refresh(force=True)
+                    elif event.key == pygame.K_w:
+                        import webbrowser
+                        webbrowser.open("https://fabyan09.github.io/cosmic-defender-leaderboard/")
+                elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
+                    if event.key == pygame.K_s:  # S to save score
+                        self.player_name = ""
+                        self.name_input_active = True
+                        self.state = GameState.ENTER_NAME
+                elif self.state == GameState.SETTINGS:
+                    # Handle key rebinding if waiting for input
+                    if self.waiting_for_key:
+                        # Rebind the key
+                        self.controls[self.waiting_for_key] = [event.key]
+                        self.save_controls()
+                        self.waiting_for_key = None
+                    elif event.key == pygame.K_g:
+                        # GitHub configuration screen
+                        self.init_github_config()
+                        self.state = GameState.GITHUB_CONFIG
+                    elif event.key == pygame.K_t:
+                        self.start_stress_test()
+
+        # Handle menu button clicks
+        if self.state == GameState.MENU:
+            for i, button in enumerate(self.menu_buttons):
+                button.update(mouse_pos, mouse_clicked)
+                if button.is_clicked:
+                    if i == 0:  # Campaign Mode
+                        self.start_game("normal")
+                    elif i == 1:  # Infinite Mode
+                        self.start_game("infinite")
+                    elif i == 2:  # Settings
+                        self.state = GameState.SETTINGS
+                    elif i == 3:  # Rules
+                        self.state = GameState.RULES
+                    elif i == 4:  # Leaderboard
+                        self.open_leaderboard()
+                    elif i == 5:  # Quit
+                        self.running = False
+        # Handle pause menu button clicks
+        elif self.state == GameState.PAUSED:
+            for i, button in enumerate(self.pause_buttons):
+                button.update(mouse_pos, mouse_clicked)
+                if button.is_clicked:
+                    if i == 0:  # Resume
+                        self.state = self.previous_state
+                        self.previous_state = None
+                    elif i == 1:  # Main Menu
+                        self.state = GameState.MENU
+                        self.pause_buttons = []  # Reset pause buttons
+        # Handle settings button clicks
+        elif self.state == GameState.SETTINGS:
+            control_names = list(["up", "down", "left", "right", "shoot", "pause"])
+
+            # Handle button clicks
+            for i, button in enumerate(self.settings_buttons):
+                button.update(mouse_pos, mouse_clicked)
+                if button.is_clicked:
+                    if i < len(control_names):
+                        # Change control button clicked
+                        self.waiting_for_key = control_names[i]
+                    elif i == len(control_names):
+                        # Reset to defaults
+                        self.controls = {
+                            "up": [pygame.K_w, pygame.K_UP],
+                            "down": [pygame.K_s, pygame.K_DOWN],
+                            "left": [pygame.K_a, pygame.K_LEFT],
+                            "right": [pygame.K_d, pygame.K_RIGHT],
+                            "shoot": [pygame.K_SPACE],
+                            "pause": [pygame.K_ESCAPE]
+                        }
+                        self.save_controls()
+                        self.waiting_for_key = None
+        else:
+            # Update button hover states even if not clicked
+            for button in self.menu_buttons:
+                button.update(mouse_pos, False)
+
+    def start_game(self, mode="normal"):
+        # One telemetry file per game: the previous one (finished, abandoned or restarted with R) is written now
+        telemetry.flush()
+        self.game_mode = mode
+        if mode == "infinite":
+            self.state = GameState.PLAYING_INFINITE
+        else:
+            self.state = GameState.PLAYING
+
+        self.player = Player(self.current_width // 2, self.current_height - 100, self.current_width, self.current_height)
+        self.bullets.clear()
+        self.enemy_bullets.clear()
+        self.enemies.clear()
+        self.giga_boss = None
+        self.boss_spawned_this_wave = False
+        self.power_ups.clear()
+        self.particles.clear()
+        self.score = 0
+        self.wave = 1
+        self.enemies_spawned = 0
+        self.spawn_timer = 0
+
+        # Set initial values based on mode
+        if mode == "infinite":
+            self.enemies_per_wave = 5  # Start with fewer enemies in infinite mode
+        else:
+            self.enemies_per_wave = 10
+
+    def update_game(self, dt):
+        # Update screen shake
+        if self.shake_duration > 0:
+            self.shake_duration -= dt
+            if self.shake_duration <= 0:
+                self.shake_offset_x = 0
+                self.shake_offset_y = 0
+                self.shake_intensity = 0
+            else:
+                self.shake_offset_x = random.uniform(-self.shake_intensity, self.shake_intensity)
+                self.shake_offset_y = random.uniform(-self.shake_intensity, self.shake_intensity)
+
+        if self.pilot:
+            self.pilot.think(self)
+        self.player.update(dt, self.joystick, self.pilot)
+
+        # Check for shooting (keyboard, mouse, or controller)
+        should_shoot = False
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]:
+            should_shoot = True
+        if self.pilot and self.pilot.shoot:
+            should_shoot = True
+
+        # Controller shooting (R2 trigger on Xbox/PS, axis 5 or button 7)
+        if self.joystick:
+            # Try R2/RT trigger (axis 5 for most controllers)
+            try:
+                rt_value = self.joystick.get_axis(5)  # Right trigger
+                if rt_value > 0.1:  # Trigger is pressed
+                    should_shoot = True
+            except:
+                pass
+
+            # Fallback to R2/RT button if axis not available
+            try:
+                if self.joystick.get_button(7):  # R2/RT button
+                    should_shoot = True
+            except:
+                pass
+
+        if self.player.can_shoot() and should_shoot:
+            self.bullets.extend(self.player.get_bullets())
+        self.frame_stats.lap("player")
+
+        self.bullets = [bullet for bullet in self.bullets if bullet.update(dt, self.current_width, self.current_height)]
+        self.enemy_bullets = [bullet for bullet in self.enemy_bullets if bullet.update(dt, self.current_width, self.current_height)]
+
+        # Update regular enemies
+        for enemy in self.enemies[:]:
+            if not enemy.update(dt, self.player.x, self.player.y, self.current_height):
+                self.enemies.remove(enemy)
+                continue
+
+            if enemy.can_shoot():
+                # Only shoot if enemy is within screen bounds
+                if 0 <= enemy.x <= self.current_width and 0 <= enemy.y <= self.current_height:
+                    angle = math.atan2(self.player.y - enemy.y, self.player.x - enemy.x)
+                    velocity = (math.cos(angle) * 200, math.sin(angle) * 200)
+                    self.enemy_bullets.append(Bullet(enemy.x, enemy.y, velocity, color=RED, is_player_bullet=False))
+
+        # Update giga boss
+        if self.giga_boss:
+            if not self.giga_boss.update(dt, self.player.x, self.player.y, self.current_width, self.current_height):
+                self.giga_boss = None
+            else:
+                # Giga boss shooting
+                giga_bullets = self.giga_boss.get_bullets(self.player.x, self.player.y)
+                self.enemy_bullets.extend(giga_bullets)
+
+        self.power_ups = [power_up for power_up in self.power_ups if power_up.update(dt, self.current_height)]
+        self.particles = [particle for particle in self.particles if particle.update(dt)]
+        self.frame_stats.lap("enemies")
+
+        # Bullet vs enemies collision
+        for bullet in self.bullets[:]:
+            hit = False
+            # Check collision with regular enemies
+            for enemy in self.enemies[:]:
+                if bullet.rect.colliderect(enemy.rect):
+                    # Check if enemy was killed by this damage
+                    enemy_was_alive = enemy.health > 0
+                    enemy_will_die = enemy.health <= bullet.damage
+
+                    if enemy.take_damage(bullet.damage):
+                        # Enemy removed immediately (no destruction animation)
+                        self.score += enemy.points
+                        self.enemies_killed += 1
+                        self.create_explosion(enemy.x, enemy.y)
+                        # Different vibration for boss vs normal enemies
+                        if enemy.enemy_type == "boss":
+                            self.add_screen_shake(10, 0.3)  # Stronger shake for boss death
+                        else:
+                            self.add_screen_shake(3, 0.1)  # Small shake for normal enemies
+                        self.spawn_power_up(enemy.x, enemy.y)
+                        self.enemies.remove(enemy)
+                    elif enemy_was_alive and enemy_will_die:
+                        # Enemy just died but has destruction animation
+                        self.score += enemy.points
+                        self.enemies_killed += 1
+                        self.create_explosion(enemy.x, enemy.y)
+                        # Different vibration for boss vs normal enemies
+                        if enemy.enemy_type == "boss":
+                            self.add_screen_shake(10, 0.3)  # Stronger shake for boss death
+                        else:
+                            self.add_screen_shake(3, 0.1)  # Small shake for normal enemies
+                        self.spawn_power_up(enemy.x, enemy.y)
+                        # Don't remove enemy yet, let animation play
+                    self.bullets.remove(bullet)
+                    hit = True
+                    break
+
+            # Check collision with giga boss
+            if not hit and self.giga_boss and bullet.rect.colliderect(self.giga_boss.rect):
+                # Check if gigaboss was killed by this damage
+                gigaboss_was_alive = self.giga_boss.health > 0
+                gigaboss_will_die = self.giga_boss.health <= bullet.damage
+
+                if self.giga_boss.take_damage(bullet.damage):
+                    # This should never happen for gigaboss as it always has destruction animation
+                    self.score += self.giga_boss.points
+                    self.enemies_killed += 1
+                    self.create_explosion(self.giga_boss.x, self.giga_boss.y, PURPLE, 20)
+                    self.add_screen_shake(15, 0.4)  # Big shake for boss death
+                    self.spawn_power_up(self.giga_boss.x, self.giga_boss.y)
+                    self.giga_boss = None
+                elif gigaboss_was_alive and gigaboss_will_die:
+                    # Gigaboss just died but has destruction animation
+                    self.score += self.giga_boss.points
+                    self.enemies_killed += 1
+                    self.create_explosion(self.giga_boss.x, self.giga_boss.y, PURPLE, 20)
+                    self.add_screen_shake(15, 0.4)  # Big shake for boss death
+                    self.spawn_power_up(self.giga_boss.x, self.giga_boss.y)
+                    # Don't set giga_boss to None yet, let animation play
+                self.bullets.remove(bullet)
+
+        for bullet in self.enemy_bullets[:]:
+            if bullet.rect.colliderect(self.player.rect):
+                if self.player.take_damage(bullet.damage):
+                    self.state = GameState.GAME_OVER
+                self.create_explosion(self.player.x, self.player.y, RED)
+                self.enemy_bullets.remove(bullet)
+
+        for power_up in self.power_ups[:]:
+            if power_up.rect.colliderect(self.player.rect):
+                self.player.activate_power_up(power_up.type)
+                self.power_ups.remove(power_up)
+                self.create_explosion(power_up.x, power_up.y, power_up.color, 5)
+
+        # Player collision with enemies
+        for enemy in self.enemies[:]:
+            if enemy.rect.colliderect(self.player.rect):
+                if self.player.take_damage(10):
+                    self.state = GameState.GAME_OVER
+                self.create_explosion(self.player.x, self.player.y, RED)
+                self.enemies.remove(enemy)
+
+        # Player collision with giga boss
+        if self.giga_boss and self.giga_boss.rect.colliderect(self.player.rect):
+            if self.player.take_damage(20):
+                self.state = GameState.GAME_OVER
+            self.create_explosion(self.player.x, self.player.y, RED)
+        self.frame_stats.lap("collisions")
+
+        # Wave management
+        if self.game_mode == "infinite":
+            # In infinite mode, check for giga boss every 10 waves
+            if self.wave % 10 == 0 and not self.giga_boss and not self.boss_spawned_this_wave and len(self.enemies) == 0 and self.enemies_spawned >= self.enemies_per_wave:
+                self.spawn_giga_boss()
+                self.boss_spawned_this_wave = True
+            elif not self.giga_boss:  # Normal enemy spawning when no giga boss
+                self.spawn_timer += dt
+                # Increase max enemies on screen as waves progress in infinite mode
+                max_enemies = min(30, 15 + (self.wave // 2))
+                if (self.spawn_timer >= self.spawn_cooldown and
+                    self.enemies_spawned < self.enemies_per_wave and
+                    len(self.enemies) < max_enemies):
+                    self.spawn_enemy()
+                    self.enemies_spawned += 1
+                    self.spawn_timer = 0
+
+            # Wave progression in infinite mode
+            if self.enemies_spawned >= self.enemies_per_wave and len(self.enemies) == 0 and not self.giga_boss:
+                self.wave += 1
+                self.enemies_spawned = 0
+                self.wave_transition()
+                self.boss_spawned_this_wave = False
+                # Increase difficulty more aggressively: +2 base + wave/5 for exponential growth
+                self.enemies_per_wave += 2 + (self.wave // 5)
+                self.spawn_cooldown = max(0.15, self.spawn_cooldown - 0.03)
+                # Change background every 10 waves
+                if self.wave % 10 == 0:
+                    self.current_background = (self.current_background + 1) % len(self.background_colors)
+        else:
+            # Normal campaign mode
+            self.spawn_timer += dt
+            # Increase max enemies on screen as waves progress
+            max_enemies = min(25, 15 + (self.wave // 2))
+            if (self.spawn_timer >= self.spawn_cooldown and
+                self.enemies_spawned < self.enemies_per_wave and
+                len(self.enemies) < max_enemies):
+                self.spawn_enemy()
+                self.enemies_spawned += 1
+                self.spawn_timer = 0
+
+            if self.enemies_spawned >= self.enemies_per_wave and len(self.enemies) == 0:
+                self.wave += 1
+                self.enemies_spawned = 0
+                self.wave_transition()
+                # Increase difficulty more: +3 base + wave/3 for good progression
+                self.enemies_per_wave += 3 + (self.wave // 3)
+                self.spawn_cooldown = max(0.25, self.spawn_cooldown - 0.06)
+                # Change background every 10 waves
+                if self.wave % 10 == 0:
+                    self.current_background = (self.current_background + 1) % len(self.background_colors)
+
+                if self.wave > 10:
+                    self.state = GameState.VICTORY
+        self.frame_stats.lap("waves")
+
+    def draw_offscreen_indicators(self):
+        """Draw arrows pointing to off-screen enemies"""
+        margin = 30
+        indicator_size = 15
+
+        for enemy in self.enemies:
+            # Check if enemy is off-screen
+            if enemy.x < 0 or enemy.x > self.current_width or enemy.y < 0:
+                # Calculate arrow position at screen edge
+                arrow_x = max(margin, min(self.current_width - margin, enemy.x))
+                arrow_y = max(margin, min(self.current_height - margin, enemy.y))
+
+                # Calculate direction to enemy
+                angle = math.atan2(enemy.y - arrow_y, enemy.x - arrow_x)
+
+                # Draw arrow pointing to enemy
+                arrow_color = enemy.color
+                # Arrow triangle
+                point1 = (arrow_x + math.cos(angle) * indicator_size,
+                         arrow_y + math.sin(angle) * indicator_size)
+                point2 = (arrow_x + math.cos(angle + 2.5) * indicator_size * 0.6,
+                         arrow_y + math.sin(angle + 2.5) * indicator_size * 0.6)
+                point3 = (arrow_x + math.cos(angle - 2.5) * indicator_size * 0.6,
+                         arrow_y + math.sin(angle - 2.5) * indicator_size * 0.6)
+
+                pygame.draw.polygon(self.screen, arrow_color, [point1, point2, point3])
+                pygame.draw.polygon(self.screen, WHITE, [point1, point2, point3], 2)
+
+        # Do the same for giga boss
+        if self.giga_boss:
+            if self.giga_boss.x < 0 or self.giga_boss.x > self.current_width or self.giga_boss.y < 0:
+                arrow_x = max(margin, min(self.current_width - margin, self.giga_boss.x))
+                arrow_y = max(margin, min(self.current_height - margin, self.giga_boss.y))
+
+                angle = math.atan2(self.giga_boss.y - arrow_y, self.giga_boss.x - arrow_x)
+
+                # Bigger arrow for boss
+                boss_indicator_size = 25
+                arrow_color = PURPLE
+                point1 = (arrow_x + math.cos(angle) * boss_indicator_size,
+                         arrow_y + math.sin(angle) * boss_indicator_size)
+                point2 = (arrow_x + math.cos(angle + 2.5) * boss_indicator_size * 0.6,
+                         arrow_y + math.sin(angle + 2.5) * boss_indicator_size * 0.6)
+                point3 = (arrow_x + math.cos(angle - 2.5) * boss_indicator_size * 0.6,
+                         arrow_y + math.sin(angle - 2.5) * boss_indicator_size * 0.6)
+
+                pygame.draw.polygon(self.screen, arrow_color, [point1, point2, point3])
+                pygame.draw.polygon(self.screen, WHITE, [point1, point2, point3], 3)
+
+    def draw_visible(self, entities):
+        """Queue the entities whose sprite touches the screen (the others keep updating)"""
+        queue = self.render_queue
+        for entity in entities:
+            half_width, half_height = entity.half_extent()
+            if queue.visible(entity.x, entity.y, half_width, half_height):
+                entity.draw(queue)
+
+    def visible_stars(self):
+        """Background stars drawn at the current quality tier"""
+        return self.stars[:int(len(self.stars) * quality_governor.tier.star_fraction)]
+
+    def draw_stars(self, surface=None):
+        if surface is None:
+            surface = self.screen
+        for star in self.visible_stars():
+            pygame.draw.circle(surface, WHITE, star, 1)
+
+    def draw_ui(self):
+        health_text = self.font.render(f"Health: {self.player.health}", True, WHITE)
+        shield_text = self.font.render(f"Shield: {self.player.shield}", True, CYAN)
+        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        wave_text = self.font.render(f"Wave: {self.wave}", True, WHITE)
+        mode_text = self.font.render(f"Mode: {self.game_mode.upper()}", True, YELLOW)
+
+        self.screen.blit(health_text, (10, 10))
+        self.screen.blit(shield_text, (10, 50))
+        self.screen.blit(score_text, (self.current_width - 150, 10))
+        self.screen.blit(wave_text, (self.current_width - 150, 50))
+        self.screen.blit(mode_text, (self.current_width - 200, 90))
+
+        # Show giga boss warning
+        if self.game_mode == "infinite" and self.wave % 10 == 0 and not self.giga_boss and len(self.enemies) == 0:
+            warning_text = self.big_font.render("GIGA BOSS INCOMING!", True, RED)
+            warning_rect = warning_text.get_rect(center=(self.current_width//2, self.current_height//2))
+            self.screen.blit(warning_text, warning_rect)
+
+        health_bar_width = 200
+        health_ratio = self.player.health / self.player.max_health
+        health_color = GREEN if health_ratio > 0.5 else ORANGE if health_ratio > 0.25 else RED
+
+        pygame.draw.rect(self.screen, RED, (10, 90, health_bar_width, 10))
+        pygame.draw.rect(self.screen, health_color, (10, 90, health_bar_width * health_ratio, 10))
+
+        if self.player.shield > 0:
+            shield_ratio = self.player.shield / self.player.max_shield
+            pygame.draw.rect(self.screen, CYAN, (10, 105, health_bar_width * shield_ratio, 5))
+
+        # Draw off-screen enemy indicators
+        if quality_governor.tier.offscreen_indicators:
+            self.draw_offscreen_indicators()
+
+        if self.stress_test:
+            stress_text = self.font.render(self.stress_test.status(), True, YELLOW)
+            self.screen.blit(stress_text, stress_text.get_rect(center=(self.current_width // 2, 30)))
+
+    def draw_menu(self):
+        title = self.big_font.render("COSMIC DEFENDER", True, WHITE)
+        title_rect = title.get_rect(center=(self.current_width//2, self.current_height//2 - 200))
+        self.screen.blit(title, title_rect)
+
+        # Draw menu buttons
+        for button in self.menu_buttons:
+            button.draw(self.screen)
+
+        # Instructions
+        instructions = [
+            " ",
+            " ",
+            "Campaign Mode: Survive 10 waves to win!",
+            "Infinite Mode: Endless waves with Giga Bosses every 10 waves!"
+        ]
+
+        for i, instruction in enumerate(instructions):
+            text = self.font.render(instruction, True, WHITE)
+            text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2 + 200 + i * 30))
+            self.screen.blit(text, text_rect)
+
+    # Persistence and the screens other than menu and gameplay live in their own
+    # modules, imported the first time one of these methods is called
+
+    load_scores = delegate("persistence", "load_scores")
+    save_score = delegate("persistence", "save_score")
+    get_top_scores = delegate("persistence", "get_top_scores")
+    get_or_create_player_id = delegate("persistence", "get_or_create_player_id")
+    load_controls = delegate("persistence", "load_controls")
+    save_controls = delegate("persistence", "save_controls")
+    save_web_score = delegate("persistence", "save_web_score")
+    export_for_github = delegate("persistence", "export_for_github")
+
+    draw_rules = delegate("screens.rules", "draw_rules")
+    draw_enemy_preview = delegate("screens.rules", "draw_enemy_preview")
+
+    draw_settings = delegate("screens.settings", "draw_settings")
+
+    init_github_config = delegate("screens.github_config", "init_github_config")
+    handle_github_config_input = delegate("screens.github_config", "handle_github_config_input")
+    store_github_input = delegate("screens.github_config", "store_github_input")
+    test_github_connection = delegate("screens.github_config", "test_github_connection")
+    poll_github_test = delegate("screens.github_config", "poll_github_test")
+    save_github_config = delegate("screens.github_config", "save_github_config")
+    draw_github_config = delegate("screens.github_config", "draw_github_config")
+    draw_spinner = delegate("screens.github_config", "draw_spinner")
+
+    draw_leaderboard = delegate("screens.leaderboard", "draw_leaderboard")
+    draw_global_leaderboard_status = delegate("screens.leaderboard", "draw_global_leaderboard_status")
+
+    draw_pause_menu = delegate("screens.pause", "draw_pause_menu")
+
+    draw_perf_overlay = delegate("screens.perf_overlay", "draw_perf_overlay")
+
+    start_stress_test = delegate("stress", "start_stress_test")
+    update_stress_test = delegate("stress", "update_stress_test")
+
+    draw_game_over = delegate("screens.game_over", "draw_game_over")
+    draw_victory = delegate("screens.game_over", "draw_victory")
+    draw_enter_name = delegate("screens.game_over", "draw_enter_name")
+
+    def run(self):
+        while self.running:
+            self.run_frame()
+
+        if hitch_detector.enabled:
+            print(hitch_detector.summary())
+            hitch_detector.disable()
+        if memory_monitor.enabled:
+            print(memory_monitor.report())
+            memory_monitor.disable()
+        if telemetry.enabled:
+            telemetry.flush()
+            telemetry.wait(timeout=5)
+        if tracer.enabled:
+            tracer.save()
+
+        pygame.quit()
+        sys.exit()
+
+    def run_frame(self):
+        """One iteration of the game loop: events, update, draw, flip"""
+        if self.frame_count == 1 and self.lazy_subsystems:
+            # The menu is already on screen: start what it did not need
+            self.init_joystick()
+
+        with tracer.span("clock.tick", "frame"):
+            dt = self.clock.tick(FPS) / 1000.0
+        if self.stress_test and self.state == GameState.PLAYING_INFINITE:
+            self.stress_test.before_frame(self)  # Spawning for the stress test is not timed
+        stats = self.frame_stats
+        stats.start_frame()
+        hitch_detector.begin_frame()
+
+        self.handle_events()
+        self.apply_pending_resize()
+        playing = self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]
+        if playing != gc_policy.playing:
+            if playing:
+                gc_policy.enter_play()
+            else:
+                gc_policy.leave_play(self.state.name.lower())
+        stats.lap("events")
+
+        if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+            with tracer.span("update_game", "frame"):
+                self.update_game(dt)
+        elif self.state == GameState.ENTER_NAME:
+            self.cursor_timer += dt
+        elif self.state == GameState.GITHUB_CONFIG:
+            self.poll_github_test()
+
+        # Fill with dynamic background color
+        bg_color = self.background_colors[self.current_background]
+        self.screen.fill(bg_color)
+        self.draw_stars()
+        stats.lap("background")
+
+        if self.state == GameState.MENU:
+            self.draw_menu()
+        elif self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+            if quality_governor.tier.screen_shake:
+                # Create a temporary surface for game elements
+                game_surface = pygame.Surface((self.current_width, self.current_height))
+                game_surface.fill(bg_color)
+
+                # Draw stars on game surface
+                self.draw_stars(game_surface)
+            else:
+                # Low quality: no shake, draw straight to the screen
+                game_surface = self.screen
+            stats.lap("background")
+
+            queue = self.render_queue
+            queue.begin(self.current_width, self.current_height)
+            self.player.draw(queue)  # Always on screen
+
+            self.draw_visible(self.bullets)
+            self.draw_visible(self.enemy_bullets)
+            self.draw_visible(self.enemies)
+            if self.giga_boss:
+                self.draw_visible([self.giga_boss])
+            self.draw_visible(self.power_ups)
+            self.draw_visible(self.particles)
+            queue.flush(game_surface)
+
+            # Apply screen shake offset
+            if game_surface is not self.screen:
+                self.screen.blit(game_surface, (self.shake_offset_x, self.shake_offset_y))
+            stats.lap("entities")
+
+            self.draw_ui()
+        elif self.state == GameState.PAUSED:
+            self.draw_pause_menu()
+        elif self.state == GameState.RULES:
+            self.draw_rules()
+        elif self.state == GameState.SETTINGS:
+            self.draw_settings()
+        elif self.state == GameState.GAME_OVER:
+            self.draw_game_over()
+        elif self.state == GameState.VICTORY:
+            self.draw_victory()
+        elif self.state == GameState.LEADERBOARD:
+            self.draw_leaderboard()
+        elif self.state == GameState.ENTER_NAME:
+            self.draw_enter_name()
+        elif self.state == GameState.GITHUB_CONFIG:
+            self.draw_github_config()
+        stats.lap("hud")
+
+        if self.show_perf_overlay:
+            self.draw_perf_overlay()
+            stats.lap("overlay")
+
+        if self.display:
+            self.display.present()
+        else:
+            pygame.display.flip()
+        stats.lap("present")
+        self.frame_count += 1
+
+        frame_ms = stats.end_frame()
+        hitch_detector.end_frame(self, frame_ms)
+        if self.state in [GameState.PLAYING, GameState.PLAYING_INFINITE]:
+            telemetry.record(self, frame_ms)
+        if quality_governor.record(frame_ms):
+            print(f"⚙️ Qualité graphique : {quality_governor.tier.name}")
+        if self.stress_test:
+            self.update_stress_test()
+        if self.pilot:
+            self.pilot.after_frame(self)
+
+        if self.frame_count == 1:
+            startup_profiler.mark_first_frame()
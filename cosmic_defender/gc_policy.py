@@ -0,0 +1,118 @@
+"""
+Ramasse-miettes (GC) pendant le jeu
+Le GC cyclique de CPython se déclenche au nombre d'allocations : avec les
+balles, particules, Rect et tuples créés à chaque frame, il peut tomber en
+plein combat de boss. En mode "gameplay", les objets permanents (assets,
+polices, menus) sont gelés après le chargement, les seuils sont relevés
+pendant une partie et les collectes complètes se font aux moments sûrs :
+changement de vague, pause, menu. Chaque pause du GC est mesurée
+(gc.callbacks) pour l'overlay F3, le journal des saccades et la trace.
+"""
+import gc
+import time
+from collections import deque
+
+from .trace import tracer
+
+PLAY_THRESHOLDS = (50000, 50, 100)  # gen0 every 50k surviving containers, gen2 almost never
+MAX_PAUSES = 120  # Recent pauses kept for the overlay and the hitch detector
+
+
+class GCPolicy:
+    """Measures every GC pause; in 'gameplay' mode also picks when collections happen"""
+
+    def __init__(self):
+        self.managed = False
+        self.installed = False
+        self.playing = False
+        self.default_thresholds = gc.get_threshold()
+        self.pauses = deque(maxlen=MAX_PAUSES)  # (generation, ms, collected, reason)
+        self.pause_count = 0  # Pauses since start, including those dropped from `pauses`
+        self.collections = [0, 0, 0]  # Per generation
+        self.max_ms = 0.0
+        self.reason = None  # Safe point being collected, None for automatic collections
+        self._start = None
+
+    def install(self):
+        """Start measuring pauses (idempotent)"""
+        if not self.installed:
+            gc.callbacks.append(self._on_gc)
+            self.installed = True
+
+    def set_mode(self, mode):
+        """'gameplay' (managed collections) or 'default' (CPython thresholds, pauses still measured)"""
+        self.install()
+        self.managed = mode == "gameplay"
+        self.restore()
+
+    def disable(self):
+        self.set_mode("default")
+        if self.installed:
+            gc.callbacks.remove(self._on_gc)
+            self.installed = False
+
+    def restore(self):
+        """CPython behaviour: default thresholds, nothing frozen"""
+        gc.set_threshold(*self.default_thresholds)
+        gc.unfreeze()
+        self.playing = False
+
+    def freeze(self):
+        """Move everything alive now (assets, fonts, menus) out of the collected generations"""
+        if self.managed:
+            self.collect("startup")
+            gc.freeze()
+
+    def enter_play(self):
+        """A game starts or resumes: automatic collections become rare"""
+        if self.managed and not self.playing:
+            gc.set_threshold(*PLAY_THRESHOLDS)
+        self.playing = True
+
+    def leave_play(self, reason):
+        """Pause, menu, game over: collect everything while nothing moves"""
+        if self.managed and self.playing:
+            gc.set_threshold(*self.default_thresholds)
+            self.collect(reason)
+        self.playing = False
+
+    def safe_point(self, reason):
+        """A lull during play (wave transition): full collection"""
+        if self.managed:
+            self.collect(reason)
+
+    def collect(self, reason):
+        self.reason = reason
+        try:
+            gc.collect()
+        finally:
+            self.reason = None
+
+    def pauses_since(self, mark):
+        """Pauses recorded after pause_count was `mark`"""
+        count = min(self.pause_count - mark, len(self.pauses))
+        return list(self.pauses)[len(self.pauses) - count:] if count > 0 else []
+
+    def last_ms(self):
+        return self.pauses[-1][1] if self.pauses else 0.0
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None:
+            return
+        end = time.perf_counter()
+        generation = info["generation"]
+        ms = (end - self._start) * 1000
+        self.pauses.append((generation, ms, info["collected"], self.reason))
+        self.pause_count += 1
+        self.collections[generation] += 1
+        self.max_ms = max(self.max_ms, ms)
+        tracer.complete(f"gc gen{generation}", "gc", self._start, end,
+                        {"collected": info["collected"], "reason": self.reason or "automatic"})
+        self._start = None
+
+
+# Shared instance, mode set by CosmicDefender (launch.py --gc)
+gc_policy = GCPolicy()
@@ -0,0 +1,335 @@
+"""
+Upload du leaderboard vers GitHub (API contents, outbox persistante, cache ETag)
+"""
+import base64
+import importlib.util
+import json
+import os
+import threading
+from datetime import datetime
+
+from .leaderboard_merge import merge_leaderboard, build_leaderboard_data, dump_leaderboard
+from .upload_outbox import UploadOutbox
+from .leaderboard_cache import LeaderboardCache
+from .trace import tracer, traced
+
+# Optional web features: requests is only imported by the network code,
+# which runs in background threads, so menu startup never pays for it
+HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+LEADERBOARD_LIMIT = 250
+LEADERBOARD_FILE = "cosmic_defender_leaderboard.json"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_CONFIG_FILE = "github_config.json"
+# Upload failures worth retrying later; anything else (bad token, missing repository) needs a config change
+RETRYABLE_STATUS = (408, 409, 422, 429, 500, 502, 503, 504)
+
+
+def is_retryable(response):
+    """True when a failed request may succeed later without a config change"""
+    if response.status_code == 403:
+        # 403 is also GitHub's rate limit answer, which resets on its own
+        return response.headers.get("X-RateLimit-Remaining") == "0"
+    return response.status_code in RETRYABLE_STATUS or response.status_code >= 500
+
+
+class DownloadError(Exception):
+    """The remote leaderboard could not be read: uploading now would overwrite it"""
+
+    def __init__(self, message, retryable):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class GitHubUploader:
+    def __init__(self):
+        # Configuration centralisée - tous les joueurs uploadent vers le même leaderboard
+        self.config = {
+            "username": "fabyan09",
+            "repository": "cosmic-defender-leaderboard",
+            "token": None,  # Decrypted on first use by resolve_token (slow PBKDF2)
+            "auto_upload": True,
+            "configured": True
+        }
+        self.load_config()
+        self.api_url = GITHUB_API_URL
+        self.max_conflict_retries = 5
+        self._token_lock = threading.Lock()
+
+        # One pooled HTTP session for every call (TCP/TLS set up once), created on first use
+        self.session = None
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "rate_limit_remaining": None
+        }
+        self._stats_lock = threading.Lock()
+
+        # Last downloaded leaderboard, revalidated with If-None-Match
+        self.cache = LeaderboardCache()
+
+        # Scores waiting to be uploaded, kept on disk until GitHub accepts them
+        self.outbox = UploadOutbox(self)
+
+    @traced("resolve_token", "network")
+    def resolve_token(self):
+        """Decrypt the embedded token the first time it is needed
+
+        Only called from the upload worker and the background executor, so the
+        cryptography import and key derivation never delay the menu.
+        """
+        if self.config["token"] is None:
+            with self._token_lock:
+                if self.config["token"] is None:
+                    self.config["token"] = self._get_secure_token()
+        return self.config["token"]
+
+    def _get_secure_token(self):
+        """Récupère le token chiffré de façon sécurisée"""
+        try:
+            from secure_token import SecureToken
+            st = SecureToken()
+            token = st.get_embedded_token()
+            if token:
+                return token
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"Erreur lors du déchiffrement du token: {e}")
+
+        # Fallback: essayer l'ancien système (config_token.py)
+        try:
+            from config_token import ENCODED_TOKEN
+            if ENCODED_TOKEN and ENCODED_TOKEN != "REMPLACEZ_PAR_VOTRE_TOKEN_ENCODE":
+                return base64.b64decode(ENCODED_TOKEN.encode()).decode()
+        except:
+            pass
+
+        return ""
+
+    def load_config(self):
+        """Apply the settings saved from the GitHub config screen (never the token)"""
+        try:
+            if os.path.exists(GITHUB_CONFIG_FILE):
+                with open(GITHUB_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                for key in ("username", "repository", "auto_upload"):
+                    if key in saved:
+                        self.config[key] = saved[key]
+        except:
+            pass
+
+    def save_config(self):
+        """Save the GitHub config screen settings; the token stays the embedded one"""
+        try:
+            with open(GITHUB_CONFIG_FILE, 'w', encoding='utf-8') as f:
+                json.dump({key: self.config.get(key) for key in ("username", "repository", "auto_upload")},
+                          f, indent=2)
+        except Exception as e:
+            print(f"Error saving GitHub config: {e}")
+        # Scores held back by a config error get another chance with the new settings
+        self.outbox.resume()
+
+    def is_configured(self):
+        """Check if GitHub integration is properly configured"""
+        # Vérifie que tous les champs nécessaires sont présents et que requests est disponible
+        # (un token pas encore déchiffré compte comme présent : il le sera au premier upload)
+        token = self.config.get("token")
+        return ((token is None or bool(token)) and
+                bool(self.config.get("username", "")) and
+                bool(self.config.get("repository", "")) and
+                HAS_REQUESTS)
+
+    def test_connection(self):
+        """Test GitHub API connection"""
+        if not HAS_REQUESTS or not self.resolve_token():
+            return False, "Requests module or token missing"
+        import requests
+
+        try:
+            url = f"{self.api_url}/repos/{self.config['username']}/{self.config['repository']}"
+            response = self._request("GET", url, timeout=10)
+
+            if response.status_code == 200:
+                return True, "Connection successful"
+            elif response.status_code == 404:
+                return False, "Repository not found"
+            elif response.status_code == 401:
+                return False, "Invalid token"
+            else:
+                return False, f"HTTP {response.status_code}"
+
+        except requests.exceptions.Timeout:
+            return False, "Connection timeout"
+        except requests.exceptions.ConnectionError:
+            return False, "No internet connection"
+        except Exception as e:
+            return False, f"Error: {str(e)}"
+
+    def _get_session(self):
+        if self.session is None:
+            import requests
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        return self.session
+
+    def _request(self, method, url, headers=None, **kwargs):
+        """Send a request through the shared session and record traffic stats"""
+        request_headers = self._headers()
+        if headers:
+            request_headers.update(headers)
+        with tracer.span(f"HTTP {method}", "network", url=url):
+            response = self._get_session().request(method, url, headers=request_headers, **kwargs)
+
+        body = response.request.body or b""
+        received = response.headers.get("Content-Length")
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_sent"] += len(body)
+            self.stats["bytes_received"] += int(received) if received else len(response.content)
+            if response.status_code == 304:
+                self.stats["not_modified"] += 1
+            if "X-RateLimit-Remaining" in response.headers:
+                self.stats["rate_limit_remaining"] = int(response.headers["X-RateLimit-Remaining"])
+        return response
+
+    def get_network_stats(self):
+        """Copy of the request/byte counters (safe to call from the game loop)"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _headers(self):
+        return {
+            "Authorization": f"token {self.config['token']}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+
+    def _leaderboard_url(self):
+        return f"{self.api_url}/repos/{self.config['username']}/{self.config['repository']}/contents/{LEADERBOARD_FILE}"
+
+    @traced("download_leaderboard", "network")
+    def download_leaderboard(self):
+        """Download the current leaderboard, returns (sha, scores)
+
+        The cached ETag is sent as If-None-Match: an unchanged leaderboard
+        costs a 304 with no body and the cached scores are reused as-is.
+        Only a 404 means "no file yet" (None, []); any other failure raises
+        DownloadError.
+        """
+        sha = None
+        existing_scores = []
+        cached = self.cache.load()
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        get_response = self._request("GET", self._leaderboard_url(), headers=headers, timeout=10)
+        try:
+            if get_response.status_code == 304:
+                self.cache.touch()
+                sha = cached["sha"]
+                existing_scores = cached["scores"]
+                print(f"📥 Leaderboard unchanged ({len(existing_scores)} cached scores)")
+            elif get_response.status_code == 200:
+                response_data = get_response.json()
+                sha = response_data.get('sha')
+
+                # Decode existing content
+                existing_content = base64.b64decode(response_data['content']).decode('utf-8')
+                existing_data = json.loads(existing_content)
+                existing_scores = existing_data.get('scores', [])
+                self.cache.store(get_response.headers.get("ETag"), sha, existing_scores)
+                print(f"📥 Downloaded {len(existing_scores)} existing scores from GitHub")
+            elif get_response.status_code == 404:
+                print("📥 No leaderboard file yet")
+            else:
+                raise DownloadError(f"Download failed: HTTP {get_response.status_code}", is_retryable(get_response))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            # Malformed body (bad JSON or base64): never replace the remote board with ours
+            raise DownloadError(f"Unreadable leaderboard: {e}", True)
+        return sha, existing_scores
+
+    @traced("upload_leaderboard", "network")
+    def upload_leaderboard(self, new_score_data):
+        """Upload leaderboard data to GitHub repository with merge support
+
+        Returns (success, message, retryable): retryable is False when only a
+        config change can fix the error (missing token, HTTP 401/403/404).
+        """
+        if HAS_REQUESTS:
+            self.resolve_token()
+        if not self.is_configured():
+            return False, "Not configured", False
+        if not self.config.get("auto_upload", False):
+            # Only switched off: scores stay queued and go out once it is back on, whatever turns it on
+            return False, "Auto-upload disabled", True
+        import requests
+
+        if 'scores' in new_score_data:
+            new_scores = new_score_data['scores']
+        else:
+            # Handle single score format
+            new_scores = [new_score_data]
+
+        try:
+            for attempt in range(self.max_conflict_retries + 1):
+                # Step 1: Download existing leaderboard
+                sha, existing_scores = self.download_leaderboard()
+
+                # Step 2: Merge new score(s) with existing scores (top 250, deduplicated)
+                merged_scores = merge_leaderboard(existing_scores, new_scores, LEADERBOARD_LIMIT)
+
+                # Step 3: Prepare merged data
+                merged_data = build_leaderboard_data(merged_scores)
+
+                print(f"📊 Merged leaderboard: {len(merged_scores)} total scores")
+
+                # Step 4: Encode and upload
+                json_content = dump_leaderboard(merged_data)
+                content_encoded = base64.b64encode(json_content.encode('utf-8')).decode('utf-8')
+
+                payload = {
+                    "message": f"Update leaderboard - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {len(merged_scores)} scores",
+                    "content": content_encoded,
+                    "committer": {
+                        "name": "Cosmic Defender",
+                        "email": "cosmic-defender@game.local"
+                    }
+                }
+
+                if sha:
+                    payload["sha"] = sha
+
+                # Upload the merged file
+                response = self._request("PUT", self._leaderboard_url(), json=payload, timeout=30)
+
+                if response.status_code in [200, 201]:
+                    # Our upload is now the remote copy; the next GET has no ETag to revalidate
+                    new_sha = response.json().get("content", {}).get("sha")
+                    self.cache.store(None, new_sha, merged_scores)
+                    return True, f"Upload successful - {len(merged_scores)} scores", False
+                elif response.status_code in [409, 422] and attempt < self.max_conflict_retries:
+                    # Someone else updated the file since our download (stale sha): merge again
+                    print(f"⚠ Leaderboard changed during upload (HTTP {response.status_code}), merging again...")
+                    continue
+                else:
+                    return False, f"Upload failed: HTTP {response.status_code}", is_retryable(response)
+
+        except DownloadError as e:
+            return False, str(e), e.retryable
+        except requests.exceptions.Timeout:
+            return False, "Upload timeout", True
+        except requests.exceptions.ConnectionError:
+            return False, "No internet connection", True
+        except Exception as e:
+            return False, f"Upload error: {str(e)}", True
+
+    def upload_async(self, leaderboard_data):
+        """Queue leaderboard data in the persistent outbox, uploaded in the background"""
+        if self.is_configured() and self.config.get("auto_upload", False):
+            for score in leaderboard_data.get('scores', [leaderboard_data]):
+                self.outbox.enqueue(score)
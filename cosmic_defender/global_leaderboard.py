@@ -0,0 +1,103 @@
+"""
+Leaderboard mondial affiché dans le jeu
+La copie locale (global_leaderboard_cache.json) est affichée immédiatement ;
+le rafraîchissement se fait dans un thread, jamais dans la boucle de jeu.
+"""
+import threading
+import time
+
+from .background_tasks import BackgroundTask
+from .leaderboard_cache import LeaderboardCache
+from .trace import traced
+
+# Same public file as the web page (web/script.js), no token needed
+GLOBAL_LEADERBOARD_URL = "https://raw.githubusercontent.com/fabyan09/cosmic-defender-leaderboard/main/cosmic_defender_leaderboard.json"
+
+
+class GlobalLeaderboard:
+    """Cached copy of the public leaderboard, refreshed in the background"""
+
+    def __init__(self, url=GLOBAL_LEADERBOARD_URL, cache=None, session=None, max_age=60.0):
+        self.url = url
+        self.cache = cache or LeaderboardCache("global_leaderboard_cache.json")
+        self.session = session
+        self.max_age = max_age
+
+        self.status = "idle"  # idle, loading, ok, error
+        self.error = None
+        self._task = None
+        self._lock = threading.Lock()
+
+    def scores(self):
+        cached = self.cache.load()
+        return cached["scores"] if cached else []
+
+    def last_updated(self):
+        """Time of the last successful fetch (epoch seconds) or None"""
+        cached = self.cache.load()
+        return cached["fetched_at"] if cached else None
+
+    def is_loading(self):
+        return self.status == "loading"
+
+    def refresh(self, force=False):
+        """Start a background fetch unless one is running or the cache is fresh
+
+        Returns immediately; the game keeps drawing the cached copy meanwhile.
+        """
+        with self._lock:
+            if self._task and self._task.is_pending():
+                return False
+            fetched_at = self.last_updated()
+            if not force and fetched_at and time.time() - fetched_at < self.max_age:
+                return False
+            self.status = "loading"
+            self._task = BackgroundTask(self._fetch)
+            return True
+
+    def wait(self, timeout=None):
+        """Wait for the current fetch to finish (tools and tests only)"""
+        if self._task:
+            self._task.wait(timeout)
+
+    @traced("global leaderboard fetch", "network")
+    def _fetch(self):
+        # Runs on the background executor; imported here so the network stack
+        # never loads on the game thread
+        try:
+            import requests
+        except ImportError:
+            self.error = "Module 'requests' missing"
+            self.status = "error"
+            return
+
+        try:
+            if self.session is None:
+                self.session = requests.Session()
+
+            cached = self.cache.load()
+            headers = {}
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+
+            response = self.session.get(self.url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                self.cache.touch()
+            elif response.status_code == 200:
+                scores = response.json().get("scores", [])
+                self.cache.store(response.headers.get("ETag"), None, scores)
+            else:
+                self.error = f"HTTP {response.status_code}"
+                self.status = "error"
+                return
+            self.error = None
+            self.status = "ok"
+        except requests.exceptions.Timeout:
+            self.error = "Connection timeout"
+            self.status = "error"
+        except requests.exceptions.ConnectionError:
+            self.error = "No internet connection"
+            self.status = "error"
+        except Exception as e:
+            self.error = f"Error: {str(e)}"
+            self.status = "error"
@@ -0,0 +1,176 @@
+"""
+Détecteur de saccades (frames longues)
+Chaque frame dont le temps de travail dépasse le budget est enregistrée avec
+ses temps par sous-système, les événements notés pendant la frame (apparition
+du Giga Boss, premier bonus, sauvegarde des scores, vibration...), les pauses
+du GC (mesurées par gc_policy) et des piles Python échantillonnées par un thread pendant la frame.
+Les saccades vont dans un journal JSON lines tournant ; un résumé des
+causes principales est affiché en fin de session (launch.py --hitch-log).
+"""
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+
+from .background_tasks import DaemonExecutor
+from .gc_policy import gc_policy
+
+BUDGET_MS = 33.3  # Two 60 FPS frames
+MAX_ENTRIES = 200  # Hitches kept in memory and in the log file
+SAMPLE_INTERVAL = 0.004  # Seconds between stack samples of the game thread
+STACK_DEPTH = 8  # Innermost frames kept per sample
+TOP_STACKS = 3
+
+
+class HitchDetector:
+    """Flags frames over budget and records what they were doing; a no-op until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.budget_ms = BUDGET_MS
+        self.log_path = None
+        self.hitches = deque(maxlen=MAX_ENTRIES)
+        self.frames = 0
+        self.origin = None
+        self.notes = []  # Labels noted during the current frame
+        self.gc_mark = 0  # gc_policy.pause_count when the frame started
+        self.frame_start = 0.0
+        self._samples = deque(maxlen=2000)  # (perf_counter, stack)
+        self._sampler = None
+        self._stop = threading.Event()
+        self._thread_id = None
+        self._writer = None
+        self._written = 0
+
+    def enable(self, budget_ms=BUDGET_MS, log_path=None, sample_stacks=True):
+        self.enabled = True
+        self.budget_ms = budget_ms
+        self.log_path = log_path
+        self.origin = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        gc_policy.install()
+        if log_path:
+            self._writer = DaemonExecutor(max_workers=1, name="hitch-log")
+            self._writer.submit(trim_log, log_path, MAX_ENTRIES)
+        if sample_stacks:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name="hitch-sampler", daemon=True)
+            self._sampler.start()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._stop.set()
+
+    def note(self, label):
+        """Mark something that happened during this frame (possible hitch source)"""
+        if self.enabled:
+            self.notes.append(label)
+
+    def begin_frame(self):
+        if self.enabled:
+            self.notes = []
+            self.gc_mark = gc_policy.pause_count
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self, game, frame_ms):
+        """Record the frame if it went over budget; returns the hitch entry or None"""
+        if not self.enabled:
+            return None
+        self.frames += 1
+        if frame_ms <= self.budget_ms:
+            return None
+
+        stacks = Counter(stack for when, stack in list(self._samples) if when >= self.frame_start)
+        hitch = {
+            "frame": game.frame_count,
+            "time": round(time.perf_counter() - self.origin, 3),
+            "frame_ms": round(frame_ms, 3),
+            "budget_ms": self.budget_ms,
+            "state": game.state.name,
+            "wave": game.wave,
+            "sections": {section: round(ms, 3) for section, ms in game.frame_stats.current.items()},
+            "notes": list(self.notes),
+            "gc": {
+                "pauses": [{"generation": generation, "ms": round(ms, 3), "reason": reason}
+                           for generation, ms, _, reason in gc_policy.pauses_since(self.gc_mark)],
+                "counts": gc.get_count(),
+                "collections": [stats["collections"] for stats in gc.get_stats()],
+            },
+            "counts": {
+                "bullets": len(game.bullets),
+                "enemy_bullets": len(game.enemy_bullets),
+                "enemies": len(game.enemies),
+                "particles": len(game.particles),
+                "power_ups": len(game.power_ups),
+            },
+            "stacks": [{"samples": count, "stack": list(stack)} for stack, count in stacks.most_common(TOP_STACKS)],
+        }
+        hitch["source"] = hitch_source(hitch)
+        self.hitches.append(hitch)
+        if self._writer:
+            # Written by a background thread: the log must not cause hitches itself
+            self._writer.submit(append_log, self.log_path, hitch)
+            self._written += 1
+            if self._written % MAX_ENTRIES == 0:
+                self._writer.submit(trim_log, self.log_path, MAX_ENTRIES)
+        return hitch
+
+    def summary(self, top=10):
+        """Top hitch sources of the session"""
+        if not self.hitches:
+            return f"✅ Aucune frame au-delà de {self.budget_ms:.1f} ms sur {self.frames} frames"
+        by_source = {}
+        for hitch in self.hitches:
+            count, worst, total = by_source.get(hitch["source"], (0, 0.0, 0.0))
+            by_source[hitch["source"]] = (count + 1, max(worst, hitch["frame_ms"]), total + hitch["frame_ms"])
+        lines = [f"⚠️ {len(self.hitches)} frame(s) au-delà de {self.budget_ms:.1f} ms sur {self.frames} frames",
+                 f"  {'source':<32}{'count':>6}{'worst (ms)':>12}{'total (ms)':>12}"]
+        for source, (count, worst, total) in sorted(by_source.items(), key=lambda item: -item[1][2])[:top]:
+            lines.append(f"  {source:<32}{count:>6}{worst:>12.1f}{total:>12.1f}")
+        return "\n".join(lines)
+
+    def _sample_loop(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame, limit=STACK_DEPTH)
+            self._samples.append((time.perf_counter(), tuple(
+                f"{os.path.basename(entry.filename)}:{entry.lineno} {entry.name}" for entry in reversed(stack))))
+
+
+def hitch_source(hitch):
+    """What most likely caused the hitch: a noted event, a GC pause, else the slowest section"""
+    if hitch["notes"]:
+        return hitch["notes"][0]
+    pauses = hitch["gc"]["pauses"]
+    if pauses and sum(pause["ms"] for pause in pauses) > hitch["frame_ms"] / 2:
+        reasons = [pause["reason"] for pause in pauses if pause["reason"]]
+        return f"gc {reasons[0]}" if reasons else f"gc gen{max(pause['generation'] for pause in pauses)}"
+    return "section " + max(hitch["sections"], key=hitch["sections"].get)
+
+
+def append_log(path, hitch):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(hitch) + "\n")
+
+
+def trim_log(path, max_entries):
+    """Keep only the last `max_entries` lines of the log"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return
+    if len(lines) > max_entries:
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(lines[-max_entries:])
+
+
+hitch_detector = HitchDetector()
@@ -0,0 +1,66 @@
+"""
+Cache disque du leaderboard GitHub
+Garde l'ETag, le sha et les scores du dernier téléchargement pour que les
+requêtes conditionnelles (If-None-Match) n'aient rien à re-décoder sur un 304
+"""
+import json
+import os
+import threading
+import time
+
+
+class LeaderboardCache:
+    """Last known copy of the remote leaderboard, persisted to a JSON file"""
+
+    def __init__(self, path="leaderboard_cache.json"):
+        self.path = path
+        self._data = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Cached entry {etag, sha, scores, fetched_at} or None (fetched_at is the file mtime)"""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._data = json.load(f)
+                    self._data["fetched_at"] = os.path.getmtime(self.path)
+                except (OSError, ValueError):
+                    self._data = None
+            return self._data
+
+    def store(self, etag, sha, scores):
+        """Replace the cached copy (in memory and on disk)"""
+        data = {
+            "etag": etag,
+            "sha": sha,
+            "scores": scores
+        }
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Error saving leaderboard cache: {e}")
+            data["fetched_at"] = time.time()
+            self._data = data
+            self._loaded = True
+        return data
+
+    def touch(self):
+        """Mark the cached copy as confirmed up to date (after a 304)
+
+        Only the file mtime changes: the scores are neither decoded nor rewritten.
+        """
+        with self._lock:
+            if self._data is None:
+                return
+            self._data["fetched_at"] = time.time()
+            try:
+                os.utime(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,141 @@
+"""
+Fusion des leaderboards Cosmic Defender
+Merge top-K en streaming (heap borné) avec déduplication, partagé par le jeu
+et par le workflow GitHub Actions (.github/workflows/update-leaderboard.yml)
+"""
+import heapq
+import json
+from datetime import datetime
+
+DEFAULT_LIMIT = 250
+
+
+def score_of(entry):
+    """Score used for ranking (missing score counts as 0)"""
+    return entry.get('score', 0)
+
+
+def dedupe_key(entry):
+    """Identity of a score entry: (player_id, timestamp)
+
+    Old local entries have no timestamp, so they fall back to name/score/date
+    instead of all collapsing onto the same (None, '') key.
+    """
+    timestamp = entry.get('timestamp')
+    if timestamp:
+        return (entry.get('player_id'), timestamp)
+    return (entry.get('player_id'), entry.get('name'), entry.get('score'), entry.get('date'))
+
+
+def is_sorted(scores):
+    """True if scores are already in descending score order"""
+    return all(score_of(scores[i]) >= score_of(scores[i + 1]) for i in range(len(scores) - 1))
+
+
+def top_k(scores, limit=DEFAULT_LIMIT):
+    """Keep the best `limit` unique scores of an unsorted iterable
+
+    Uses a min-heap of at most `limit` entries, so memory stays bounded no
+    matter how many scores are streamed in. On equal scores the entry seen
+    first wins, like a stable sort would.
+    """
+    if limit <= 0:
+        return []
+
+    heap = []  # (score, -arrival, key, entry); heap[0] is the weakest kept entry
+    kept = set()
+    floor = None  # score of heap[0] once the heap is full
+
+    for arrival, entry in enumerate(scores):
+        score = entry.get('score', 0)
+        # Fast path: most entries of a big input can't make the cut
+        if floor is not None and score <= floor:
+            continue
+        key = dedupe_key(entry)
+        if key in kept:
+            continue
+        kept.add(key)
+        if len(heap) < limit:
+            heapq.heappush(heap, (score, -arrival, key, entry))
+            if len(heap) == limit:
+                floor = heap[0][0]
+        else:
+            evicted = heapq.heapreplace(heap, (score, -arrival, key, entry))
+            kept.discard(evicted[2])
+            floor = heap[0][0]
+
+    heap.sort(reverse=True)
+    return [item[3] for item in heap]
+
+
+def merge_sorted_runs(runs, limit=DEFAULT_LIMIT):
+    """Merge runs already sorted by descending score, keeping `limit` unique scores
+
+    heapq.merge only holds one entry per run, and iteration stops as soon as
+    `limit` scores are kept, so the tail of every run is never touched.
+    """
+    merged = []
+    seen = set()
+    if limit <= 0:
+        return merged
+
+    for entry in heapq.merge(*runs, key=score_of, reverse=True):
+        key = dedupe_key(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(entry)
+        if len(merged) >= limit:
+            break
+    return merged
+
+
+def _as_run(scores, limit):
+    """Turn any score list into a sorted run no longer than it needs to be"""
+    if isinstance(scores, list) and is_sorted(scores):
+        return scores
+    return top_k(scores, limit)
+
+
+def merge_leaderboard(existing_scores, new_scores, limit=DEFAULT_LIMIT, per_mode_limit=None):
+    """Merge new scores into an existing leaderboard
+
+    `existing_scores` is normally the leaderboard downloaded from GitHub
+    (already sorted), `new_scores` the freshly played scores in any order.
+    With `per_mode_limit`, every mode keeps its own top-K before the overall
+    `limit` is applied, so infinite mode scores can't push campaign scores
+    out of the board.
+    """
+    if per_mode_limit is None:
+        return merge_sorted_runs([_as_run(existing_scores, limit), _as_run(new_scores, limit)], limit)
+
+    existing_by_mode = _split_by_mode(existing_scores)
+    new_by_mode = _split_by_mode(new_scores)
+    modes = list(existing_by_mode) + [mode for mode in new_by_mode if mode not in existing_by_mode]
+    mode_runs = [
+        merge_leaderboard(existing_by_mode.get(mode, []), new_by_mode.get(mode, []), per_mode_limit)
+        for mode in modes
+    ]
+    return merge_sorted_runs(mode_runs, limit)
+
+
+def _split_by_mode(scores):
+    """Split scores by game mode, keeping their relative order"""
+    by_mode = {}
+    for entry in scores:
+        by_mode.setdefault(entry.get('mode', 'normal'), []).append(entry)
+    return by_mode
+
+
+def build_leaderboard_data(scores):
+    """Wrap merged scores in the format read by web/script.js"""
+    return {
+        "last_updated": datetime.now().isoformat(),
+        "total_scores": len(scores),
+        "scores": scores
+    }
+
+
+def dump_leaderboard(data):
+    """Compact JSON for upload (the web page does not need indentation)"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
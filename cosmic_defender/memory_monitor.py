@@ -0,0 +1,137 @@
+"""
+Suivi de la mémoire par vague
+À chaque changement de vague (juste après la collecte du GC), un instantané
+tracemalloc est comparé au précédent : mémoire Python suivie, RSS du
+processus, surfaces en cache, entités vivantes et sites d'allocation qui
+grossissent le plus. Désactivé par défaut (tracemalloc ralentit chaque
+allocation) : launch.py --memory-report, ou benchmarks/soak_memory.py.
+"""
+import importlib.util
+import os
+import tracemalloc
+
+from . import assets
+from .hitch_detector import hitch_detector
+
+# Optional: current RSS outside Linux (/proc) needs psutil
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+TRACE_FRAMES = 1  # Stack depth per allocation: the line is enough to find the site
+TOP_SITES = 10
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),  # The monitor's own history
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def rss_bytes():
+    """Resident set size of the process, None when it cannot be read"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if HAS_PSUTIL:
+        import psutil
+        return psutil.Process().memory_info().rss
+    return None
+
+
+def growing_sites(snapshot, previous, top=TOP_SITES):
+    """[(file:line, size diff in bytes, count diff)] of the allocation sites that grew most"""
+    sites = []
+    for stat in snapshot.compare_to(previous, "lineno"):
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        sites.append((f"{os.path.basename(frame.filename)}:{frame.lineno}", stat.size_diff, stat.count_diff))
+        if len(sites) == top:
+            break
+    return sites
+
+
+class MemoryMonitor:
+    """tracemalloc snapshots diffed at each wave transition, a no-op until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.waves = []  # One entry per wave transition
+        self.first = None  # Snapshot at enable(), for the whole-session diff
+        self.previous = None
+        self.top = TOP_SITES
+
+    def enable(self, top=TOP_SITES):
+        self.enabled = True
+        self.top = top
+        self.waves = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        self.first = self.previous = self.snapshot()
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            tracemalloc.stop()
+            self.first = self.previous = None
+
+    def snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    def on_wave(self, game):
+        """Wave transition: snapshot, diff with the previous one; returns the entry or None"""
+        if not self.enabled:
+            return None
+        hitch_detector.note("memory snapshot")
+        snapshot = self.snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+        entry = {
+            "wave": game.wave,
+            "frame": game.frame_count,
+            "traced": traced,
+            "peak": peak,
+            "rss": rss_bytes(),
+            "surfaces": assets.surface_counts(),
+            "entities": {
+                "bullets": len(game.bullets),
+                "enemy_bullets": len(game.enemy_bullets),
+                "enemies": len(game.enemies),
+                "particles": len(game.particles),
+                "power_ups": len(game.power_ups),
+                "player_trail": len(game.player.trail),
+            },
+            "top": growing_sites(snapshot, self.previous, self.top),
+        }
+        self.previous = snapshot
+        self.waves.append(entry)
+        return entry
+
+    def growth(self, waves=None, key="traced"):
+        """Bytes gained over the last `waves` transitions (all of them by default)"""
+        entries = [entry for entry in self.waves if entry[key] is not None]
+        if len(entries) < 2:
+            return 0
+        start = entries[0] if waves is None or waves >= len(entries) else entries[-1 - waves]
+        return entries[-1][key] - start[key]
+
+    def report(self):
+        if not self.waves:
+            return "🧠 Mémoire : aucune vague terminée"
+        lines = ["🧠 Mémoire par vague",
+                 f"  {'wave':>5}{'traced (KB)':>13}{'rss (MB)':>10}{'sprites':>9}{'particles':>11}  top growth"]
+        for entry in self.waves:
+            rss = f"{entry['rss'] / 2 ** 20:.1f}" if entry["rss"] is not None else "?"
+            top = f"{entry['top'][0][0]} +{entry['top'][0][1] / 1024:.1f} KB" if entry["top"] else "-"
+            lines.append(f"  {entry['wave']:>5}{entry['traced'] / 1024:>13.1f}{rss:>10}"
+                         f"{entry['surfaces']['sprites']:>9}{entry['entities']['particles']:>11}  {top}")
+        if self.first is not None and self.previous is not None:
+            lines.append("  Sites qui ont le plus grossi depuis le début :")
+            for site, size_diff, count_diff in growing_sites(self.previous, self.first, self.top):
+                lines.append(f"    {site:<40}{size_diff / 1024:>+10.1f} KB{count_diff:>+8} blocs")
+        return "\n".join(lines)
+
+
+# Shared instance, enabled by launch.py --memory-report and the soak test
+memory_monitor = MemoryMonitor()
@@ -0,0 +1,151 @@
+"""
+Sauvegardes locales : scores, scores web, contrôles et identifiant joueur
+"""
+import pygame
+import json
+import os
+from datetime import datetime
+
+from .hitch_detector import hitch_detector
+from .trace import traced
+
+
+
+
+@traced("load_scores", "io")
+def load_scores(game):
+    try:
+        if os.path.exists(game.scores_file):
+            with open(game.scores_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except:
+        pass
+    return []
+
+
+@traced("save_score", "io")
+def save_score(game, name, score, wave, mode="normal"):
+    hitch_detector.note("save_score")
+    scores = game.load_scores()
+    new_score = {
+        "name": name,
+        "score": score,
+        "wave": wave,
+        "mode": mode,
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M")
+    }
+    scores.append(new_score)
+    scores.sort(key=lambda x: x["score"], reverse=True)
+    scores = scores[:20]  # Keep top 20 to accommodate both modes
+
+    try:
+        with open(game.scores_file, 'w', encoding='utf-8') as f:
+            json.dump(scores, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"Error saving scores: {e}")
+
+
+def get_top_scores(game):
+    return game.load_scores()[:10]
+
+
+def get_or_create_player_id(game):
+    # uuid pulls in platform (a few ms), only needed on first launch
+    import uuid
+    id_file = "player_id.txt"
+    try:
+        if os.path.exists(id_file):
+            with open(id_file, 'r') as f:
+                return f.read().strip()
+        else:
+            player_id = str(uuid.uuid4())
+            with open(id_file, 'w') as f:
+                f.write(player_id)
+            return player_id
+    except:
+        return str(uuid.uuid4())
+
+
+def load_controls(game):
+    """Load control settings from file or return defaults"""
+    default_controls = {
+        "up": [pygame.K_w, pygame.K_UP],
+        "down": [pygame.K_s, pygame.K_DOWN],
+        "left": [pygame.K_a, pygame.K_LEFT],
+        "right": [pygame.K_d, pygame.K_RIGHT],
+        "shoot": [pygame.K_SPACE],
+        "pause": [pygame.K_ESCAPE]
+    }
+    try:
+        if os.path.exists("controls.json"):
+            with open("controls.json", 'r') as f:
+                return json.load(f)
+    except:
+        pass
+    return default_controls
+
+
+def save_controls(game):
+    """Save control settings to file"""
+    try:
+        with open("controls.json", 'w') as f:
+            json.dump(game.controls, f, indent=2)
+    except Exception as e:
+        print(f"Error saving controls: {e}")
+
+
+@traced("save_web_score", "io")
+def save_web_score(game, name, score, wave, mode):
+    """Save score in web-compatible format to scores directory"""
+    hitch_detector.note("save_web_score")
+    web_score = {
+        "player_id": game.player_id,
+        "name": name,
+        "score": score,
+        "wave": wave,
+        "mode": mode,
+        "timestamp": datetime.now().isoformat(),
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M")
+    }
+
+    # Create scores directory if it doesn't exist
+    scores_dir = "scores"
+    os.makedirs(scores_dir, exist_ok=True)
+
+    # Save individual score file (for GitHub Actions to pick up)
+    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    score_filename = os.path.join(scores_dir, f"score_{game.player_id}_{timestamp_str}.json")
+
+    try:
+        with open(score_filename, 'w', encoding='utf-8') as f:
+            json.dump(web_score, f, ensure_ascii=False, indent=2)
+        print(f"✓ Score saved to {score_filename}")
+    except Exception as e:
+        print(f"Error saving score file: {e}")
+
+    # Also maintain local web_scores.json for backwards compatibility
+    web_scores = []
+    try:
+        if os.path.exists(game.web_scores_file):
+            with open(game.web_scores_file, 'r', encoding='utf-8') as f:
+                web_scores = json.load(f)
+    except:
+        pass
+
+    web_scores.append(web_score)
+    web_scores.sort(key=lambda x: x["score"], reverse=True)
+
+    try:
+        with open(game.web_scores_file, 'w', encoding='utf-8') as f:
+            json.dump(web_scores, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"Error saving web scores: {e}")
+
+    return web_score
+
+
+def export_for_github(game, single_score=None):
+    """Export scores in format ready for GitHub Pages (deprecated - now using GitHub Actions)"""
+    # This method is kept for backwards compatibility but no longer uploads directly
+    # Scores are now saved to scores/ directory and uploaded via GitHub Actions
+    pass
@@ -0,0 +1,101 @@
+"""
+Régulateur de qualité du rendu
+Mesure le temps de travail de chaque frame (hors attente de clock.tick) sur
+une fenêtre glissante et change de palier de qualité avec hystérésis :
+on descend vite quand le budget de 16,7 ms est dépassé, on remonte seulement
+après plusieurs secondes largement sous le budget.
+"""
+from collections import deque
+
+from .constants import FPS
+
+
+class QualityTier:
+    """Render settings for one quality level"""
+
+    def __init__(self, name, particle_scale, max_particles, bullet_trail, player_trail_interval,
+                 star_fraction, offscreen_indicators, shield_animation, screen_shake):
+        self.name = name
+        self.particle_scale = particle_scale  # Share of the particles an explosion spawns
+        self.max_particles = max_particles  # Live particles cap
+        self.bullet_trail = bullet_trail  # Enemy bullet trail length (positions)
+        self.player_trail_interval = player_trail_interval  # Multiplier of the player trail spawn period
+        self.star_fraction = star_fraction  # Share of the background stars drawn
+        self.offscreen_indicators = offscreen_indicators
+        self.shield_animation = shield_animation
+        self.screen_shake = screen_shake  # Full-window intermediate surface for the shake offset
+
+
+TIERS = [
+    QualityTier("high", 1.0, 400, 8, 1, 1.0, True, True, True),
+    QualityTier("medium", 0.6, 200, 5, 2, 0.6, True, True, True),
+    QualityTier("low", 0.3, 80, 2, 4, 0.3, False, False, False),
+]
+TIER_NAMES = [tier.name for tier in TIERS]
+
+BUDGET_MS = 1000 / FPS
+DOWNGRADE_RATIO = 0.9  # Step down when the rolling mean exceeds 90% of the budget
+UPGRADE_RATIO = 0.6  # Step up only when it stays under 60% ...
+UPGRADE_FRAMES = 180  # ... for this many frames (3 s at 60 FPS)
+MAX_UPGRADE_FRAMES = 1800  # Wait doubles each time a step up had to be undone
+WINDOW = 30  # Frames in the rolling mean
+
+
+class QualityGovernor:
+    """Picks the quality tier from the measured frame work time"""
+
+    def __init__(self, budget_ms=BUDGET_MS, window=WINDOW):
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.level = 0  # Index in TIERS, 0 = best
+        self.auto = True
+        self.calm_frames = 0
+        self.upgrade_frames = UPGRADE_FRAMES
+        self.last_change = None  # "up" / "down"
+
+    @property
+    def tier(self):
+        return TIERS[self.level]
+
+    def set_mode(self, mode):
+        """'auto' or a tier name (fixed quality)"""
+        self.auto = mode == "auto"
+        self.level = 0 if self.auto else TIER_NAMES.index(mode)
+        self.upgrade_frames = UPGRADE_FRAMES
+        self.last_change = None
+        self.reset()
+
+    def reset(self):
+        self.samples.clear()
+        self.calm_frames = 0
+
+    def mean_ms(self):
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def record(self, frame_ms):
+        """Add one frame's work time; returns True when the tier changed"""
+        if not self.auto:
+            return False
+        self.samples.append(frame_ms)
+        mean = self.mean_ms()
+
+        if len(self.samples) == self.samples.maxlen and mean > self.budget_ms * DOWNGRADE_RATIO:
+            if self.level < len(TIERS) - 1:
+                if self.last_change == "up":
+                    self.upgrade_frames = min(self.upgrade_frames * 2, MAX_UPGRADE_FRAMES)
+                self.level += 1
+                self.last_change = "down"
+                self.reset()
+                return True
+            return False
+
+        self.calm_frames = self.calm_frames + 1 if mean < self.budget_ms * UPGRADE_RATIO else 0
+        if self.calm_frames >= self.upgrade_frames and self.level > 0:
+            self.level -= 1
+            self.last_change = "up"
+            self.reset()
+            return True
+        return False
+
+
+quality_governor = QualityGovernor()
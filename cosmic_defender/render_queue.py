@@ -0,0 +1,74 @@
+"""
+File de rendu des entités
+Pendant la frame, les entités déposent leurs sprites (surface, position) par
+couche ; à la fin, chaque couche part en un seul appel Surface.blits au lieu
+d'un blit Python -> SDL par entité. Les formes qui ne sont pas des sprites
+(barres de vie, etc.) sont dessinées juste après les sprites de leur couche.
+Les entités entièrement hors de l'écran ne sont pas soumises (culling) ;
+leur simulation continue normalement.
+"""
+# Layers, drawn in this order
+LAYER_PLAYER = 0
+LAYER_BULLETS = 1
+LAYER_ENEMIES = 2
+LAYER_POWER_UPS = 3
+LAYER_PARTICLES = 4
+LAYER_OVERLAY = 5  # Health and cooldown bars, above every sprite
+LAYER_COUNT = 6
+
+
+class RenderQueue:
+    """Sprites and shapes collected during a frame, submitted layer by layer"""
+
+    def __init__(self):
+        self.sprites = [[] for _ in range(LAYER_COUNT)]  # per layer: [(surface, (x, y))]
+        self.shapes = [[] for _ in range(LAYER_COUNT)]  # per layer: [(draw function, args)]
+        self.width = self.height = 0  # Viewport, set by begin()
+        self.drawn = 0  # Entities submitted / skipped this frame (culling)
+        self.culled = 0
+
+    def begin(self, width, height):
+        """Start a frame drawn on a width x height surface"""
+        self.width = width
+        self.height = height
+        self.drawn = 0
+        self.culled = 0
+
+    def visible(self, x, y, half_width, half_height):
+        """True if a box centered on (x, y) touches the viewport; counts drawn and culled"""
+        if x + half_width < 0 or x - half_width > self.width or y + half_height < 0 or y - half_height > self.height:
+            self.culled += 1
+            return False
+        self.drawn += 1
+        return True
+
+    def blit(self, layer, surface, center):
+        """Queue `surface` centered on `center`"""
+        width, height = surface.get_size()
+        self.sprites[layer].append((surface, (int(center[0]) - width // 2, int(center[1]) - height // 2)))
+
+    def blit_all(self, layer, surfaces, centers):
+        """Queue surfaces[i] centered on centers[i]"""
+        self.sprites[layer].extend(
+            (surface, (int(x) - surface.get_width() // 2, int(y) - surface.get_height() // 2))
+            for surface, (x, y) in zip(surfaces, centers))
+
+    def blit_at(self, layer, surface, topleft):
+        self.sprites[layer].append((surface, topleft))
+
+    def draw(self, layer, function, *args):
+        """Queue a pygame.draw call: function(target, *args)"""
+        self.shapes[layer].append((function, args))
+
+    def sprite_count(self):
+        return sum(len(sprites) for sprites in self.sprites)
+
+    def flush(self, target):
+        """Draw everything queued onto `target`, then empty the queue"""
+        for sprites, shapes in zip(self.sprites, self.shapes):
+            if sprites:
+                target.blits(sprites, doreturn=False)
+                sprites.clear()
+            for function, args in shapes:
+                function(target, *args)
+            shapes.clear()
@@ -0,0 +1,4 @@
+"""
+Écrans hors menu et jeu, importés au premier affichage
+Chaque fonction reçoit l'instance CosmicDefender (voir game.delegate)
+"""
@@ -0,0 +1,50 @@
+"""
+Écrans de fin de partie : game over, victoire, saisie du nom
+"""
+from ..constants import WHITE, RED, GREEN, YELLOW, CYAN
+
+
+def draw_game_over(game):
+    game_over_text = game.big_font.render("GAME OVER", True, RED)
+    score_text = game.font.render(f"Final Score: {game.score}", True, WHITE)
+    wave_text = game.font.render(f"Wave Reached: {game.wave}", True, WHITE)
+    mode_text = game.font.render(f"Mode: {game.game_mode.upper()}", True, YELLOW)
+    restart_text = game.font.render("Press S to save score, R to restart or ESC for menu", True, WHITE)
+
+    texts = [game_over_text, score_text, wave_text, mode_text, restart_text]
+    for i, text in enumerate(texts):
+        text_rect = text.get_rect(center=(game.current_width//2, game.current_height//2 - 80 + i * 40))
+        game.screen.blit(text, text_rect)
+
+
+def draw_victory(game):
+    victory_text = game.big_font.render("VICTORY!", True, GREEN)
+    score_text = game.font.render(f"Final Score: {game.score}", True, WHITE)
+    congrats_text = game.font.render("You saved Earth from invasion!", True, WHITE)
+    restart_text = game.font.render("Press S to save score, R to play again or ESC for menu", True, WHITE)
+
+    texts = [victory_text, score_text, congrats_text, restart_text]
+    for i, text in enumerate(texts):
+        text_rect = text.get_rect(center=(game.current_width//2, game.current_height//2 - 60 + i * 40))
+        game.screen.blit(text, text_rect)
+
+
+def draw_enter_name(game):
+    title = game.big_font.render("SAVE YOUR SCORE", True, WHITE)
+    instruction = game.font.render("Enter your name:", True, WHITE)
+
+    # Cursor blinking effect
+    show_cursor = (game.cursor_timer % 1.0) < 0.5
+    name_display = game.player_name + ("|" if show_cursor else "")
+    name_text = game.big_font.render(name_display, True, CYAN)
+    controls = game.font.render("ENTER to save, ESC to cancel", True, WHITE)
+
+    title_rect = title.get_rect(center=(game.current_width//2, game.current_height//2 - 100))
+    instruction_rect = instruction.get_rect(center=(game.current_width//2, game.current_height//2 - 40))
+    name_rect = name_text.get_rect(center=(game.current_width//2, game.current_height//2))
+    controls_rect = controls.get_rect(center=(game.current_width//2, game.current_height//2 + 60))
+
+    game.screen.blit(title, title_rect)
+    game.screen.blit(instruction, instruction_rect)
+    game.screen.blit(name_text, name_rect)
+    game.screen.blit(controls, controls_rect)
@@ -0,0 +1,248 @@
+"""
+Écran de configuration GitHub (test de connexion en arrière-plan)
+"""
+import pygame
+import math
+import time
+
+from ..constants import WHITE, RED, GREEN, BLUE, YELLOW, CYAN, GameState
+from ..background_tasks import BackgroundTask
+from ..github import HAS_REQUESTS
+
+
+def init_github_config(game):
+    """Initialize GitHub configuration interface"""
+    game.github_current_field = "username"  # username, repository, token
+    game.github_input_field = game.github_uploader.config.get("username", "") if game.github_uploader else ""
+    game.github_test_result = ""
+    game.github_show_password = False
+    game.github_test_task = None
+
+
+def handle_github_config_input(game, event):
+    """Handle input in GitHub configuration screen"""
+    if event.key == pygame.K_ESCAPE:
+        game.state = GameState.SETTINGS
+        return
+
+    if not game.github_uploader:
+        return
+
+    if event.key == pygame.K_TAB:
+        # Switch between fields
+        fields = ["username", "repository", "token"]
+        current_index = fields.index(game.github_current_field)
+        game.github_current_field = fields[(current_index + 1) % len(fields)]
+        # Load current value into input field
+        game.github_input_field = game.github_uploader.config.get(game.github_current_field) or ""
+    elif event.key == pygame.K_RETURN:
+        # Save current field and move to next
+        game.store_github_input()
+        fields = ["username", "repository", "token"]
+        current_index = fields.index(game.github_current_field)
+        if current_index < len(fields) - 1:
+            game.github_current_field = fields[current_index + 1]
+            game.github_input_field = game.github_uploader.config.get(game.github_current_field) or ""
+    elif event.key == pygame.K_BACKSPACE:
+        game.github_input_field = game.github_input_field[:-1]
+    # Commands on F-keys: every letter must reach the field being typed
+    elif event.key == pygame.K_F5:
+        # Test connection
+        game.test_github_connection()
+    elif event.key == pygame.K_F6:
+        # Save configuration
+        game.save_github_config()
+    elif event.key == pygame.K_F7:
+        # Toggle auto-upload
+        current_auto = game.github_uploader.config.get("auto_upload", False)
+        game.github_uploader.config["auto_upload"] = not current_auto
+        if not current_auto:
+            game.github_uploader.outbox.resume()  # Scores kept while it was off go out now
+    elif event.unicode.isprintable() and len(game.github_input_field) < 50:
+        game.github_input_field += event.unicode
+
+
+def store_github_input(game):
+    """Copy the edited field into the config (an empty token keeps the embedded one)"""
+    if game.github_current_field == "token" and not game.github_input_field:
+        return
+    game.github_uploader.config[game.github_current_field] = game.github_input_field
+
+
+def test_github_connection(game):
+    """Test GitHub connection"""
+    if not game.github_uploader:
+        game.github_test_result = "GitHub uploader not available"
+        return
+
+    # Save current input
+    game.store_github_input()
+
+    # Test connection in the background; poll_github_test picks up the result
+    if game.github_test_task and game.github_test_task.is_pending():
+        return
+    game.github_test_task = BackgroundTask(game.github_uploader.test_connection)
+    game.github_test_result = ""
+
+
+def poll_github_test(game):
+    """Called every frame on the config screen: collect a finished connection test"""
+    task = game.github_test_task
+    if task and not task.is_pending():
+        game.github_test_result = task.message
+        game.github_test_task = None
+
+
+def save_github_config(game):
+    """Save GitHub configuration"""
+    if not game.github_uploader:
+        return
+
+    # Save current input
+    game.store_github_input()
+
+    # Mark as configured if all required fields are filled
+    if game.github_uploader.is_configured():
+        game.github_uploader.config["configured"] = True
+    else:
+        game.github_uploader.config["configured"] = False
+
+    # Save to file
+    game.github_uploader.save_config()
+    game.github_test_result = "Configuration sauvegardée!"
+
+    # Refresh menu buttons to show new status
+    game.create_menu_buttons()
+
+
+def draw_github_config(game):
+    """Draw GitHub configuration screen"""
+    title = game.big_font.render("GITHUB CONFIGURATION", True, WHITE)
+    title_rect = title.get_rect(center=(game.current_width//2, 80))
+    game.screen.blit(title, title_rect)
+
+    if not HAS_REQUESTS:
+        error_text = game.font.render("Erreur: Module 'requests' requis pour GitHub", True, RED)
+        error_rect = error_text.get_rect(center=(game.current_width//2, 200))
+        game.screen.blit(error_text, error_rect)
+
+        back_text = game.font.render("Appuyez sur ESC pour retourner", True, WHITE)
+        back_rect = back_text.get_rect(center=(game.current_width//2, game.current_height - 100))
+        game.screen.blit(back_text, back_rect)
+        return
+
+    y_offset = 180
+    field_height = 60
+
+    # Instructions
+    instructions = [
+        "1. Créez un token GitHub dans Settings > Developer settings > Personal access tokens",
+        "2. Donnez les permissions 'repo' et 'contents:write'",
+        "3. Entrez vos informations ci-dessous:"
+    ]
+
+    for i, instruction in enumerate(instructions):
+        text = pygame.font.Font(None, 24).render(instruction, True, YELLOW)
+        game.screen.blit(text, (50, 120 + i * 25))
+
+    # Fields
+    fields = [
+        ("Username GitHub:", "username"),
+        ("Nom du repository:", "repository"),
+        ("Token d'accès:", "token")
+    ]
+
+    for i, (label, field_name) in enumerate(fields):
+        y = y_offset + i * field_height
+
+        # Label
+        label_text = game.font.render(label, True, WHITE)
+        game.screen.blit(label_text, (50, y))
+
+        # Input field
+        field_rect = pygame.Rect(250, y, 500, 40)
+        field_color = CYAN if game.github_current_field == field_name else WHITE
+
+        # Get field value
+        if hasattr(game.github_uploader, 'config'):
+            field_value = game.github_uploader.config.get(field_name, "")
+            if field_name == "token" and field_value is None:
+                field_value = "embedded"  # Not decrypted yet, shown masked
+        else:
+            field_value = ""
+
+        # Show current input or saved value
+        if game.github_current_field == field_name:
+            display_value = game.github_input_field
+        else:
+            display_value = field_value
+
+        # Hide token with asterisks
+        if field_name == "token" and display_value and not game.github_show_password:
+            display_value = "*" * min(len(display_value), 20)
+
+        pygame.draw.rect(game.screen, field_color, field_rect, 2)
+
+        if display_value:
+            value_text = game.font.render(display_value[:40], True, WHITE)
+            game.screen.blit(value_text, (field_rect.x + 10, field_rect.y + 10))
+
+        # Current field indicator
+        if game.github_current_field == field_name:
+            cursor_x = field_rect.x + 10 + len(display_value) * 12
+            pygame.draw.line(game.screen, CYAN, (cursor_x, field_rect.y + 5), (cursor_x, field_rect.y + 35), 2)
+
+    # Buttons
+    button_y = y_offset + len(fields) * field_height + 20
+
+    # Auto-upload checkbox
+    auto_upload_enabled = game.github_uploader and game.github_uploader.config.get("auto_upload", False)
+    checkbox_color = GREEN if auto_upload_enabled else WHITE
+    checkbox_text = "☑" if auto_upload_enabled else "☐"
+
+    checkbox_surface = game.font.render(f"{checkbox_text} Upload automatique", True, checkbox_color)
+    game.screen.blit(checkbox_surface, (50, button_y))
+
+    # Test connection button
+    test_rect = pygame.Rect(50, button_y + 50, 200, 40)
+    pygame.draw.rect(game.screen, GREEN, test_rect, 2)
+    test_text = game.font.render("TESTER", True, WHITE)
+    test_text_rect = test_text.get_rect(center=test_rect.center)
+    game.screen.blit(test_text, test_text_rect)
+
+    # Save button
+    save_rect = pygame.Rect(270, button_y + 50, 200, 40)
+    pygame.draw.rect(game.screen, BLUE, save_rect, 2)
+    save_text = game.font.render("SAUVEGARDER", True, WHITE)
+    save_text_rect = save_text.get_rect(center=save_rect.center)
+    game.screen.blit(save_text, save_text_rect)
+
+    # Connection test in progress
+    if game.github_test_task and game.github_test_task.is_pending():
+        game.draw_spinner(test_rect.right + 25, test_rect.centery, 12)
+        pending_text = game.font.render("Test en cours...", True, YELLOW)
+        game.screen.blit(pending_text, (50, button_y + 110))
+
+    # Test result
+    elif game.github_test_result:
+        result_color = GREEN if "successful" in game.github_test_result.lower() else RED
+        result_text = game.font.render(game.github_test_result, True, result_color)
+        game.screen.blit(result_text, (50, button_y + 110))
+
+    # Controls
+    controls = [
+        "TAB: Changer de champ | ENTER: Valider | ESC: Retour",
+        "F5: Tester connexion | F6: Sauvegarder | F7: Toggle auto-upload"
+    ]
+
+    for i, control in enumerate(controls):
+        text = pygame.font.Font(None, 24).render(control, True, WHITE)
+        game.screen.blit(text, (50, game.current_height - 80 + i * 25))
+
+
+def draw_spinner(game, x, y, radius, color=CYAN):
+    """Rotating arc showing a background operation is running"""
+    # time.monotonic: the pygame timer is not started without pygame.init()
+    angle = time.monotonic() * 2 * math.pi
+    rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+    pygame.draw.arc(game.screen, color, rect, angle, angle + math.pi * 1.5, 3)
@@ -0,0 +1,86 @@
+"""
+Écran du leaderboard (onglets local / mondial)
+"""
+import pygame
+import time
+from datetime import datetime
+
+from ..constants import WHITE, YELLOW, CYAN, ORANGE
+
+
+def draw_leaderboard(game):
+    title = game.big_font.render("LEADERBOARD", True, WHITE)
+    title_rect = title.get_rect(center=(game.current_width//2, 60))
+    game.screen.blit(title, title_rect)
+
+    # Tabs
+    for i, (tab, label) in enumerate([("local", "LOCAL"), ("global", "GLOBAL")]):
+        color = CYAN if game.leaderboard_tab == tab else (120, 120, 120)
+        tab_text = game.font.render(label, True, color)
+        tab_rect = tab_text.get_rect(center=(game.current_width//2 - 80 + i * 160, 110))
+        game.screen.blit(tab_text, tab_rect)
+        if game.leaderboard_tab == tab:
+            pygame.draw.line(game.screen, CYAN, tab_rect.bottomleft, tab_rect.bottomright, 2)
+
+    if game.leaderboard_tab == "global":
+        scores = game.global_leaderboard.scores()
+        game.draw_global_leaderboard_status()
+    else:
+        scores = game.get_top_scores()
+
+    if not scores:
+        if game.leaderboard_tab == "global" and game.global_leaderboard.is_loading():
+            message = "Loading global leaderboard..."
+        else:
+            message = "No scores yet!"
+        no_scores = game.font.render(message, True, WHITE)
+        no_scores_rect = no_scores.get_rect(center=(game.current_width//2, game.current_height//2))
+        game.screen.blit(no_scores, no_scores_rect)
+    else:
+        headers = ["#", "Name", "Score", "Wave", "Mode", "Date"]
+        header_y = 170
+        for i, header in enumerate(headers):
+            x_positions = [100, 200, 350, 450, 530, 620]
+            header_text = game.font.render(header, True, YELLOW)
+            game.screen.blit(header_text, (x_positions[i], header_y))
+
+        for i, score_data in enumerate(scores[:15]):
+            y = header_y + 40 + i * 25
+            rank = f"{i+1}"
+            name = score_data.get("name", "?")[:12]  # Limit name length
+            score = f"{score_data.get('score', 0)}"
+            wave = f"{score_data.get('wave', '-')}"
+            mode = score_data.get("mode", "normal")[:8]  # Backward compatibility
+            date = score_data.get("date", "")[:10]  # Show only date part
+
+            data = [rank, name, score, wave, mode, date]
+            for j, text_data in enumerate(data):
+                x_positions = [100, 200, 350, 450, 530, 620]
+                color = CYAN if i == 0 else WHITE  # Highlight first place
+                text = game.font.render(str(text_data), True, color)
+                game.screen.blit(text, (x_positions[j], y))
+
+    back_text = game.small_font.render("TAB: Local / Global | F5: Refresh | W: Web page | ESC: Menu", True, WHITE)
+    back_rect = back_text.get_rect(center=(game.current_width//2, game.current_height - 40))
+    game.screen.blit(back_text, back_rect)
+
+
+def draw_global_leaderboard_status(game):
+    """Last update stamp and refresh state of the global tab"""
+    board = game.global_leaderboard
+    fetched_at = board.last_updated()
+    if fetched_at:
+        stamp = datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M")
+        status = f"Last updated: {stamp}"
+    else:
+        status = "Never updated"
+    color = (180, 180, 180)
+    if board.is_loading():
+        dots = "." * (1 + int(time.monotonic() / 0.3) % 3)
+        status += f"  -  Refreshing{dots}"
+    elif board.status == "error":
+        status += f"  -  {board.error}"
+        color = ORANGE
+    status_text = game.small_font.render(status, True, color)
+    status_rect = status_text.get_rect(center=(game.current_width//2, 140))
+    game.screen.blit(status_text, status_rect)
@@ -0,0 +1,79 @@
+"""
+Menu pause
+"""
+import pygame
+
+from ..constants import BLACK, WHITE, GREEN, YELLOW, CYAN, ORANGE
+from ..ui import Button
+
+
+def draw_pause_menu(game):
+    # Draw semi-transparent overlay
+    overlay = pygame.Surface((game.current_width, game.current_height))
+    overlay.set_alpha(180)
+    overlay.fill(BLACK)
+    game.screen.blit(overlay, (0, 0))
+
+    # Title
+    title = game.big_font.render("PAUSED", True, CYAN)
+    title_rect = title.get_rect(center=(game.current_width//2, 80))
+    game.screen.blit(title, title_rect)
+
+    # Stats section
+    stats_y = 180
+    stats_title = game.font.render("CURRENT STATS", True, YELLOW)
+    game.screen.blit(stats_title, (game.current_width//2 - stats_title.get_width()//2, stats_y))
+
+    stats_y += 50
+    stats = [
+        f"Score: {game.score}",
+        f"Wave: {game.wave}",
+        f"Health: {game.player.health}/{game.player.max_health}",
+        f"Mode: {game.game_mode.upper()}",
+        f"Enemies Killed: {game.enemies_killed}",
+    ]
+
+    for stat in stats:
+        stat_text = game.font.render(stat, True, WHITE)
+        game.screen.blit(stat_text, (game.current_width//2 - stat_text.get_width()//2, stats_y))
+        stats_y += 35
+
+    # Controls section
+    controls_y = stats_y + 40
+    controls_title = game.font.render("CONTROLS", True, YELLOW)
+    game.screen.blit(controls_title, (game.current_width//2 - controls_title.get_width()//2, controls_y))
+
+    controls_y += 50
+    controls = [
+        "ARROW KEYS / WASD / LEFT STICK - Move",
+        "SPACE / MOUSE / R2 TRIGGER - Shoot",
+        "SHIFT / A BUTTON (Xbox) / X (PS) - Dash",
+        "F - Toggle Fullscreen",
+        "ESC / START - Pause / Resume",
+        "R - Quick Restart",
+    ]
+
+    for control in controls:
+        control_text = game.small_font.render(control, True, WHITE)
+        game.screen.blit(control_text, (game.current_width//2 - control_text.get_width()//2, controls_y))
+        controls_y += 30
+
+    # Create pause menu buttons if not created
+    if not game.pause_buttons:
+        button_width = 250
+        button_height = 50
+        center_x = game.current_width // 2
+        button_y = game.current_height - 150
+
+        game.pause_buttons = [
+            Button(center_x - 140, button_y, button_width, button_height, "RESUME (ESC)", game.font, color=GREEN),
+            Button(center_x + 140, button_y, button_width, button_height, "MAIN MENU", game.font, color=ORANGE)
+        ]
+
+    # Draw and update buttons
+    mouse_pos = game.mouse_pos()
+    mouse_clicked = pygame.mouse.get_pressed()[0]
+
+    for button in game.pause_buttons:
+        button.update(mouse_pos, mouse_clicked)
+        button.draw(game.screen)
@@ -0,0 +1,101 @@
+"""
+Overlay de performance (F3)
+FPS, courbe des temps de frame, temps par sous-système, nombre d'entités et
+pauses du ramasse-miettes.
+Le panneau texte n'est redessiné que quelques fois par seconde ; à chaque
+frame il ne reste qu'un blit et le tracé de la courbe.
+"""
+import pygame
+
+from ..constants import FPS, WHITE, GREEN, YELLOW, RED, CYAN
+from ..frame_stats import SECTIONS
+from ..gc_policy import gc_policy
+from ..quality import quality_governor
+
+PANEL_WIDTH = 250
+LINE_HEIGHT = 17
+GRAPH_HEIGHT = 50
+PANEL_REFRESH_FRAMES = 15  # Text re-rendered 4 times per second at 60 FPS
+BACKGROUND = (0, 0, 0, 170)
+BUDGET_MS = 1000 / FPS
+GRAPH_MAX_MS = 2 * BUDGET_MS
+
+_font = None
+
+
+def overlay_font():
+    global _font
+    if _font is None:
+        _font = pygame.font.Font(None, 20)
+    return _font
+
+
+def time_color(ms, budget):
+    if ms > budget:
+        return RED
+    if ms > budget * 0.75:
+        return YELLOW
+    return GREEN
+
+
+def build_panel(game):
+    """Text part of the overlay, rebuilt every PANEL_REFRESH_FRAMES frames"""
+    stats = game.frame_stats
+    font = overlay_font()
+    counts = [
+        ("bullets", len(game.bullets)),
+        ("enemy bullets", len(game.enemy_bullets)),
+        ("enemies", len(game.enemies) + (1 if game.giga_boss else 0)),
+        ("particles", len(game.particles)),
+        ("power-ups", len(game.power_ups)),
+        ("drawn / culled", f"{game.render_queue.drawn} / {game.render_queue.culled}"),
+        ("gc gen0 / 1 / 2", " / ".join(str(count) for count in gc_policy.collections)),
+        ("gc last / max", f"{gc_policy.last_ms():.2f} / {gc_policy.max_ms:.2f} ms"),
+    ]
+    height = 8 + LINE_HEIGHT * (4 + len(SECTIONS) + len(counts)) + GRAPH_HEIGHT + 16
+    panel = pygame.Surface((PANEL_WIDTH, height), pygame.SRCALPHA)
+    panel.fill(BACKGROUND)
+
+    def row(y, label, value, color=WHITE):
+        panel.blit(font.render(label, True, color), (8, y))
+        text = font.render(str(value), True, color)
+        panel.blit(text, (PANEL_WIDTH - 8 - text.get_width(), y))
+
+    average = stats.average_frame_ms()
+    y = 6
+    row(y, f"FPS {game.clock.get_fps():.0f}", f"{average:.2f} ms", time_color(average, BUDGET_MS))
+    y += LINE_HEIGHT
+    mode = "auto" if quality_governor.auto else "fixed"
+    row(y, "quality", f"{quality_governor.tier.name} ({mode})", CYAN)
+    y += LINE_HEIGHT
+    row(y, "gc", "gameplay" if gc_policy.managed else "default", CYAN)
+    y += LINE_HEIGHT + GRAPH_HEIGHT + 8  # The graph is drawn live in this gap
+
+    for section in SECTIONS:
+        ms = stats.averages[section]
+        row(y, section, f"{ms:.2f} ms", time_color(ms, BUDGET_MS / 4))
+        y += LINE_HEIGHT
+    y += LINE_HEIGHT // 2
+    for label, value in counts:
+        row(y, label, value)
+        y += LINE_HEIGHT
+    return panel
+
+
+def draw_perf_overlay(game):
+    if game.perf_panel is None or game.frame_count % PANEL_REFRESH_FRAMES == 0:
+        game.perf_panel = build_panel(game)
+    x = game.current_width - PANEL_WIDTH - 10
+    y = 130  # Below the score / wave HUD
+    game.screen.blit(game.perf_panel, (x, y))
+
+    # Frame time graph, updated every frame: one polyline plus the budget line
+    graph = pygame.Rect(x + 8, y + 6 + 3 * LINE_HEIGHT, PANEL_WIDTH - 16, GRAPH_HEIGHT)
+    budget_y = graph.bottom - int(BUDGET_MS / GRAPH_MAX_MS * graph.height)
+    pygame.draw.line(game.screen, YELLOW, (graph.left, budget_y), (graph.right, budget_y))
+    times = game.frame_stats.frame_times
+    if len(times) > 1:
+        step = graph.width / (times.maxlen - 1)
+        points = [(graph.left + i * step, graph.bottom - min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS * graph.height)
+                  for i, ms in enumerate(times)]
+        pygame.draw.lines(game.screen, GREEN, False, points)
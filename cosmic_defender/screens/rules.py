@@ -0,0 +1,192 @@
+"""
+Écran des règles (avec aperçu des ennemis)
+"""
+import pygame
+import math
+
+from .. import assets
+from ..constants import WHITE, RED, GREEN, YELLOW, CYAN, GameState
+from ..ui import Button
+
+# Enemy type -> (sheet, frame, frame count) shown on the rules page
+PREVIEW_SPRITES = {
+    "normal": ("assets/Enemies/Designs - Base/PNGs/Nairan - Fighter - Base.png", 0, 1),
+    "tank": ("assets/Enemies/Designs - Base/PNGs/Nairan - Frigate - Base.png", 0, 1),
+    "fast": ("assets/Enemies/Designs - Base/PNGs/Nairan - Scout - Base.png", 0, 1),
+    "boss": ("assets/Enemies/Weapons/PNGs/Nairan - Battlecruiser - Weapons.png", 0, 9),  # first frame
+    "gigaboss": ("assets/Enemies/Weapons/PNGs/Nairan - Dreadnought - Weapons.png", 0, 34),  # first frame
+}
+PREVIEW_SIZES = (30, 50)
+
+
+def draw_rules(game):
+    # Every preview is generated once, at fixed UI sizes (no-op once cached)
+    try:
+        assets.pregenerate_previews(PREVIEW_SPRITES.values(), PREVIEW_SIZES)
+    except (pygame.error, FileNotFoundError):
+        pass  # draw_enemy_preview falls back to shapes
+
+    # Title
+    title = game.big_font.render("RULES & ENEMIES", True, CYAN)
+    title_rect = title.get_rect(center=(game.current_width//2, 50))
+    game.screen.blit(title, title_rect)
+
+    # Game objective
+    objective_y = 110
+    objective = game.font.render("OBJECTIVE: Survive waves and destroy all enemies!", True, YELLOW)
+    game.screen.blit(objective, (game.current_width//2 - objective.get_width()//2, objective_y))
+
+    # Enemy types section
+    enemies_y = 170
+    enemies_title = game.font.render("ENEMY TYPES", True, YELLOW)
+    game.screen.blit(enemies_title, (50, enemies_y))
+
+    enemies_y += 50
+    enemy_data = [
+        {
+            "type": "normal",
+            "name": "FIGHTER",
+            "health": "1 HP",
+            "speed": "Medium (100)",
+            "points": "10",
+            "desc": "Standard Nairan fighter - shoots every 2s"
+        },
+        {
+            "type": "fast",
+            "name": "SCOUT",
+            "health": "1 HP",
+            "speed": "Fast (200)",
+            "points": "15",
+            "desc": "Quick Nairan interceptor - shoots every 1.5s"
+        },
+        {
+            "type": "tank",
+            "name": "FRIGATE",
+            "health": "3 HP",
+            "speed": "Slow (50)",
+            "points": "25",
+            "desc": "Heavily armored Nairan warship"
+        },
+        {
+            "type": "boss",
+            "name": "BATTLECRUISER",
+            "health": "20 HP",
+            "speed": "Medium (30)",
+            "points": "100",
+            "desc": "Animated Nairan capital ship - rapid fire (0.5s)"
+        },
+        {
+            "type": "gigaboss",
+            "name": "DREADNOUGHT",
+            "health": "50+ HP",
+            "speed": "Slow (20)",
+            "points": "500+",
+            "desc": "Massive Nairan flagship - appears every 10 waves"
+        }
+    ]
+
+    for i, enemy in enumerate(enemy_data):
+        y_pos = enemies_y + i * 90
+
+        # Draw enemy preview - larger size
+        game.draw_enemy_preview(game.screen, 90, y_pos + 20, enemy["type"], 50)
+
+        # Enemy name
+        name_text = game.font.render(enemy["name"], True, CYAN)
+        game.screen.blit(name_text, (150, y_pos - 5))
+
+        # Stats
+        stats_text = game.small_font.render(
+            f"HP: {enemy['health']}  |  Speed: {enemy['speed']}  |  Points: {enemy['points']}",
+            True, WHITE
+        )
+        game.screen.blit(stats_text, (150, y_pos + 25))
+
+        # Description
+        desc_text = game.small_font.render(enemy["desc"], True, (180, 180, 180))
+        game.screen.blit(desc_text, (150, y_pos + 48))
+
+    # Power-ups section
+    powerups_y = enemies_y + len(enemy_data) * 90 + 20
+    if powerups_y < game.current_height - 180:
+        powerups_title = game.font.render("POWER-UPS", True, YELLOW)
+        game.screen.blit(powerups_title, (50, powerups_y))
+
+        powerups_y += 35
+        powerups_text = game.small_font.render("Dropped by enemies - Rapid Fire, Shield, Multi-Shot, Laser", True, WHITE)
+        game.screen.blit(powerups_text, (50, powerups_y))
+
+        # Controls section
+        powerups_y += 50
+        controls_title = game.font.render("CONTROLS", True, YELLOW)
+        game.screen.blit(controls_title, (50, powerups_y))
+
+        powerups_y += 35
+        controls_texts = [
+            "Move: ARROW KEYS / WASD / LEFT STICK",
+            "Shoot: SPACE / MOUSE / R2 TRIGGER",
+            "Dash: SHIFT / A BUTTON (Xbox) / X (PS) - Evade quickly!"
+        ]
+        for ctrl_text in controls_texts:
+            ctrl_render = game.small_font.render(ctrl_text, True, WHITE)
+            game.screen.blit(ctrl_render, (50, powerups_y))
+            powerups_y += 25
+
+    # Back button
+    button_width = 250
+    button_height = 50
+    back_button = Button(
+        game.current_width//2,
+        game.current_height - 50,
+        button_width,
+        button_height,
+        "RETURN TO MENU",
+        game.font,
+        color=GREEN
+    )
+    mouse_pos = game.mouse_pos()
+    mouse_clicked = pygame.mouse.get_pressed()[0]
+    back_button.update(mouse_pos, mouse_clicked)
+    back_button.draw(game.screen)
+
+    # Handle back button click
+    if back_button.is_clicked:
+        game.state = GameState.MENU
+
+
+def draw_enemy_preview(game, screen, x, y, enemy_type, size=30):
+    """Draw a small preview of an enemy for the rules page using actual game assets"""
+    try:
+        sheet = PREVIEW_SPRITES.get(enemy_type)
+        if sheet is None:
+            return
+        image = assets.preview(*sheet, size=size)
+        screen.blit(image, (x - size//2, y - size//2))
+    except:
+        # Fallback to simple shapes if assets fail to load
+        rect = pygame.Rect(x - size//2, y - size//2, size, size)
+        if enemy_type == "normal":
+            color = RED
+            pygame.draw.rect(screen, color, rect)
+            pygame.draw.rect(screen, WHITE, rect, 2)
+        elif enemy_type == "tank":
+            color = (150, 0, 0)
+            pygame.draw.rect(screen, color, rect)
+            pygame.draw.rect(screen, WHITE, rect, 2)
+        elif enemy_type == "fast":
+            color = (255, 100, 100)
+            pygame.draw.rect(screen, color, rect)
+            pygame.draw.rect(screen, WHITE, rect, 2)
+        elif enemy_type == "boss":
+            color = (100, 0, 100)
+            pygame.draw.ellipse(screen, color, rect)
+            pygame.draw.ellipse(screen, WHITE, rect, 3)
+        elif enemy_type == "gigaboss":
+            color = (150, 0, 150)
+            pygame.draw.ellipse(screen, color, rect)
+            pygame.draw.ellipse(screen, WHITE, rect, 3)
+            for i in range(8):
+                angle = (i / 8) * 2 * math.pi
+                spike_x = rect.centerx + math.cos(angle) * (size // 2 + 5)
+                spike_y = rect.centery + math.sin(angle) * (size // 2 + 5)
+                pygame.draw.line(screen, color, rect.center, (spike_x, spike_y), 2)
@@ -0,0 +1,96 @@
+"""
+Écran des paramètres (contrôles)
+"""
+import pygame
+
+from ..constants import WHITE, GREEN, YELLOW, CYAN, ORANGE
+from ..ui import Button
+
+
+def draw_settings(game):
+    # Title
+    title = game.big_font.render("SETTINGS", True, CYAN)
+    title_rect = title.get_rect(center=(game.current_width//2, 60))
+    game.screen.blit(title, title_rect)
+
+    # Controls section
+    controls_y = 150
+    controls_title = game.font.render("CONTROLS", True, YELLOW)
+    game.screen.blit(controls_title, (game.current_width//2 - controls_title.get_width()//2, controls_y))
+
+    controls_y += 60
+    control_names = {
+        "up": "Move Up",
+        "down": "Move Down",
+        "left": "Move Left",
+        "right": "Move Right",
+        "shoot": "Shoot",
+        "pause": "Pause"
+    }
+
+    for action, name in control_names.items():
+        # Get key names
+        keys = game.controls[action]
+        key_names = []
+        for key in keys:
+            key_name = pygame.key.name(key).upper()
+            key_names.append(key_name)
+        keys_text = " / ".join(key_names)
+
+        # Draw action name
+        action_text = game.font.render(f"{name}:", True, WHITE)
+        game.screen.blit(action_text, (game.current_width//2 - 250, controls_y))
+
+        # Draw keys
+        if game.waiting_for_key == action:
+            keys_display = game.font.render("Press a key...", True, YELLOW)
+        else:
+            keys_display = game.font.render(keys_text, True, CYAN)
+        game.screen.blit(keys_display, (game.current_width//2 + 50, controls_y))
+
+        # Create button for rebinding
+        if not game.settings_buttons or len(game.settings_buttons) < len(control_names):
+            button_width = 150
+            button_height = 40
+            button = Button(
+                game.current_width//2 + 300,
+                controls_y + 20,
+                button_width,
+                button_height,
+                "Change",
+                game.small_font
+            )
+            game.settings_buttons.append(button)
+
+        controls_y += 60
+
+    # Draw buttons
+    mouse_pos = game.mouse_pos()
+    mouse_clicked = pygame.mouse.get_pressed()[0]
+
+    for i, button in enumerate(game.settings_buttons[:len(control_names)]):
+        button.update(mouse_pos, mouse_clicked)
+        button.draw(game.screen)
+
+    # Reset to defaults button
+    reset_button_y = controls_y + 40
+    if len(game.settings_buttons) < len(control_names) + 1:
+        reset_btn = Button(
+            game.current_width//2,
+            reset_button_y,
+            250,
+            50,
+            "Reset to Defaults",
+            game.font,
+            color=ORANGE
+        )
+        game.settings_buttons.append(reset_btn)
+
+    if len(game.settings_buttons) > len(control_names):
+        game.settings_buttons[-1].update(mouse_pos, mouse_clicked)
+        game.settings_buttons[-1].draw(game.screen)
+
+    # Back instruction
+    back_text = game.font.render("G: GitHub configuration | T: Stress test | ESC: Return", True, GREEN)
+    back_rect = back_text.get_rect(center=(game.current_width//2, game.current_height - 40))
+    game.screen.blit(back_text, back_rect)
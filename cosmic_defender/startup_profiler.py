@@ -0,0 +1,94 @@
+"""
+Profilage du démarrage de Cosmic Defender
+Mesure le temps passé dans les imports, l'init des sous-systèmes pygame, le
+chargement des assets, la création des polices et la première frame
+(python launch.py --profile-startup).
+"""
+import time
+from contextlib import contextmanager
+
+from .trace import tracer
+
+# Report order; phases of other categories are listed after these
+CATEGORIES = ("imports", "subsystems", "display", "assets", "fonts", "persistence", "network", "first_frame")
+
+
+class StartupProfiler:
+    """Wall-clock timings of the startup phases, a no-op until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = None
+        self.phases = []  # (category, name, seconds)
+        self.first_frame_at = None
+
+    def enable(self, origin=None):
+        """Start recording; `origin` is the perf_counter() value counted as t=0"""
+        self.enabled = True
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases = []
+        self.first_frame_at = None
+
+    @contextmanager
+    def phase(self, category, name=None):
+        """Time the block; also a span of the trace when --trace is on"""
+        if not (self.enabled or tracer.enabled):
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if self.enabled:
+                self.phases.append((category, name or category, end - start))
+            tracer.complete(name or category, "startup", start, end)
+
+    def record(self, category, name, seconds):
+        """Add a phase measured elsewhere (e.g. imports timed before enable)"""
+        if self.enabled:
+            self.phases.append((category, name, seconds))
+
+    def mark_first_frame(self):
+        if self.enabled and self.first_frame_at is None:
+            self.first_frame_at = time.perf_counter()
+
+    def totals(self):
+        """Milliseconds per category"""
+        totals = {}
+        for category, _, seconds in self.phases:
+            totals[category] = totals.get(category, 0.0) + seconds * 1000
+        return totals
+
+    def time_to_first_frame(self):
+        """Milliseconds from origin to the end of the first frame, None before it"""
+        if self.first_frame_at is None:
+            return None
+        return (self.first_frame_at - self.origin) * 1000
+
+    def check_budget(self, budget_ms):
+        ttff = self.time_to_first_frame()
+        return ttff is not None and ttff <= budget_ms
+
+    def report(self, budget_ms=None):
+        totals = self.totals()
+        categories = [c for c in CATEGORIES if c in totals] + [c for c in totals if c not in CATEGORIES]
+
+        lines = ["Startup profile (ms)"]
+        for category in categories:
+            lines.append(f"  {category:<18} {totals[category]:8.1f}")
+            for phase_category, name, seconds in self.phases:
+                if phase_category == category and name != category:
+                    lines.append(f"    {name:<16} {seconds * 1000:8.1f}")
+
+        ttff = self.time_to_first_frame()
+        if ttff is not None:
+            lines.append(f"  {'time to menu':<18} {ttff:8.1f}")
+        if budget_ms is not None:
+            status = "OK" if self.check_budget(budget_ms) else "OVER BUDGET"
+            lines.append(f"  {'budget':<18} {budget_ms:8.1f}  {status}")
+        return "\n".join(lines)
+
+
+# Shared instance, enabled by launch.py --profile-startup
+startup_profiler = StartupProfiler()
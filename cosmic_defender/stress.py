@@ -0,0 +1,171 @@
+"""
+Mode stress : limites de montée en charge
+Une partie infinie où le joueur ne meurt pas et où les vagues ne progressent
+pas ; pour chaque type d'entité (ennemis, balles, particules), le nombre est
+maintenu à une cible qui grandit par paliers jusqu'à ce que le temps de
+frame dépasse le budget. Le rapport donne le nombre maximal tenu par type
+sur cette machine, rendu compris et simulation seule (headless).
+Lancement : python launch.py --stress [--headless], ou T dans les paramètres.
+"""
+import random
+import statistics
+
+from .constants import FPS, RED, ORANGE, PURPLE, YELLOW, GameState
+from .entities import Bullet, Enemy, Particle
+from .frame_stats import PHASES
+from .quality import quality_governor
+
+BUDGET_MS = 1000 / FPS
+KINDS = ("enemies", "bullets", "particles")
+START_COUNT = 25
+GROWTH = 1.5  # Target multiplied by this at each step
+MAX_COUNT = 20000
+SETTLE_FRAMES = 30  # Frames ignored after each step (spawn burst, new sprite sizes)
+MEASURE_FRAMES = 60
+ENEMY_TYPES = ("basic", "fast", "tank")
+PARTICLE_COLORS = (ORANGE, RED, PURPLE, YELLOW)
+
+
+def top_up(game, kind, count):
+    """Spawn entities of `kind` until there are `count` of them"""
+    width, height = game.current_width, game.current_height
+    if kind == "enemies":
+        for i in range(count - len(game.enemies)):
+            game.enemies.append(Enemy(random.uniform(30, width - 30), random.uniform(-40, height / 2),
+                                      ENEMY_TYPES[i % len(ENEMY_TYPES)]))
+    elif kind == "bullets":
+        for _ in range(count - len(game.enemy_bullets)):
+            game.enemy_bullets.append(Bullet(random.uniform(0, width), random.uniform(0, height / 3),
+                                             (random.uniform(-120, 120), random.uniform(80, 240)),
+                                             color=RED, is_player_bullet=False))
+    elif kind == "particles":
+        for _ in range(count - len(game.particles)):
+            game.particles.append(Particle(random.uniform(0, width), random.uniform(0, height),
+                                           random.choice(PARTICLE_COLORS),
+                                           (random.uniform(-60, 60), random.uniform(-60, 60)), random.uniform(0.5, 2)))
+
+
+class StressTest:
+    """Ramps one entity type at a time until the frame time breaks the budget"""
+
+    def __init__(self, budget_ms=BUDGET_MS, kinds=KINDS, max_count=MAX_COUNT):
+        self.budget_ms = budget_ms
+        self.kinds = list(kinds)
+        self.max_count = max_count
+        self.kind_index = 0
+        self.count = START_COUNT
+        self.frame = 0
+        self.rendered = []  # Whole frame work time (ms) of the measured frames
+        self.headless = []  # Update phase only: the cost without drawing
+        # Largest count that held the budget, None until a step passes; "capped" when never broken
+        self.results = {kind: {"rendered": None, "headless": None, "capped": False} for kind in self.kinds}
+        self.broken = {"rendered": False, "headless": False}
+        self.done = False
+        self.quality = quality_governor.tier.name
+
+    @property
+    def kind(self):
+        return self.kinds[self.kind_index]
+
+    def before_frame(self, game):
+        """Keep the game in the stress situation (called before the frame is timed)"""
+        game.player.health = game.player.max_health
+        game.enemies_spawned = 0  # No wave progression, no natural spawning
+        game.enemies_per_wave = 10 ** 9
+        game.spawn_timer = 0
+        game.giga_boss = None
+        top_up(game, self.kind, self.count)
+
+    def after_frame(self, game):
+        """Account the frame just finished; returns True once every type is done"""
+        self.frame += 1
+        if self.frame <= SETTLE_FRAMES:
+            return False
+        current = game.frame_stats.current
+        self.rendered.append(sum(current.values()))
+        self.headless.append(sum(current[section] for section in PHASES["update"]))
+        if len(self.rendered) < MEASURE_FRAMES:
+            return False
+
+        result = self.results[self.kind]
+        for mode, samples in (("rendered", self.rendered), ("headless", self.headless)):
+            if self.broken[mode]:
+                continue
+            if statistics.fmean(samples) <= self.budget_ms:
+                result[mode] = self.count
+            else:
+                self.broken[mode] = True
+
+        self.frame = 0
+        self.rendered = []
+        self.headless = []
+        if self.broken["rendered"] and self.broken["headless"]:
+            self.next_kind(game)
+        elif self.count >= self.max_count:
+            result["capped"] = True
+            self.next_kind(game)
+        else:
+            self.count = min(self.max_count, int(self.count * GROWTH))
+        return self.done
+
+    def next_kind(self, game):
+        game.enemies.clear()
+        game.enemy_bullets.clear()
+        game.particles.clear()
+        self.broken = {"rendered": False, "headless": False}
+        self.count = START_COUNT
+        self.kind_index += 1
+        self.done = self.kind_index == len(self.kinds)
+
+    def status(self):
+        return f"STRESS {self.kind}: {self.count} ({self.kind_index + 1}/{len(self.kinds)})"
+
+    def report(self):
+        lines = [f"🔥 Stress test : nombre maximal tenu sous {self.budget_ms:.1f} ms de travail par frame"
+                 f" (qualité {self.quality})",
+                 f"  {'entity':<12}{'rendered':>10}{'headless':>10}"]
+        for kind, result in self.results.items():
+            cells = []
+            for mode in ("rendered", "headless"):
+                count = result[mode]
+                if count is None:
+                    cells.append(f"<{START_COUNT}")
+                elif result["capped"] and count == self.max_count:
+                    cells.append(f">={count}")
+                else:
+                    cells.append(str(count))
+            lines.append(f"  {kind:<12}{cells[0]:>10}{cells[1]:>10}")
+        return "\n".join(lines)
+
+
+def start_stress_test(game, budget_ms=BUDGET_MS, quit_when_done=False):
+    """Start an infinite game driven by a StressTest"""
+    game.start_game("infinite")
+    # Quality held at the current tier: the governor must not change what is measured
+    game.stress_restore_quality = "auto" if quality_governor.auto else None
+    quality_governor.set_mode(quality_governor.tier.name)
+    game.stress_test = StressTest(budget_ms)
+    game.stress_quit_when_done = quit_when_done
+
+
+def update_stress_test(game):
+    """After each frame: account it, stop on completion or when the game was left"""
+    stress = game.stress_test
+    if game.state == GameState.GAME_OVER:
+        # Hundreds of enemies can kill the player within one frame: carry on
+        game.state = GameState.PLAYING_INFINITE
+    if game.state not in [GameState.PLAYING_INFINITE, GameState.PAUSED]:
+        print("⚠ Stress test interrompu")
+        finish_stress_test(game)
+    elif game.state == GameState.PLAYING_INFINITE and stress.after_frame(game):
+        print(stress.report())
+        finish_stress_test(game)
+        game.state = GameState.MENU
+
+
+def finish_stress_test(game):
+    game.stress_test = None
+    if game.stress_restore_quality:
+        quality_governor.set_mode(game.stress_restore_quality)
+    if game.stress_quit_when_done:
+        game.running = False
@@ -0,0 +1,168 @@
+"""
+Télémétrie des parties
+Pendant une partie, chaque tick écrit une ligne de métriques (temps de frame,
+update / draw / present, entités, score, vague, vie, bouclier, bonus actifs)
+dans des colonnes NumPy préallouées par blocs : pas d'allocation par tick et
+aucune écriture disque pendant le combat. Au lancement de la partie suivante
+(ou à la fermeture du jeu), les blocs sont écrits en une fois par un thread
+d'arrière-plan, en .npz compressé ou en CSV (launch.py --telemetry DOSSIER).
+"""
+import importlib.util
+import os
+import time
+from datetime import datetime
+
+from .background_tasks import DaemonExecutor
+from .frame_stats import PHASES
+
+# Optional: without numpy the recorder stays disabled
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+CHUNK_ROWS = 3600  # One minute at 60 FPS per preallocated block
+COLUMNS = (
+    ("frame", "u4"),
+    ("time", "f4"),  # Seconds since the first tick of the game
+    ("frame_ms", "f4"),
+    ("update_ms", "f4"),
+    ("draw_ms", "f4"),
+    ("present_ms", "f4"),
+    ("score", "i4"),
+    ("wave", "u2"),
+    ("health", "f4"),
+    ("shield", "f4"),
+    ("enemies", "u4"),
+    ("bullets", "u4"),
+    ("enemy_bullets", "u4"),
+    ("particles", "u4"),
+    ("power_ups", "u4"),
+    ("giga_boss_health", "f4"),  # 0 without a Giga Boss
+    ("rapid_fire", "f4"),  # Power-up seconds left
+    ("multi_shot", "f4"),
+    ("laser", "f4"),
+)
+
+
+class TelemetryRecorder:
+    """Per-tick metrics of a game in preallocated columns, a no-op until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.directory = None
+        self.file_format = "npz"
+        self.chunk_rows = CHUNK_ROWS
+        self.chunks = []  # Filled blocks of the current game, {column: array}
+        self.block = None  # Block being filled
+        self.row = 0
+        self.spare = []  # Blocks kept for the next games
+        self.started = None  # perf_counter() and datetime of the first tick
+        self.started_at = None
+        self.mode = None
+        self._writer = None
+
+    def enable(self, directory, file_format="npz", chunk_rows=CHUNK_ROWS):
+        if not HAS_NUMPY:
+            print("⚠ numpy manquant : télémétrie désactivée (pip install numpy)")
+            return False
+        self.enabled = True
+        self.directory = directory
+        self.file_format = file_format
+        self.chunk_rows = chunk_rows
+        self.spare = [self._new_block()]  # The first block exists before any game
+        self._writer = DaemonExecutor(max_workers=1, name="telemetry")
+        return True
+
+    def disable(self):
+        self.enabled = False
+        self.chunks = []
+        self.block = None
+        self.spare = []
+
+    def _new_block(self):
+        import numpy as np
+        return {name: np.zeros(self.chunk_rows, dtype) for name, dtype in COLUMNS}
+
+    def rows(self):
+        return len(self.chunks) * self.chunk_rows + (self.row if self.block is not None else 0)
+
+    def record(self, game, frame_ms):
+        """Add one tick of `game`, which must be playing"""
+        if not self.enabled:
+            return
+        if self.block is None:
+            self.started = time.perf_counter()
+            self.started_at = datetime.now()
+            self.mode = game.game_mode
+            self.block = self.spare.pop() if self.spare else self._new_block()
+            self.row = 0
+        elif self.row == self.chunk_rows:
+            # Block full: next one (allocated only when the spares run out, once a minute)
+            self.chunks.append(self.block)
+            self.block = self.spare.pop() if self.spare else self._new_block()
+            self.row = 0
+
+        block, i = self.block, self.row
+        current = game.frame_stats.current
+        player = game.player
+        block["frame"][i] = game.frame_count
+        block["time"][i] = time.perf_counter() - self.started
+        block["frame_ms"][i] = frame_ms
+        block["update_ms"][i] = sum(current[section] for section in PHASES["update"])
+        block["draw_ms"][i] = sum(current[section] for section in PHASES["draw"])
+        block["present_ms"][i] = current["present"]
+        block["score"][i] = game.score
+        block["wave"][i] = game.wave
+        block["health"][i] = player.health
+        block["shield"][i] = player.shield
+        block["enemies"][i] = len(game.enemies)
+        block["bullets"][i] = len(game.bullets)
+        block["enemy_bullets"][i] = len(game.enemy_bullets)
+        block["particles"][i] = len(game.particles)
+        block["power_ups"][i] = len(game.power_ups)
+        block["giga_boss_health"][i] = game.giga_boss.health if game.giga_boss else 0
+        block["rapid_fire"][i] = max(player.rapid_fire_timer, 0)
+        block["multi_shot"][i] = max(player.multi_shot_timer, 0)
+        block["laser"][i] = max(player.laser_timer, 0)
+        self.row += 1
+
+    def flush(self):
+        """Next game or exit: write every recorded tick in the background; returns the path or None"""
+        if not self.enabled or self.block is None:
+            return None
+        import numpy as np
+        blocks = self.chunks + [self.block]
+        rows = self.row
+        columns = {name: np.concatenate([block[name] for block in blocks[:-1]] + [blocks[-1][name][:rows]])
+                   for name, _ in COLUMNS}
+        self.spare.extend(blocks)
+        self.chunks = []
+        self.block = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"session_{self.started_at:%Y%m%d_%H%M%S}_{self.mode}.{self.file_format}"
+        path = os.path.join(self.directory, name)
+        self._writer.submit(write_columns, path, columns, self.file_format)
+        print(f"📈 Télémétrie : {len(columns['frame'])} ticks -> {path}")
+        return path
+
+    def wait(self, timeout=None):
+        """Block until the pending files are written (exit, tests)"""
+        if self._writer:
+            done = self._writer.submit(lambda: None)
+            done.result(timeout)
+
+
+def write_columns(path, columns, file_format):
+    import numpy as np
+    try:
+        if file_format == "csv":
+            formats = ["%d" if dtype[0] in "iu" else "%.3f" for _, dtype in COLUMNS]
+            table = np.column_stack([columns[name].astype("f8") for name, _ in COLUMNS])
+            np.savetxt(path, table, fmt=formats, delimiter=",", header=",".join(columns), comments="")
+        else:
+            np.savez_compressed(path, **columns)
+    except OSError as e:
+        print(f"Error saving telemetry: {e}")
+
+
+# Shared instance, enabled by launch.py --telemetry
+telemetry = TelemetryRecorder()
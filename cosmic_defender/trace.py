@@ -0,0 +1,118 @@
+"""
+Trace d'exécution au format Chrome trace-event
+Des spans nommés entourent la boucle principale, les phases de update_game,
+le chargement des assets, les écritures de scores et les appels réseau
+GitHub ; le fichier JSON s'ouvre dans chrome://tracing ou ui.perfetto.dev et
+montre le thread du jeu et les threads réseau côte à côte
+(python launch.py --trace FICHIER). Désactivé, un span ne coûte qu'un test.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+MAX_EVENTS = 1_000_000  # Ring buffer: a long session keeps its last minutes
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.category, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class Tracer:
+    """Collects complete events from every thread, a no-op until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.origin = None
+        self.events = deque(maxlen=MAX_EVENTS)  # (name, category, tid, start, end, args)
+        self.thread_names = {}
+
+    def enable(self, path=None, origin=None):
+        """Start recording; `origin` is the perf_counter() value counted as t=0"""
+        self.enabled = True
+        self.path = path
+        self.origin = time.perf_counter() if origin is None else origin
+        self.events.clear()
+        self.thread_names = {}
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, name, category="game", **args):
+        """Context manager timing its block as one event"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args or None)
+
+    def complete(self, name, category, start, end, args=None):
+        """Add an event measured elsewhere (perf_counter seconds)"""
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        self.events.append((name, category, tid, start, end, args))
+
+    def trace_events(self):
+        """Events in the Chrome trace-event format (timestamps in microseconds)"""
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in list(self.thread_names.items())]
+        for name, category, tid, start, end, args in list(self.events):
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": round((start - self.origin) * 1e6, 3), "dur": round((end - start) * 1e6, 3)}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return events
+
+    def save(self, path=None):
+        path = path or self.path
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        print(f"💾 Trace écrite dans {path} ({len(self.events)} événements)")
+
+
+def traced(name, category="game"):
+    """Decorator: run the whole function inside a span"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Shared instance, enabled by launch.py --trace
+tracer = Tracer()
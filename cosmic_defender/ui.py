@@ -0,0 +1,37 @@
+"""
+Widgets d'interface (boutons des menus)
+"""
+import pygame
+
+from .constants import WHITE, CYAN
+
+class Button:
+    def __init__(self, x, y, width, height, text, font, color=WHITE, bg_color=None, hover_color=CYAN):
+        self.rect = pygame.Rect(x - width//2, y - height//2, width, height)
+        self.text = text
+        self.font = font
+        self.color = color
+        self.bg_color = bg_color
+        self.hover_color = hover_color
+        self.is_hovered = False
+        self.is_clicked = False
+
+    def update(self, mouse_pos, mouse_clicked):
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        self.is_clicked = self.is_hovered and mouse_clicked
+        return self.is_clicked
+
+    def draw(self, screen):
+        # Draw background if specified
+        if self.bg_color:
+            pygame.draw.rect(screen, self.bg_color, self.rect)
+
+        # Draw border
+        border_color = self.hover_color if self.is_hovered else self.color
+        pygame.draw.rect(screen, border_color, self.rect, 3)
+
+        # Draw text
+        text_color = self.hover_color if self.is_hovered else self.color
+        text_surface = self.font.render(self.text, True, text_color)
+        text_rect = text_surface.get_rect(center=self.rect.center)
+        screen.blit(text_surface, text_rect)
@@ -0,0 +1,169 @@
+"""
+Outbox persistante pour l'upload des scores vers GitHub
+Chaque score en attente est un fichier JSON dans outbox/ : il n'est supprimé
+qu'une fois l'upload confirmé, donc un score survit à un crash ou à la
+fermeture du jeu pendant l'upload. Les erreurs passagères (réseau, HTTP 5xx)
+sont retentées avec un délai croissant ; une erreur de configuration (token,
+dépôt introuvable) met l'outbox en pause jusqu'au prochain changement de
+configuration.
+"""
+import json
+import os
+import random
+import threading
+import time
+
+
+class UploadOutbox:
+    """Durable queue of scores drained by a single long-lived upload worker"""
+
+    def __init__(self, uploader, directory="outbox", max_batch=50, base_delay=2.0, max_delay=300.0):
+        self.uploader = uploader
+        self.directory = directory
+        self.max_batch = max_batch
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.failures = 0
+        self.retry_at = None  # monotonic() time of the next attempt after a failure
+        self.paused = None  # Message of the permanent error holding the queue, until resume()
+        self.last_result = None  # (success, message) of the last attempt
+        self.uploaded_count = 0
+
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._stop = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, score):
+        """Persist a score on disk and wake the worker"""
+        import uuid  # Deferred: not needed until the first score is saved
+        os.makedirs(self.directory, exist_ok=True)
+        # Time prefix keeps files in enqueue order, uuid keeps names unique across threads
+        filename = os.path.join(self.directory, f"{time.time_ns()}_{uuid.uuid4().hex}.json")
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(score, f, ensure_ascii=False)
+        # Atomic rename: the worker never sees a half-written score
+        os.replace(tmp_filename, filename)
+
+        with self._lock:
+            self._idle.clear()
+        self.start()
+        self._wakeup.set()
+        return filename
+
+    def pending_files(self):
+        """Pending score files, oldest first"""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in sorted(names)]
+
+    def pending_count(self):
+        return len(self.pending_files())
+
+    def start(self):
+        """Start the worker thread (once)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            if self.pending_files():
+                self._idle.clear()
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="upload-outbox", daemon=True)
+            self._thread.start()
+        # Scan the directory right away (scores left over from a previous session)
+        self._wakeup.set()
+
+    def stop(self, timeout=None):
+        """Ask the worker to exit; pending scores stay on disk for next launch"""
+        self._stop = True
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def resume(self):
+        """Config changed: retry now, even after a permanent error or during a backoff"""
+        self.paused = None
+        self.failures = 0
+        self.retry_at = None
+        if self.pending_files():
+            self.start()
+            self._wakeup.set()  # start() returns early when the worker is already waiting
+
+    def wait_until_empty(self, timeout=None):
+        """Block until every pending score has been uploaded (tests, tools)"""
+        return self._idle.wait(timeout)
+
+    def next_delay(self):
+        """Exponential backoff with jitter, capped at max_delay"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (self.failures - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _load_batch(self):
+        batch = []
+        for path in self.pending_files()[:self.max_batch]:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    batch.append((path, json.load(f)))
+            except FileNotFoundError:
+                continue
+            except ValueError:
+                # Corrupted entry: drop it rather than blocking the queue forever
+                print(f"⚠ Invalid outbox entry dropped: {path}")
+                os.remove(path)
+        return batch
+
+    def _run(self):
+        delay = None
+        while not self._stop:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            if self._stop:
+                break
+            if self.paused:
+                # New scores stay on disk; only resume() restarts the uploads
+                delay = None
+                continue
+            if self.retry_at is not None and time.monotonic() < self.retry_at:
+                # Woken by a new score during the backoff: keep waiting
+                delay = self.retry_at - time.monotonic()
+                continue
+
+            batch = self._load_batch()
+            if not batch:
+                self.failures = 0
+                delay = None
+                with self._lock:
+                    # Re-check under the lock so a concurrent enqueue is never reported as idle
+                    if not self.pending_files():
+                        self._idle.set()
+                continue
+
+            success, message, retryable = self.uploader.upload_leaderboard({"scores": [score for _, score in batch]})
+            self.last_result = (success, message)
+            self.retry_at = None
+
+            if success:
+                for path, _ in batch:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                self.uploaded_count += len(batch)
+                self.failures = 0
+                delay = 0  # Drain whatever was enqueued meanwhile
+                print(f"✓ Leaderboard uploaded to GitHub successfully! ({len(batch)} score(s))")
+            elif not retryable:
+                self.paused = message
+                delay = None
+                print(f"✗ GitHub upload failed: {message} - paused until the GitHub config changes")
+            else:
+                self.failures += 1
+                delay = self.next_delay()
+                self.retry_at = time.monotonic() + delay
+                print(f"✗ GitHub upload failed: {message} - retry in {delay:.0f}s")
@@ -52,10 +52,10 @@ if __name__ == "__main__":
 
     # Importer et lancer le jeu
     try:
-        # Code du jeu intégré
-        exec(open('cosmic_defender.py', encoding='utf-8').read())
-    except FileNotFoundError:
-        print("ERREUR: Fichier cosmic_defender.py introuvable !")
+        from cosmic_defender import CosmicDefender
+        CosmicDefender().run()
+    except ModuleNotFoundError:
+        print("ERREUR: Dossier cosmic_defender/ introuvable !")
         input("Appuyez sur Entree pour quitter...")
     except Exception as e:
         print(f"ERREUR lors du lancement du jeu : {e}")
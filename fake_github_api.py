@@ -0,0 +1,180 @@
+"""
+Faux serveur local de l'API GitHub "contents" pour les tests
+Reproduit le comportement utile au jeu : GET/PUT d'un fichier encodé en base64,
+contrôle du sha (409 si le fichier a changé, 422 si le sha manque), ETag /
+If-None-Match (304), connexions keep-alive et fichiers bruts façon
+raw.githubusercontent.com
+"""
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGitHubAPI:
+    """In-process stand-in for api.github.com, served on 127.0.0.1"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.files = {}  # path -> (content bytes, sha)
+        self.lock = threading.Lock()
+
+        self.get_count = 0
+        self.not_modified_count = 0
+        self.put_count = 0
+        self.conflict_count = 0
+        self.fail_next_puts = 0  # answer HTTP fail_status to the next N PUT requests
+        self.fail_status = 500
+        self.fail_next_gets = 0  # same for GET requests on the contents API
+        self.before_put = None  # callable(path) run before each PUT, e.g. to simulate another writer
+        self.connections = set()  # client (host, port) pairs, one per TCP connection
+
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        handler = type("Handler", (_Handler,), {"api": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def write_file(self, path, data):
+        """Write a JSON file directly, as another client would"""
+        content = json.dumps(data).encode('utf-8')
+        with self.lock:
+            self.files[path] = (content, hashlib.sha1(content).hexdigest())
+
+    def read_file(self, path):
+        with self.lock:
+            content, _ = self.files[path]
+        return json.loads(content.decode('utf-8'))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api = None
+    protocol_version = "HTTP/1.1"  # keep-alive, like api.github.com
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle_one_request(self):
+        with self.api.lock:
+            self.api.connections.add(self.client_address)
+        super().handle_one_request()
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _content_path(self):
+        # /repos/<owner>/<repo>/contents/<path>
+        parts = self.path.split("?")[0].strip("/").split("/", 4)
+        if len(parts) == 5 and parts[0] == "repos" and parts[3] == "contents":
+            return parts[4]
+        return None
+
+    def _send_bytes(self, status, body, headers):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        api = self.api
+        with api.lock:
+            api.get_count += 1
+        if api.latency:
+            time.sleep(api.latency)
+
+        path = self._content_path()
+        if path is not None:
+            with api.lock:
+                failing = api.fail_next_gets > 0
+                api.fail_next_gets -= failing
+            if failing:
+                self._send_json(api.fail_status, {"message": "Server Error"})
+                return
+        raw = False
+        if path is None:
+            # raw.githubusercontent.com style: /<owner>/<repo>/<branch>/<file>
+            path = self.path.split("?")[0].rsplit("/", 1)[-1]
+            raw = True
+        with api.lock:
+            entry = api.files.get(path)
+        if entry is None:
+            if raw:
+                # Repository metadata (test_connection)
+                self._send_json(200, {"full_name": self.path})
+            else:
+                self._send_json(404, {"message": "Not Found"})
+            return
+
+        content, sha = entry
+        etag = f'"{sha}"'
+        if self.headers.get("If-None-Match") == etag:
+            with api.lock:
+                api.not_modified_count += 1
+            self._send_bytes(304, b"", {"ETag": etag})
+        elif raw:
+            self._send_bytes(200, content, {"ETag": etag, "Content-Type": "text/plain"})
+        else:
+            self._send_json(200, {"sha": sha, "content": base64.b64encode(content).decode('ascii')},
+                            {"ETag": etag})
+
+    def do_PUT(self):
+        api = self.api
+        path = self._content_path()
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        if api.latency:
+            time.sleep(api.latency)
+        if api.before_put:
+            api.before_put(path)
+
+        with api.lock:
+            api.put_count += 1
+            if api.fail_next_puts > 0:
+                api.fail_next_puts -= 1
+                status, data = api.fail_status, {"message": "Server Error" if api.fail_status >= 500 else "Bad credentials"}
+            else:
+                current = api.files.get(path)
+                sha = payload.get("sha")
+                if current is not None and sha is None:
+                    api.conflict_count += 1
+                    status, data = 422, {"message": "sha wasn't supplied"}
+                elif current is not None and sha != current[1]:
+                    api.conflict_count += 1
+                    status, data = 409, {"message": "does not match"}
+                else:
+                    content = base64.b64decode(payload["content"])
+                    new_sha = hashlib.sha1(content).hexdigest()
+                    api.files[path] = (content, new_sha)
+                    status, data = (200 if current else 201), {"content": {"sha": new_sha}}
+        self._send_json(status, data)
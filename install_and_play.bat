@@ -63,7 +63,7 @@ echo       LANCEMENT DE COSMIC DEFENDER
 echo ============================================
 echo.
 echo Lancement du jeu...
-python cosmic_defender.py
+python -m cosmic_defender
 
 if errorlevel 1 (
     echo.
@@ -42,7 +42,7 @@ echo ============================================
 echo.
 
 echo Lancement du jeu...
-python cosmic_defender.py
+python -m cosmic_defender
 
 if %errorlevel% neq 0 (
     echo.
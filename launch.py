@@ -4,20 +4,143 @@ Cosmic Defender - Launcher Script
 Script de lancement sécurisé pour Cosmic Defender
 """
 
+import argparse
 import sys
 import os
+import time
 
-def main():
+# Budget par défaut du temps jusqu'au menu (--profile-startup)
+STARTUP_BUDGET_MS = 1500
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Defender")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="mesure le démarrage jusqu'à la première frame puis quitte")
+    parser.add_argument("--startup-budget-ms", type=float, default=STARTUP_BUDGET_MS,
+                        help="temps maximal jusqu'au menu, code de sortie 1 si dépassé")
+    parser.add_argument("--eager-init", action="store_true",
+                        help="initialise la manette au démarrage au lieu d'après la première frame")
+    parser.add_argument("--quality", choices=["auto", "high", "medium", "low"], default="auto",
+                        help="qualité du rendu ; auto l'adapte au temps de frame")
+    parser.add_argument("--gc", choices=["gameplay", "default"], default="gameplay",
+                        help="gameplay : ramasse-miettes gelé au chargement et repoussé aux vagues, pauses et menus")
+    parser.add_argument("--hitch-log", metavar="FICHIER",
+                        help="enregistre les frames trop longues (JSON lines) et affiche leurs causes en fin de partie")
+    parser.add_argument("--hitch-budget-ms", type=float, default=33.3,
+                        help="durée à partir de laquelle une frame est une saccade (--hitch-log)")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="instantané mémoire (tracemalloc) à chaque vague, rapport en fin de partie")
+    parser.add_argument("--telemetry", metavar="DOSSIER",
+                        help="enregistre les métriques de chaque tick et les écrit en fin de partie (numpy requis)")
+    parser.add_argument("--telemetry-format", choices=["npz", "csv"], default="npz")
+    parser.add_argument("--trace", metavar="FICHIER",
+                        help="écrit une trace Chrome (chrome://tracing, ui.perfetto.dev) de la session en quittant")
+    parser.add_argument("--stress", action="store_true",
+                        help="monte le nombre d'ennemis, de balles et de particules jusqu'au dépassement du budget, "
+                             "affiche les maxima puis quitte")
+    parser.add_argument("--stress-budget-ms", type=float, default=1000 / 60,
+                        help="temps de travail par frame à ne pas dépasser (--stress)")
+    parser.add_argument("--bot", action="store_true",
+                        help="le pilote automatique joue une partie infinie, quitte au game over")
+    parser.add_argument("--bot-waves", type=int, metavar="N",
+                        help="avec --bot : quitte une fois la vague N atteinte")
+    parser.add_argument("--seed", type=int, help="graine aléatoire, pas de temps fixe et qualité fixe : avec --bot, "
+                             "la même graine rejoue la même partie")
+    parser.add_argument("--headless", action="store_true",
+                        help="sans fenêtre ni son (pilotes SDL factices), pour --stress en CI")
+    parser.add_argument("--logical-resolution", metavar="LxH",
+                        help="dessine le jeu à une résolution fixe (ex. 1280x720) mise à l'échelle à l'écran")
+    return parser.parse_args(argv)
+
+
+def logical_size(args):
+    """Taille logique demandée (--logical-resolution), None pour la résolution native"""
+    if not args.logical_resolution:
+        return None
+    from cosmic_defender.display import parse_size
+    return parse_size(args.logical_resolution)
+
+
+def profile_startup(args, origin):
+    """Démarrage instrumenté : imports, sous-systèmes, assets, polices, première frame"""
+    from cosmic_defender.startup_profiler import startup_profiler
+    startup_profiler.enable(origin)
+
+    start = time.perf_counter()
+    import pygame
+    startup_profiler.record("imports", "pygame", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    from cosmic_defender import CosmicDefender
+    startup_profiler.record("imports", "cosmic_defender", time.perf_counter() - start)
+
+    game = CosmicDefender(lazy_subsystems=not args.eager_init, logical_size=logical_size(args),
+                          quality=args.quality, gc_mode=args.gc)
+    with startup_profiler.phase("first_frame"):
+        game.run_frame()
+    with startup_profiler.phase("after_first_frame", "second frame"):
+        game.run_frame()
+
+    print(startup_profiler.report(args.startup_budget_ms))
+    if args.trace:
+        from cosmic_defender.trace import tracer
+        tracer.save()
+    within_budget = startup_profiler.check_budget(args.startup_budget_ms)
+    if game.github_uploader:
+        game.github_uploader.outbox.stop(timeout=1)
+    pygame.quit()
+    return 0 if within_budget else 1
+
+
+def main(argv=None):
+    origin = time.perf_counter()
+    args = parse_args(argv)
     try:
         # Ajouter le répertoire du jeu au path
         game_dir = os.path.dirname(os.path.abspath(__file__))
         sys.path.insert(0, game_dir)
 
+        # Fichiers de sortie relatifs au dossier de lancement, pas à celui du jeu
+        if args.trace:
+            args.trace = os.path.abspath(args.trace)
+        if args.hitch_log:
+            args.hitch_log = os.path.abspath(args.hitch_log)
+        if args.telemetry:
+            args.telemetry = os.path.abspath(args.telemetry)
+
         # Changer vers le répertoire du jeu
         os.chdir(game_dir)
 
+        if args.headless:
+            # Before pygame is imported
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        if args.trace:
+            from cosmic_defender.trace import tracer
+            tracer.enable(args.trace, origin)
+
+        if args.profile_startup:
+            sys.exit(profile_startup(args, origin))
+
         # Importer et lancer le jeu
         from cosmic_defender import CosmicDefender
+        if args.seed is not None:
+            import random
+            random.seed(args.seed)
+            if args.quality == "auto":
+                # The tier sets the particle counts, which draw random numbers: keep it fixed
+                args.quality = "high"
+        if args.hitch_log:
+            from cosmic_defender.hitch_detector import hitch_detector
+            hitch_detector.enable(args.hitch_budget_ms, args.hitch_log)
+        if args.telemetry:
+            from cosmic_defender.telemetry import telemetry
+            telemetry.enable(args.telemetry, args.telemetry_format)
+        if args.memory_report:
+            from cosmic_defender.memory_monitor import memory_monitor
+            memory_monitor.enable()
 
         print("=" * 44)
         print("   LANCEMENT DE COSMIC DEFENDER")
@@ -25,10 +148,24 @@ def main():
         print()
         print("Initialisation...")
 
-        game = CosmicDefender()
+        game = CosmicDefender(lazy_subsystems=not args.eager_init, logical_size=logical_size(args),
+                              quality=args.quality, gc_mode=args.gc)
+        if args.seed is not None:
+            # Fixed time step: the same seed replays the same game
+            from cosmic_defender.clock import FixedClock
+            game.clock = FixedClock(pace=not args.headless)
 
-        print("Jeu prêt ! Utilisez F11 pour le plein écran.")
-        print("Amusez-vous bien ! 🚀")
+        if args.stress:
+            game.start_stress_test(args.stress_budget_ms, quit_when_done=True)
+            print("Stress test en cours (ESC puis menu pour l'interrompre)...")
+        elif args.bot:
+            from cosmic_defender.bot import BotPilot
+            game.pilot = BotPilot(args.bot_waves, quit_at_end=True)
+            game.start_game("infinite")
+            print("🤖 Le pilote automatique joue...")
+        else:
+            print("Jeu prêt ! Utilisez F11 pour le plein écran.")
+            print("Amusez-vous bien ! 🚀")
         print()
 
         game.run()
@@ -45,7 +182,8 @@ def main():
         sys.exit(1)
 
     finally:
-        print("\nMerci d'avoir joué à Cosmic Defender ! 🌌")
+        if not args.profile_startup:
+            print("\nMerci d'avoir joué à Cosmic Defender ! 🌌")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -20,7 +20,7 @@ if errorlevel 1 (
 )
 
 REM Lancement du jeu
-python cosmic_defender.py
+python -m cosmic_defender
 
 echo.
 echo Merci d'avoir joué !
@@ -8,6 +8,10 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# Clés déjà dérivées pendant la session : PBKDF2 (100 000 itérations) n'est
+# calculé qu'une fois par mot de passe, quel que soit le nombre d'instances
+_derived_keys = {}
+
 class SecureToken:
     """Gestion sécurisée du token GitHub avec chiffrement Fernet"""
 
@@ -18,14 +22,18 @@ class SecureToken:
         self.salt = b'cosmic_defender_salt_2025'  # Salt public (OK pour ce use case)
 
     def _derive_key(self, password: str) -> bytes:
-        """Dérive une clé de chiffrement depuis un mot de passe"""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        """Dérive une clé de chiffrement depuis un mot de passe (mise en cache)"""
+        cache_key = (password, self.salt)
+        key = _derived_keys.get(cache_key)
+        if key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=self.salt,
+                iterations=100000,
+            )
+            key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+            _derived_keys[cache_key] = key
         return key
 
     def encrypt_token(self, token: str, password: str) -> str:
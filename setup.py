@@ -3,7 +3,7 @@ import sys
 
 # Configuration pour cx_Freeze
 build_exe_options = {
-    "packages": ["pygame", "numpy", "math", "random", "sys"],
+    "packages": ["pygame", "numpy", "math", "random", "sys", "cosmic_defender"],
     "excludes": ["tkinter"],
     "include_files": [],
     "zip_include_packages": ["*"],
@@ -13,7 +13,7 @@ build_exe_options = {
 # Configuration de l'exécutable
 executables = [
     Executable(
-        script="cosmic_defender.py",
+        script="launch.py",
         base="Win32GUI" if sys.platform == "win32" else None,
         target_name="Cosmic_Defender.exe",
         icon=None
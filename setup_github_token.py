@@ -144,7 +144,7 @@ def main():
         print("Prochaines etapes:")
         print()
         print("1. Testez le jeu:")
-        print("   python cosmic_defender.py")
+        print("   python -m cosmic_defender")
         print()
         print("2. Jouez et sauvegardez un score")
         print("   -> Il sera automatiquement uploade sur GitHub!")
@@ -0,0 +1,128 @@
+"""
+Tests de la conversion des sprites au format de l'écran
+"""
+import os
+import subprocess
+import sys
+
+import pygame
+import pytest
+
+from cosmic_defender import assets
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+FIGHTER = "assets/Enemies/Designs - Base/PNGs/Nairan - Fighter - Base.png"
+
+
+@pytest.fixture
+def game_dir(monkeypatch):
+    monkeypatch.chdir(GAME_DIR)
+    assets.clear()
+    yield
+    assets.clear()
+
+
+class RecordingQueue:
+    """Render queue stand-in that keeps the rectangles drawn"""
+
+    def __init__(self):
+        self.bars = []
+
+    def blit(self, layer, surface, center):
+        pass
+
+    def draw(self, layer, function, color, rect, *args):
+        self.bars.append(rect)
+
+
+def is_display_format(surface):
+    display = pygame.display.get_surface()
+    return surface.get_bitsize() == display.get_bitsize() and surface.get_masks()[:3] == display.get_masks()[:3]
+
+
+def test_sprites_are_cached(game_dir):
+    assert assets.image(FIGHTER, (60, 60)) is assets.image(FIGHTER, (60, 60))
+    frames = assets.frames("assets/Enemies/Weapons/PNGs/Nairan - Battlecruiser - Weapons.png", 9, (150, 150))
+    assert len(frames) == 9 and frames[0].get_size() == (150, 150)
+
+
+def test_sprites_converted_once_window_exists(game_dir):
+    pygame.display.init()
+    if pygame.display.get_surface() is not None:
+        pygame.display.quit()
+        pygame.display.init()
+    from cosmic_defender import Enemy
+    enemy = Enemy(100, 0, "tank")
+    assert assets.display_format() is None
+
+    pygame.display.set_mode((200, 200))
+    assert assets.reconvert()
+    enemy.load_sprites()
+    assert is_display_format(enemy.image)
+    assert enemy.image.get_flags() & pygame.SRCALPHA
+    assert not assets.reconvert()  # Same display format: nothing to do
+
+
+def test_scale_follows_resolution(game_dir):
+    assert assets.scale_for(1000, 700) == 1.0
+    assert assets.scale_for(1010, 690) == 1.0  # Quantised: a drag gives few variants
+    assert assets.scale_for(3840, 2160) == 3.0
+    assert assets.scale_for(200, 200) == assets.MIN_SCALE
+    assert assets.set_scale(2.0) and not assets.set_scale(2.0)
+    assert assets.image(FIGHTER, (60, 60)).get_size() == (120, 120)
+    assert assets.preview(FIGHTER, size=30).get_size() == (30, 30)  # Previews ignore the scale
+
+
+@pytest.mark.parametrize("width, height", [(500, 350), (3000, 2100)])
+def test_hitboxes_follow_the_sprite_scale(game_dir, width, height):
+    from cosmic_defender import Enemy, GigaBoss, Player
+    scale = assets.scale_for(width, height)
+    assets.set_scale(scale)
+    player = Player(500, 600)
+    enemies = [Enemy(300, 200, kind) for kind in ("basic", "tank", "fast", "boss")]
+    giga_boss = GigaBoss(500, 150, 10)
+    # Same factor for the player, the enemies and the sprites they draw
+    assert player.image.get_size() == (48 * scale, 48 * scale)
+    assert player.rect.size == (48 * scale, 48 * scale)
+    assert [enemy.rect.width for enemy in enemies] == [round(side * scale) for side in (20, 30, 15, 50)]
+    assert giga_boss.rect.size == (80 * scale, 80 * scale)
+    assert player.rect.center == (500, 600) and giga_boss.rect.center == (500, 150)
+    # Health bars are drawn inside the area the sprite covers
+    for boss in (enemies[-1], giga_boss):
+        half_width, half_height = boss.half_extent()
+        extent = pygame.Rect(boss.x - half_width, boss.y - half_height, half_width * 2, half_height * 2)
+        assert extent.contains(boss.rect)
+        queue = RecordingQueue()
+        boss.draw(queue)
+        for bar in queue.bars:
+            assert extent.contains(pygame.Rect(bar))
+
+
+def test_lru_eviction(game_dir, monkeypatch):
+    monkeypatch.setattr(assets, "MAX_CACHE_BYTES", 3 * 100 * 100 * 4)
+    first = assets.image(FIGHTER, (100, 100))
+    for size in (101, 102, 103):
+        assets.image(FIGHTER, (size, size))
+    count, used = assets.cache_info()
+    assert count < 4 and used <= assets.MAX_CACHE_BYTES
+    assert assets.image(FIGHTER, (100, 100)) is not first  # Oldest variant was evicted
+
+
+def test_resize_drag_rebuilds_once(scratch_dir):
+    code = (
+        "import sys, time; sys.path.insert(0, %r)\n"
+        "import pygame\n"
+        "from cosmic_defender import CosmicDefender, game as game_module\n"
+        "game = CosmicDefender()\n"
+        "rebuilds = []\n"
+        "game.on_resolution_changed = lambda: rebuilds.append(game.screen.get_size())\n"
+        "for i in range(30):\n"
+        "    pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, w=1000 + 30 * i, h=700 + 20 * i))\n"
+        "    game.run_frame()\n"
+        "time.sleep(game_module.RESIZE_SETTLE)\n"
+        "game.run_frame(); game.run_frame()\n"
+        "print(rebuilds)\n"
+    ) % GAME_DIR
+    output = subprocess.run([sys.executable, "-c", code], cwd=scratch_dir, capture_output=True,
+                            text=True, timeout=60, check=True).stdout
+    assert output.strip().splitlines()[-1] == "[(1870, 1280)]"
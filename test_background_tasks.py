@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests des tâches réseau en arrière-plan et du test de connexion non bloquant
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+
+from cosmic_defender.background_tasks import BackgroundTask, FAILED, OK, PENDING
+from fake_github_api import FakeGitHubAPI
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_task_states():
+    slow = BackgroundTask(time.sleep, 0.2)
+    assert slow.state == PENDING
+    assert slow.wait(5)
+    assert slow.state == OK
+
+    failed = BackgroundTask(lambda: (False, "Invalid token"))
+    failed.wait(5)
+    assert (failed.state, failed.message) == (FAILED, "Invalid token")
+
+    crashed = BackgroundTask(lambda: 1 / 0)
+    crashed.wait(5)
+    assert crashed.state == FAILED
+    assert crashed.message.startswith("Error:")
+
+
+def test_connection_test_does_not_block_frames(game):
+    with FakeGitHubAPI(latency=1.0) as api:
+        game.github_uploader.api_url = api.url
+        game.init_github_config()
+        game.test_github_connection()
+
+        slowest_frame = 0
+        deadline = time.perf_counter() + 5
+        while game.github_test_task and time.perf_counter() < deadline:
+            start = time.perf_counter()
+            game.poll_github_test()
+            game.draw_github_config()
+            slowest_frame = max(slowest_frame, time.perf_counter() - start)
+
+    assert game.github_test_result == "Connection successful"
+    assert slowest_frame < 0.1
+
+
+def test_config_fields_accept_every_letter(game):
+    import pygame
+    game.init_github_config()
+    game.github_input_field = ""
+    for char in "fabyan09/cosmic-defender-leaderboard":
+        game.handle_github_config_input(pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char))
+    assert game.github_input_field == "fabyan09/cosmic-defender-leaderboard"
+
+    auto_upload = game.github_uploader.config["auto_upload"]
+    game.handle_github_config_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F7, unicode=""))
+    assert game.github_uploader.config["auto_upload"] != auto_upload
+
+
+def test_startup_loads_no_crypto_or_network_module(scratch_dir):
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from cosmic_defender import CosmicDefender\n"
+        "CosmicDefender()\n"
+        "print(sorted(m for m in ('requests', 'cryptography', 'secure_token') if m in sys.modules))\n"
+    ) % GAME_DIR
+    output = subprocess.run([sys.executable, "-c", code], cwd=scratch_dir, capture_output=True,
+                            text=True, timeout=60, check=True).stdout
+    assert output.strip().splitlines()[-1] == "[]"
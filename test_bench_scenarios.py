@@ -0,0 +1,47 @@
+"""
+Tests de la comparaison à la baseline des benchmarks de scénarios
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from bench_scenarios import compare
+
+
+def scenario(update_mean, update_p95=None, draw_mean=1.0):
+    update_p95 = update_mean if update_p95 is None else update_p95
+    return {"update": {"mean": update_mean, "p95": update_p95, "p99": update_p95},
+            "draw": {"mean": draw_mean, "p95": draw_mean, "p99": draw_mean}}
+
+
+def results(**scenarios):
+    return {"scenarios": scenarios}
+
+
+def test_slowdown_beyond_threshold_is_a_regression():
+    baseline = results(wave1=scenario(1.0))
+    assert compare(results(wave1=scenario(1.3)), baseline, 0.25, 0.1) == [
+        ("wave1", "update", "mean", 1.0, 1.3), ("wave1", "update", "p95", 1.0, 1.3)]
+    assert compare(results(wave1=scenario(1.2)), baseline, 0.25, 0.1) == []  # Within 25%
+    assert compare(results(wave1=scenario(0.5)), baseline, 0.25, 0.1) == []  # Faster
+
+
+def test_min_delta_floor_ignores_tiny_timings():
+    baseline = results(idle=scenario(0.02))
+    # Twice as slow but only 0.02 ms more: noise on a timing this small
+    assert compare(results(idle=scenario(0.04)), baseline, 0.25, 0.1) == []
+    assert compare(results(idle=scenario(0.04)), baseline, 0.25, 0.01) != []
+
+
+def test_only_p95_can_regress():
+    baseline = results(wave9=scenario(1.0, 2.0))
+    assert compare(results(wave9=scenario(1.0, 3.0)), baseline, 0.25, 0.1) == [
+        ("wave9", "update", "p95", 2.0, 3.0)]
+
+
+def test_scenarios_missing_from_the_baseline_are_skipped():
+    baseline = results(wave1=scenario(1.0))
+    current = results(wave1=scenario(1.0), new_scenario=scenario(50.0))
+    assert compare(current, baseline, 0.25, 0.1) == []
+    assert compare(current, {}, 0.25, 0.1) == []
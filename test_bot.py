@@ -0,0 +1,86 @@
+"""
+Tests du pilote automatique
+"""
+import os
+import random
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from cosmic_defender.bot import HORIZON, BotPilot, threats
+from cosmic_defender.constants import FPS, GameState, PowerUpType
+from cosmic_defender.entities import Bullet, Enemy, Player, PowerUp
+
+
+class FakeGame:
+    def __init__(self):
+        self.current_width, self.current_height = 1000, 700
+        self.player = Player(500, 610)
+        self.enemies, self.enemy_bullets, self.power_ups = [], [], []
+        self.giga_boss = None
+
+
+def test_dodges_a_bullet_coming_straight_down():
+    game = FakeGame()
+    game.enemy_bullets.append(Bullet(500, 540, (0, 300), is_player_bullet=False))
+    bot = BotPilot()
+    bot.think(game)
+    assert bot.move[0] != 0
+    player = game.player
+    courses = bot.courses(player, threats(game))
+    assert bot.danger(bot.path(player, [((0, 0), player.speed, HORIZON)], 1000, 700), courses) > 0
+    assert bot.danger(bot.path(player, [(bot.move, player.speed, HORIZON)], 1000, 700), courses) == 0
+
+
+def test_lines_up_under_an_enemy_and_fires():
+    game = FakeGame()
+    game.enemies.append(Enemy(200, 100, "basic"))
+    bot = BotPilot()
+    bot.think(game)
+    assert bot.move[0] == -1 and bot.shoot
+    game.enemies.clear()
+    bot.think(game)
+    assert not bot.shoot
+
+
+def test_chases_a_falling_power_up():
+    game = FakeGame()
+    game.enemies.append(Enemy(200, 100, "basic"))
+    game.power_ups.append(PowerUp(800, 400, PowerUpType.SHIELD))
+    bot = BotPilot()
+    assert bot.goal(game) == (800, 400)
+
+
+def test_player_follows_the_pilot_not_the_keyboard():
+    player = Player(500, 400)
+    player.update(0.1, pilot=SimpleNamespace(move=(1, -1)))
+    assert player.x > 500 and player.y < 400
+
+
+def test_same_seed_same_game(tmp_path):
+    # launch.py works in its own directory: run a linked copy so no player id lands in the repo
+    for name in ("launch.py", "cosmic_defender", "assets"):
+        os.symlink(os.path.abspath(name), tmp_path / name)
+
+    def play():
+        output = subprocess.run([sys.executable, str(tmp_path / "launch.py"), "--bot", "--bot-waves", "2",
+                                 "--seed", "1", "--headless"], capture_output=True, text=True, check=True,
+                                env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")).stdout
+        return [line for line in output.splitlines() if line.startswith("🤖 Bot")]
+
+    first = play()
+    assert first and "vague 2 atteinte" in first[0]
+    assert play() == first  # Same frame count, score and dashes
+
+
+def test_reaches_wave_30_alone(scratch_dir):
+    from cosmic_defender import CosmicDefender
+    random.seed(1)  # Same game as launch.py --bot --seed 1 --quality high, without drawing it
+    game = CosmicDefender(quality="high")
+    game.pilot = BotPilot()
+    game.start_game("infinite")
+    # Three Giga Bosses and the densest waves on the way: a couple of minutes of simulation
+    while game.state == GameState.PLAYING_INFINITE and game.wave < 30:
+        game.frame_stats.start_frame()
+        game.update_game(1 / FPS)
+    assert game.wave == 30 and game.player.health > 0
@@ -0,0 +1,30 @@
+"""
+Tests du rendu à résolution logique fixe
+"""
+import pygame
+
+from cosmic_defender.display import LogicalDisplay, parse_size
+
+
+def test_parse_size():
+    assert parse_size("1280x720") == (1280, 720)
+    assert parse_size("1000X700") == (1000, 700)
+
+
+def test_software_present_letterboxes_and_maps_mouse():
+    pygame.display.init()
+    window = pygame.display.set_mode((1500, 1080))
+    display = LogicalDisplay((1000, 700))
+    display.buffer = pygame.Surface(display.size).convert()  # Software path, as without a SCALED renderer
+    display.update_viewport()
+
+    assert display.viewport == pygame.Rect(0, 15, 1500, 1050)
+    assert len(display.borders) == 2  # Bars above and below only
+    assert display.to_logical(display.viewport.topleft) == (0, 0)
+    assert display.to_logical(display.viewport.center) == (500, 350)
+
+    window.fill((255, 255, 255))
+    display.buffer.fill((0, 0, 255))
+    display.present()
+    assert window.get_at((750, 5))[:3] == (0, 0, 0)
+    assert window.get_at((750, 540))[:3] == (0, 0, 255)
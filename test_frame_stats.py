@@ -0,0 +1,49 @@
+"""
+Tests des temps par sous-système et de l'overlay F3
+"""
+import time
+from types import SimpleNamespace
+
+import pygame
+
+from cosmic_defender.frame_stats import FrameStats, SECTIONS
+from cosmic_defender.render_queue import RenderQueue
+
+
+def test_laps_charge_elapsed_time_to_sections():
+    stats = FrameStats(history=3)
+    for _ in range(4):
+        stats.start_frame()
+        time.sleep(0.002)
+        stats.lap("events")
+        stats.lap("present")
+        total = stats.end_frame()
+    assert stats.current["events"] >= 2 and stats.current["events"] > stats.current["present"]
+    assert total == sum(stats.current.values())
+    assert len(stats.frame_times) == 3
+    assert 0 < stats.averages["events"] < stats.current["events"]  # Smoothed from 0
+
+
+def test_overlay_panel_cached_between_refreshes():
+    from cosmic_defender.screens import perf_overlay
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((1000, 700))
+    stats = FrameStats()
+    stats.start_frame()
+    for section in SECTIONS:
+        stats.lap(section)
+    stats.end_frame()
+    game = SimpleNamespace(screen=screen, current_width=1000, frame_count=0, frame_stats=stats,
+                           clock=pygame.time.Clock(), render_queue=RenderQueue(), perf_panel=None,
+                           bullets=[], enemy_bullets=[], enemies=[], giga_boss=None, particles=[], power_ups=[])
+
+    perf_overlay.draw_perf_overlay(game)
+    panel = game.perf_panel
+    game.frame_count = 1
+    perf_overlay.draw_perf_overlay(game)
+    assert game.perf_panel is panel
+    game.frame_count = perf_overlay.PANEL_REFRESH_FRAMES
+    perf_overlay.draw_perf_overlay(game)
+    assert game.perf_panel is not panel
@@ -0,0 +1,45 @@
+"""
+Tests de la gestion du ramasse-miettes en jeu
+"""
+import gc
+
+from cosmic_defender.gc_policy import GCPolicy, PLAY_THRESHOLDS
+
+
+def test_gameplay_mode_freezes_raises_thresholds_and_collects_at_safe_points():
+    policy = GCPolicy()
+    policy.set_mode("gameplay")
+    try:
+        policy.freeze()
+        assert gc.get_freeze_count() > 0
+        policy.enter_play()
+        assert gc.get_threshold() == PLAY_THRESHOLDS
+
+        mark = policy.pause_count
+        policy.safe_point("wave")
+        policy.leave_play("paused")
+        assert gc.get_threshold() == policy.default_thresholds
+        assert [(generation, reason) for generation, _, _, reason in policy.pauses_since(mark)] == \
+            [(2, "wave"), (2, "paused")]
+        assert policy.collections[2] >= 3 and policy.max_ms > 0
+    finally:
+        policy.disable()
+    assert gc.get_freeze_count() == 0 and policy._on_gc not in gc.callbacks
+
+
+def test_default_mode_only_measures():
+    policy = GCPolicy()
+    policy.set_mode("default")
+    try:
+        thresholds = gc.get_threshold()
+        policy.freeze()
+        policy.enter_play()
+        assert gc.get_threshold() == thresholds and gc.get_freeze_count() == 0
+        mark = policy.pause_count
+        policy.leave_play("menu")
+        assert policy.pauses_since(mark) == []
+        gc.collect(1)
+        (generation, ms, collected, reason), = policy.pauses_since(mark)
+        assert generation == 1 and reason is None and policy.last_ms() == ms
+    finally:
+        policy.disable()
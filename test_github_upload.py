@@ -20,7 +20,7 @@ def test_github_integration():
     config = uploader.config
     print(f"  Username: {config.get('username', 'Non configuré')}")
     print(f"  Repository: {config.get('repository', 'Non configuré')}")
-    print(f"  Token: {'*' * 20 if config.get('token') else 'Non configuré'}")
+    print(f"  Token: {'*' * 20 if uploader.resolve_token() else 'Non configuré'}")
     print(f"  Auto-upload: {config.get('auto_upload', False)}")
     print(f"  Configuré: {config.get('configured', False)}")
 
@@ -55,7 +55,7 @@ def test_github_integration():
         ]
     }
 
-    success, message = uploader.upload_leaderboard(test_data)
+    success, message, _ = uploader.upload_leaderboard(test_data)
     if success:
         print(f"[OK] {message}")
         print("Verifiez votre site web pour voir les donnees de test!")
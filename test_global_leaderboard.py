@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests du leaderboard mondial en jeu contre un serveur HTTP local
+"""
+
+import time
+
+import pytest
+
+from cosmic_defender.global_leaderboard import GlobalLeaderboard
+from cosmic_defender.leaderboard_cache import LeaderboardCache
+
+FILE = "cosmic_defender_leaderboard.json"
+
+
+@pytest.fixture
+def server(fake_api):
+    fake_api.write_file(FILE, {"scores": [
+        {"player_id": "a", "name": "ACE", "score": 900, "wave": 12, "mode": "infinite", "timestamp": "t1"}
+    ]})
+    return fake_api
+
+
+def make_board(server, tmp_path):
+    url = f"{server.url}/owner/repo/main/{FILE}"
+    return GlobalLeaderboard(url, cache=LeaderboardCache(str(tmp_path / "global.json")))
+
+
+def test_refresh_fills_the_cache_file(server, tmp_path):
+    board = make_board(server, tmp_path)
+    assert board.scores() == []
+    assert board.last_updated() is None
+
+    assert board.refresh()
+    board.wait(5)
+    assert board.status == "ok"
+    assert [s["name"] for s in board.scores()] == ["ACE"]
+
+    # Shown instantly on next launch, before any network call
+    restarted = make_board(server, tmp_path)
+    assert [s["name"] for s in restarted.scores()] == ["ACE"]
+    assert restarted.last_updated() is not None
+
+
+def test_refresh_never_blocks_the_caller(server, tmp_path):
+    server.latency = 1.0
+    board = make_board(server, tmp_path)
+
+    start = time.perf_counter()
+    board.refresh()
+    assert time.perf_counter() - start < 0.05
+    assert board.is_loading()
+    assert board.scores() == []
+    board.wait(5)
+    assert board.status == "ok"
+
+
+def test_fresh_cache_is_not_refetched_and_304_keeps_scores(server, tmp_path):
+    board = make_board(server, tmp_path)
+    board.refresh()
+    board.wait(5)
+    assert not board.refresh()
+
+    assert board.refresh(force=True)
+    board.wait(5)
+    assert server.not_modified_count == 1
+    assert len(board.scores()) == 1
+
+
+def test_offline_keeps_cached_copy(server, tmp_path):
+    board = make_board(server, tmp_path)
+    board.refresh()
+    board.wait(5)
+
+    board.url = "http://127.0.0.1:9/offline.json"
+    board.refresh(force=True)
+    board.wait(5)
+    assert board.status == "error"
+    assert board.error == "No internet connection"
+    assert len(board.scores()) == 1
@@ -0,0 +1,58 @@
+"""
+Tests du détecteur de saccades
+"""
+import gc
+import json
+import time
+from types import SimpleNamespace
+
+from cosmic_defender.constants import GameState
+from cosmic_defender.frame_stats import FrameStats
+from cosmic_defender.hitch_detector import HitchDetector
+
+
+def fake_game():
+    return SimpleNamespace(frame_count=0, state=GameState.PLAYING, wave=3, frame_stats=FrameStats(),
+                           bullets=[], enemy_bullets=[], enemies=[], particles=[], power_ups=[])
+
+
+def frame(detector, game, work):
+    game.frame_count += 1
+    game.frame_stats.start_frame()
+    detector.begin_frame()
+    work(detector)
+    game.frame_stats.lap("waves")
+    return detector.end_frame(game, game.frame_stats.end_frame())
+
+
+def test_long_frames_recorded_with_cause(tmp_path):
+    log = tmp_path / "hitches.jsonl"
+    detector = HitchDetector()
+    detector.enable(budget_ms=20, log_path=str(log))
+    game = fake_game()
+    try:
+        assert frame(detector, game, lambda d: None) is None
+        hitch = frame(detector, game, lambda d: (d.note("giga boss spawn"), time.sleep(0.05)))
+        assert hitch["source"] == "giga boss spawn" and hitch["frame_ms"] >= 50
+        assert hitch["sections"]["waves"] >= 50
+        assert hitch["stacks"] and any("test_hitch_detector.py" in line for line in hitch["stacks"][0]["stack"])
+
+        hitch = frame(detector, game, lambda d: (time.sleep(0.025), gc.collect()))
+        assert hitch["gc"]["pauses"] and hitch["gc"]["pauses"][-1]["generation"] == 2
+    finally:
+        detector.disable()
+
+    summary = detector.summary()
+    assert "2 frame(s)" in summary and "giga boss spawn" in summary
+    for _ in range(100):  # The log is written by a background thread
+        if log.exists() and len(log.read_text().splitlines()) == 2:
+            break
+        time.sleep(0.01)
+    assert json.loads(log.read_text().splitlines()[0])["source"] == "giga boss spawn"
+
+
+def test_disabled_detector_records_nothing():
+    detector = HitchDetector()
+    game = fake_game()
+    assert frame(detector, game, lambda d: (d.note("save_web_score"), time.sleep(0.04))) is None
+    assert not detector.hitches and detector.notes == []
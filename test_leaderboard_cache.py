@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests du cache ETag et de la session HTTP partagée de GitHubUploader
+"""
+
+import pytest
+
+from cosmic_defender import LEADERBOARD_FILE
+
+
+@pytest.fixture
+def fake_api(fake_api):
+    """The shared fake server, with one score already on the board"""
+    fake_api.write_file(LEADERBOARD_FILE, {"scores": [
+        {"player_id": "a", "name": "A", "score": 100, "wave": 3, "mode": "normal", "timestamp": "t1"}
+    ]})
+    return fake_api
+
+
+def test_unchanged_leaderboard_costs_a_304(fake_api, make_uploader):
+    uploader = make_uploader(fake_api.url)
+    sha, scores = uploader.download_leaderboard()
+    received = uploader.get_network_stats()["bytes_received"]
+
+    assert uploader.download_leaderboard() == (sha, scores)
+    stats = uploader.get_network_stats()
+    assert fake_api.not_modified_count == 1
+    assert stats["not_modified"] == 1
+    assert stats["bytes_received"] == received
+
+
+def test_etag_cache_survives_a_restart(fake_api, make_uploader):
+    make_uploader(fake_api.url).download_leaderboard()
+
+    uploader = make_uploader(fake_api.url)
+    sha, scores = uploader.download_leaderboard()
+    assert fake_api.not_modified_count == 1
+    assert [s["player_id"] for s in scores] == ["a"]
+
+
+def test_changed_leaderboard_is_downloaded_again(fake_api, make_uploader):
+    uploader = make_uploader(fake_api.url)
+    uploader.download_leaderboard()
+    fake_api.write_file(LEADERBOARD_FILE, {"scores": []})
+
+    assert uploader.download_leaderboard()[1] == []
+    assert fake_api.not_modified_count == 0
+
+
+def test_requests_share_one_connection(fake_api, make_uploader):
+    uploader = make_uploader(fake_api.url)
+    uploader.test_connection()
+    for i in range(3):
+        success, message, _ = uploader.upload_leaderboard(
+            {"player_id": "b", "name": "B", "score": i, "wave": 1, "mode": "normal", "timestamp": f"u{i}"})
+        assert success, message
+
+    stats = uploader.get_network_stats()
+    assert stats["requests"] == 7
+    assert stats["bytes_sent"] > 0
+    assert len(fake_api.connections) == 1
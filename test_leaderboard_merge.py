@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests de la fusion du leaderboard (leaderboard_merge)
+"""
+
+import random
+
+from cosmic_defender.leaderboard_merge import merge_leaderboard, merge_sorted_runs, top_k
+
+
+def make_score(player_id, score, timestamp, mode="normal"):
+    return {"player_id": player_id, "name": player_id.upper(), "score": score,
+            "wave": 1, "mode": mode, "timestamp": timestamp}
+
+
+def test_top_k_matches_full_sort():
+    rng = random.Random(3)
+    scores = [make_score(f"p{i}", rng.randrange(1000), f"t{i}") for i in range(5000)]
+    expected = sorted(scores, key=lambda x: x["score"], reverse=True)[:100]
+    assert top_k(scores, 100) == expected
+
+
+def test_reupload_takes_a_single_slot():
+    existing = [make_score("a", 500, "t1"), make_score("b", 300, "t2")]
+    merged = merge_leaderboard(existing, [make_score("a", 500, "t1"), make_score("a", 500, "t1")])
+    assert [s["player_id"] for s in merged] == ["a", "b"]
+
+
+def test_same_player_different_runs_are_kept():
+    merged = merge_leaderboard([make_score("a", 500, "t1")], [make_score("a", 500, "t2")])
+    assert len(merged) == 2
+
+
+def test_limit_and_order():
+    existing = [make_score(f"e{i}", 1000 - i * 10, f"e{i}") for i in range(50)]
+    new = [make_score(f"n{i}", i * 7, f"n{i}") for i in range(200)]
+    merged = merge_leaderboard(existing, new, limit=60)
+    assert len(merged) == 60
+    assert [s["score"] for s in merged] == sorted((s["score"] for s in existing + new), reverse=True)[:60]
+
+
+def test_merge_sorted_runs_stops_early():
+    def run():
+        for i in range(10):
+            yield make_score("x", 100 - i, f"r{i}")
+        raise AssertionError("run consumed past the limit")
+
+    assert len(merge_sorted_runs([run()], limit=5)) == 5
+
+
+def test_per_mode_limit():
+    existing = [make_score(f"i{i}", 10000 - i, f"i{i}", "infinite") for i in range(20)]
+    new = [make_score(f"n{i}", 100 - i, f"n{i}", "normal") for i in range(20)]
+    merged = merge_leaderboard(existing, new, limit=20, per_mode_limit=10)
+    assert sum(1 for s in merged if s["mode"] == "normal") == 10
+    assert sum(1 for s in merged if s["mode"] == "infinite") == 10
+    assert [s["score"] for s in merged] == sorted((s["score"] for s in merged), reverse=True)
+
+
+def test_legacy_entries_without_timestamp_are_not_collapsed():
+    legacy = [{"name": "A", "score": 10, "date": "2025-01-01 10:00"},
+              {"name": "B", "score": 20, "date": "2025-01-01 11:00"}]
+    assert len(merge_leaderboard([], legacy)) == 2
@@ -0,0 +1,35 @@
+"""
+Tests du suivi mémoire par vague
+"""
+from types import SimpleNamespace
+
+from cosmic_defender.memory_monitor import MemoryMonitor
+
+
+def fake_game(wave):
+    return SimpleNamespace(wave=wave, frame_count=wave * 100, bullets=[], enemy_bullets=[], enemies=[],
+                           particles=[], power_ups=[], player=SimpleNamespace(trail=[]))
+
+
+def test_wave_snapshots_report_growing_sites():
+    monitor = MemoryMonitor()
+    leak = []
+    monitor.enable()
+    try:
+        for wave in range(2, 5):
+            leak.extend(bytearray(1024) for _ in range(200))
+            entry = monitor.on_wave(fake_game(wave))
+            site, size_diff, count_diff = entry["top"][0]
+            assert site.startswith("test_memory_monitor.py:") and size_diff >= 200 * 1024
+        assert monitor.growth() >= 2 * 200 * 1024
+        assert monitor.growth(1) < monitor.growth()
+        report = monitor.report()
+        assert "test_memory_monitor.py" in report and "wave" in report
+    finally:
+        monitor.disable()
+
+
+def test_disabled_monitor_takes_no_snapshot():
+    monitor = MemoryMonitor()
+    assert monitor.on_wave(fake_game(2)) is None
+    assert monitor.waves == [] and monitor.growth() == 0
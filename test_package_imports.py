@@ -0,0 +1,48 @@
+"""
+Tests des imports paresseux du paquet cosmic_defender
+"""
+import os
+import subprocess
+import sys
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(code, cwd=GAME_DIR):
+    output = subprocess.run([sys.executable, "-c", "import sys; sys.path.insert(0, %r)\n" % GAME_DIR + code],
+                            cwd=cwd, capture_output=True, text=True, timeout=60, check=True).stdout
+    return output.strip().splitlines()[-1]
+
+
+def test_package_import_loads_nothing():
+    code = (
+        "import cosmic_defender\n"
+        "from cosmic_defender.leaderboard_merge import merge_leaderboard\n"
+        "print(sorted(m for m in ('pygame', 'cosmic_defender.game', 'cosmic_defender.github') if m in sys.modules))\n"
+    )
+    assert run_python(code) == "[]"
+
+
+def test_simulation_core_runs_without_display():
+    code = (
+        "import pygame\n"
+        "from cosmic_defender import Enemy\n"
+        "enemy = Enemy(100, 0, 'basic')\n"
+        "for _ in range(10):\n"
+        "    enemy.update(1 / 60, 500, 600, 700)\n"
+        "print(enemy.y > 0, pygame.display.get_init(), 'cosmic_defender.game' in sys.modules)\n"
+    )
+    assert run_python(code) == "True False False"
+
+
+def test_screens_load_on_first_use(scratch_dir):
+    code = (
+        "from cosmic_defender import CosmicDefender, GameState\n"
+        "game = CosmicDefender()\n"
+        "game.run_frame()\n"
+        "before = 'cosmic_defender.screens.rules' in sys.modules\n"
+        "game.state = GameState.RULES\n"
+        "game.run_frame()\n"
+        "print(before, 'cosmic_defender.screens.rules' in sys.modules)\n"
+    )
+    assert run_python(code, cwd=scratch_dir) == "False True"
@@ -0,0 +1,76 @@
+"""
+Tests du garde-fou de performance : statistiques, verdicts et baselines par machine
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+import perf_gate
+from perf_gate import STARTUP, bootstrap_median, compare, moved_most, verdict
+
+
+def group(update, draw, sections):
+    return {"gated": {"update_game": bootstrap_median(update), "draw": bootstrap_median(draw)},
+            "sections": {name: bootstrap_median(values) for name, values in sections.items()}}
+
+
+def test_bootstrap_interval_contains_the_median():
+    summary = bootstrap_median([1.0, 1.1, 0.9, 1.05, 0.95])
+    assert summary["median"] == 1.0
+    assert 0.9 <= summary["low"] <= 1.0 <= summary["high"] <= 1.1  # Within the runs
+    assert bootstrap_median([1.0, 1.1, 0.9, 1.05, 0.95]) == summary  # Same runs, same interval
+
+
+def test_verdicts():
+    baseline = bootstrap_median([1.00, 1.02, 0.98, 1.01, 0.99])
+    assert verdict(baseline, bootstrap_median([1.01, 0.99, 1.00, 1.02, 0.98]), 0.10, 0.05) == "~"
+    assert verdict(baseline, bootstrap_median([1.50, 1.52, 1.48, 1.51, 1.49]), 0.10, 0.05) == "slower"
+    assert verdict(baseline, bootstrap_median([0.50, 0.52, 0.48, 0.51, 0.49]), 0.10, 0.05) == "faster"
+
+
+def test_overlapping_intervals_are_inconclusive():
+    baseline = bootstrap_median([1.0, 1.0, 1.0, 1.0, 3.0])
+    noisy = bootstrap_median([1.3, 1.3, 1.3, 1.3, 0.9])  # Median 30% higher, but the runs overlap
+    assert noisy["low"] <= baseline["high"]
+    assert verdict(baseline, noisy, 0.10, 0.05) == "~"
+
+
+def test_min_delta_floor():
+    baseline = bootstrap_median([0.020, 0.021, 0.020, 0.019, 0.020])
+    slower = bootstrap_median([0.040, 0.041, 0.040, 0.039, 0.040])  # Twice as slow, 0.02 ms more
+    assert verdict(baseline, slower, 0.10, 0.05) == "~"
+    assert verdict(baseline, slower, 0.10, 0.01) == "slower"
+
+
+def test_compare_flags_regressions_and_the_section_that_moved_most():
+    stable = [1.0, 1.01, 0.99, 1.0, 1.0]
+    baseline = {
+        "wave9": group(stable, stable, {"enemies": [0.2] * 5, "entities": [0.5] * 5}),
+        STARTUP: {"gated": {"time_to_menu": bootstrap_median([200, 201, 199, 200, 200])}, "sections": {}},
+    }
+    current = {
+        "wave9": group([1.5, 1.51, 1.49, 1.5, 1.5], stable, {"enemies": [0.7] * 5, "entities": [0.52] * 5}),
+        STARTUP: {"gated": {"time_to_menu": bootstrap_median([215, 216, 214, 215, 215])}, "sections": {}},
+        "new_scenario": group(stable, stable, {}),  # Not in the baseline: not compared
+    }
+    rows, movers = compare(current, baseline, 0.10, 0.05, 25.0)
+    verdicts = {(group_name, metric): status for group_name, metric, _, _, status in rows}
+    assert verdicts == {("wave9", "update_game"): "slower", ("wave9", "draw"): "~",
+                        (STARTUP, "time_to_menu"): "~"}  # +15 ms at startup: under the 25 ms floor
+    assert movers["wave9"] == ("enemies", 0.2, 0.7)
+    assert movers[STARTUP] is None and moved_most({}, {}) is None
+
+
+def test_baselines_are_kept_per_machine(tmp_path, monkeypatch):
+    key, machine = perf_gate.machine_fingerprint()
+    monkeypatch.setenv("SDL_VIDEODRIVER", "x11")
+    other_key, other_machine = perf_gate.machine_fingerprint()
+    assert other_key != key and other_machine["video_driver"] == "x11"
+
+    path = str(tmp_path / "baselines.json")
+    current = {"wave9": group([1.0] * 3, [1.0] * 3, {})}
+    perf_gate.save_baseline(path, key, machine, {"runs": 3}, current)
+    assert perf_gate.machine_baseline(path, key)["groups"] == current
+    assert perf_gate.machine_baseline(path, other_key) is None  # Another machine: no baseline, exit 2
+    assert perf_gate.machine_baseline(str(tmp_path / "missing.json"), key) is None
@@ -0,0 +1,42 @@
+"""
+Tests du régulateur de qualité du rendu
+"""
+from cosmic_defender import quality
+from cosmic_defender.entities import Bullet
+from cosmic_defender.quality import QualityGovernor, quality_governor
+
+
+def feed(governor, frame_ms, frames):
+    return sum(governor.record(frame_ms) for _ in range(frames))
+
+
+def test_steps_down_fast_and_up_slowly():
+    governor = QualityGovernor(budget_ms=16.7, window=30)
+    assert feed(governor, 25, 29) == 0  # Window not full yet
+    assert feed(governor, 25, 1) == 1 and governor.tier.name == "medium"
+    assert feed(governor, 25, 30) == 1 and governor.tier.name == "low"
+    assert feed(governor, 25, 100) == 0  # Already at the lowest tier
+
+    assert feed(governor, 12, 200) == 0  # Between the thresholds: hold
+    assert feed(governor, 5, quality.UPGRADE_FRAMES) == 0  # The mean needs a few frames to drop
+    assert feed(governor, 5, 30) == 1 and governor.tier.name == "medium"
+
+    # Undoing a step up doubles the wait before the next one
+    assert feed(governor, 25, 30) == 1 and governor.tier.name == "low"
+    assert feed(governor, 5, quality.UPGRADE_FRAMES + 30) == 0
+    assert feed(governor, 5, quality.UPGRADE_FRAMES) == 1
+
+
+def test_fixed_tier_and_trail_length():
+    governor = QualityGovernor()
+    governor.set_mode("low")
+    assert feed(governor, 1, 1000) == 0 and governor.tier.name == "low"
+
+    quality_governor.set_mode("low")
+    try:
+        bullet = Bullet(100, 100, (0, 10), is_player_bullet=False)
+        for _ in range(20):
+            bullet.update(0.01, 1000, 700)
+        assert len(bullet.trail) == quality_governor.tier.bullet_trail
+    finally:
+        quality_governor.set_mode("auto")
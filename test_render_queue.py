@@ -0,0 +1,62 @@
+"""
+Tests de la file de rendu par couches
+"""
+import pygame
+
+from cosmic_defender.entities import Bullet, Particle
+from cosmic_defender.render_queue import RenderQueue, LAYER_ENEMIES, LAYER_OVERLAY, LAYER_PLAYER
+
+
+def solid(color, size=10):
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return surface
+
+
+def test_layers_drawn_in_order_and_queue_emptied():
+    target = pygame.Surface((40, 40))
+    queue = RenderQueue()
+    # Pushed in reverse: the layer decides what ends up on top, not the call order
+    queue.draw(LAYER_OVERLAY, pygame.draw.rect, (0, 0, 255), (20, 20, 2, 2))
+    queue.blit(LAYER_ENEMIES, solid((255, 0, 0)), (20, 20))
+    queue.blit(LAYER_PLAYER, solid((0, 255, 0), 20), (20, 20))
+    assert queue.sprite_count() == 2
+
+    queue.flush(target)
+    assert target.get_at((12, 12))[:3] == (0, 255, 0)  # Player only
+    assert target.get_at((16, 16))[:3] == (255, 0, 0)  # Enemy over player, centered on (20, 20)
+    assert target.get_at((20, 20))[:3] == (0, 0, 255)  # Overlay on top
+    assert queue.sprite_count() == 0 and not any(queue.shapes)
+
+
+def test_offscreen_entities_are_culled_and_counted():
+    queue = RenderQueue()
+    queue.begin(100, 100)
+    inside = Particle(50, 50, (255, 0, 0), (0, 0), 1)
+    edge = Particle(-2, 50, (255, 0, 0), (0, 0), 1)  # Center off-screen, dot still visible
+    above = Particle(50, -20, (255, 0, 0), (0, 0), 1)
+    bullet = Bullet(50, 2, (0, -600), is_player_bullet=False)
+    bullet.trail = [(50, 60)]  # Trail still on screen
+    for entity in (inside, edge, above, bullet):
+        if queue.visible(entity.x, entity.y, *entity.half_extent()):
+            entity.draw(queue)
+    assert (queue.drawn, queue.culled) == (3, 1)
+    assert queue.sprite_count() == 4  # Two dots, the bullet and its one trail dot
+
+    queue.begin(100, 100)
+    assert (queue.drawn, queue.culled) == (0, 0)
+
+
+def test_bullet_drawn_from_cached_sprites():
+    target = pygame.Surface((100, 100))
+    queue = RenderQueue()
+    bullet = Bullet(50, 20, (0, 100), color=(255, 0, 0), is_player_bullet=False)
+    for _ in range(10):
+        bullet.update(0.05, 100, 100)
+    bullet.draw(queue)
+    assert not any(queue.shapes)  # No pygame.draw call left per bullet
+    assert queue.sprite_count() == len(bullet.trail) + 1
+    queue.flush(target)
+    assert target.get_at(bullet.rect.center)[:3] == (255, 0, 0)
+    oldest_x, oldest_y = bullet.trail[0]
+    assert 0 < target.get_at((int(oldest_x), int(oldest_y)))[0] < 255  # Faded trail
@@ -0,0 +1,50 @@
+"""
+Tests du profilage du démarrage et de l'init paresseuse des sous-systèmes
+"""
+import os
+import subprocess
+import sys
+
+from cosmic_defender.startup_profiler import StartupProfiler
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StartupProfiler()
+    with profiler.phase("assets", "player sprites"):
+        pass
+    profiler.mark_first_frame()
+    assert profiler.phases == []
+    assert profiler.time_to_first_frame() is None
+
+
+def test_report_and_budget():
+    profiler = StartupProfiler()
+    profiler.enable(origin=0.0)
+    profiler.record("imports", "pygame", 0.120)
+    with profiler.phase("fonts"):
+        pass
+    profiler.first_frame_at = 0.4
+
+    assert round(profiler.totals()["imports"]) == 120
+    assert profiler.time_to_first_frame() == 400
+    assert profiler.check_budget(500)
+    assert not profiler.check_budget(300)
+    report = profiler.report(300)
+    assert "pygame" in report and "OVER BUDGET" in report
+
+
+def test_menu_starts_without_audio_or_joystick(scratch_dir):
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "import pygame\n"
+        "from cosmic_defender import CosmicDefender\n"
+        "game = CosmicDefender()\n"
+        "before = pygame.joystick.get_init()\n"
+        "game.run_frame(); game.run_frame()\n"
+        "print(pygame.mixer.get_init() is None, before, pygame.joystick.get_init())\n"
+    ) % GAME_DIR
+    output = subprocess.run([sys.executable, "-c", code], cwd=scratch_dir, capture_output=True,
+                            text=True, timeout=60, check=True).stdout
+    assert output.strip().splitlines()[-1] == "True False True"
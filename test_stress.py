@@ -0,0 +1,49 @@
+"""
+Tests du mode stress
+"""
+from types import SimpleNamespace
+
+from cosmic_defender import stress
+from cosmic_defender.frame_stats import SECTIONS
+
+
+class FakeGame:
+    """Frame time grows with the entity count: 0.01 ms per entity to update, as much to draw"""
+
+    def __init__(self):
+        self.current_width, self.current_height = 1000, 700
+        self.enemies, self.enemy_bullets, self.particles = [], [], []
+        self.player = SimpleNamespace(health=1, max_health=100)
+        self.frame_stats = SimpleNamespace(current=dict.fromkeys(SECTIONS, 0.0))
+
+    def run_frame(self, test):
+        test.before_frame(self)
+        count = len(self.enemies) + len(self.enemy_bullets) + len(self.particles)
+        self.frame_stats.current["enemies"] = count * 0.01
+        self.frame_stats.current["entities"] = count * 0.01
+        return test.after_frame(self)
+
+
+def test_ramp_finds_rendered_and_headless_limits():
+    game = FakeGame()
+    test = stress.StressTest(budget_ms=2.0, kinds=("enemies", "particles"))
+    for _ in range(10000):
+        if game.run_frame(test):
+            break
+    assert test.done and game.player.health == 100
+    # 200 entities = 2 ms update + 2 ms draw: the rendered limit is below 100, headless below 200
+    for kind in ("enemies", "particles"):
+        result = test.results[kind]
+        assert 60 <= result["rendered"] <= 100 and 130 <= result["headless"] <= 200
+    assert not game.enemies and not game.particles
+    report = test.report()
+    assert "enemies" in report and "particles" in report
+
+
+def test_limit_capped_when_never_over_budget():
+    game = FakeGame()
+    test = stress.StressTest(budget_ms=1000.0, kinds=("bullets",), max_count=60)
+    while not game.run_frame(test):
+        pass
+    assert test.results["bullets"]["rendered"] == 60 and test.results["bullets"]["capped"]
+    assert ">=60" in test.report()
@@ -0,0 +1,83 @@
+"""
+Tests de la télémétrie par tick
+"""
+import os
+
+import pytest
+
+from cosmic_defender.constants import GameState
+from cosmic_defender.telemetry import COLUMNS, TelemetryRecorder
+
+np = pytest.importorskip("numpy")
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def play(recorder, game, ticks):
+    for _ in range(ticks):
+        game.run_frame()
+        game.player.health = game.player.max_health
+        recorder.record(game, game.frame_stats.frame_times[-1])
+
+
+@pytest.mark.parametrize("file_format", ["npz", "csv"])
+def test_game_recorded_in_blocks_and_written_at_game_over(game, scratch_dir, file_format):
+    recorder = TelemetryRecorder()
+    assert recorder.enable(str(scratch_dir / "telemetry"), file_format, chunk_rows=16)
+    game.start_game("infinite")
+    game.score = 1234
+
+    spare = recorder.spare[0]
+    play(recorder, game, 40)
+    assert recorder.block is not spare and spare in recorder.chunks  # Preallocated block reused first
+    assert recorder.rows() == 40 and len(recorder.chunks) == 2
+
+    game.state = GameState.GAME_OVER
+    path = recorder.flush()
+    recorder.wait(timeout=5)
+    assert recorder.flush() is None and len(recorder.spare) == 3
+
+    if file_format == "npz":
+        columns = np.load(path)
+    else:
+        table = np.genfromtxt(path, delimiter=",", names=True)
+        columns = {name: table[name] for name in table.dtype.names}
+    assert set(columns) == {name for name, _ in COLUMNS}
+    assert len(columns["frame"]) == 40 and (np.diff(columns["frame"]) == 1).all()
+    assert (columns["score"] == 1234).all() and (columns["wave"] == 1).all()
+    assert (columns["frame_ms"] >= columns["update_ms"]).all()
+
+
+def test_disabled_recorder_keeps_nothing():
+    recorder = TelemetryRecorder()
+    recorder.record(None, 1.0)
+    assert recorder.flush() is None and recorder.rows() == 0
+
+
+def test_one_file_per_game_written_when_the_next_starts(scratch_dir):
+    from cosmic_defender import CosmicDefender
+    from cosmic_defender.telemetry import telemetry
+
+    directory = scratch_dir / "telemetry"
+    assert telemetry.enable(str(directory))
+    try:
+        game = CosmicDefender(quality="high")
+        game.start_game("infinite")
+        for _ in range(5):
+            game.run_frame()
+        # A game over turned back into play (stress test) is still the same game
+        game.state = GameState.GAME_OVER
+        game.run_frame()
+        game.state = GameState.PLAYING_INFINITE
+        for _ in range(5):
+            game.run_frame()
+        assert telemetry.rows() == 10 and not directory.exists()
+
+        game.start_game("infinite")  # R after a game over goes straight to a new game
+        telemetry.wait(timeout=5)
+        files = os.listdir(directory)
+        assert len(files) == 1 and len(np.load(directory / files[0])["frame"]) == 10
+        assert telemetry.rows() == 0
+        if game.github_uploader:
+            game.github_uploader.outbox.stop(timeout=1)
+    finally:
+        telemetry.disable()
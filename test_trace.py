@@ -0,0 +1,58 @@
+"""
+Tests de la trace Chrome (spans, threads, format du fichier)
+"""
+import json
+import threading
+
+from cosmic_defender.frame_stats import FrameStats
+from cosmic_defender.trace import Tracer, tracer, traced
+
+
+def test_disabled_tracer_records_nothing():
+    local = Tracer()
+    assert local.span("a") is local.span("b")  # Shared no-op span
+    with local.span("a"):
+        pass
+    local.complete("b", "game", 0.0, 1.0)
+    assert not local.events
+
+
+def test_spans_from_several_threads_saved_as_trace_events(tmp_path):
+    local = Tracer()
+    local.enable()
+    with local.span("frame", "frame"):
+        with local.span("save_score", "io", file="scores.json"):
+            pass
+    worker = threading.Thread(target=lambda: local.complete("HTTP PUT", "network", 1.0, 1.5), name="upload-outbox")
+    worker.start()
+    worker.join()
+
+    path = tmp_path / "trace.json"
+    local.save(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert spans["save_score"]["args"] == {"file": "scores.json"}
+    outer, inner = spans["frame"], spans["save_score"]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    names = {event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert names[spans["HTTP PUT"]["tid"]] == "upload-outbox"
+    assert spans["HTTP PUT"]["tid"] != outer["tid"]
+
+
+def test_frame_stats_laps_and_decorated_functions_become_spans():
+    @traced("work", "io")
+    def work():
+        return 42
+
+    tracer.enable()
+    try:
+        stats = FrameStats()
+        stats.start_frame()
+        stats.lap("events")
+        stats.lap("present")
+        stats.end_frame()
+        assert work() == 42
+    finally:
+        tracer.disable()
+    assert [event[0] for event in tracer.events] == ["events", "present", "frame", "work"]
+    assert work() == 42 and len(tracer.events) == 4
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests de l'outbox d'upload contre un faux serveur de l'API GitHub
+"""
+
+import threading
+import time
+
+import pytest
+
+from cosmic_defender import LEADERBOARD_FILE
+
+
+def make_score(player_id, i):
+    return {"player_id": player_id, "name": player_id, "score": 1000 + i, "wave": 1,
+            "mode": "normal", "timestamp": f"2025-10-01T12:00:{i:02d}"}
+
+
+def uploaded_scores(api):
+    return api.read_file(LEADERBOARD_FILE)["scores"]
+
+
+def test_pending_scores_are_batched(fake_api, make_uploader):
+    fake_api.latency = 0.2
+    uploader = make_uploader(fake_api.url)
+    for i in range(10):
+        uploader.upload_async({"scores": [make_score("p1", i)]})
+
+    assert uploader.outbox.wait_until_empty(10)
+    assert len(uploaded_scores(fake_api)) == 10
+    assert fake_api.put_count <= 2
+    assert uploader.outbox.pending_count() == 0
+
+
+def test_failed_upload_is_retried_with_backoff(fake_api, make_uploader):
+    fake_api.fail_next_puts = 2
+    uploader = make_uploader(fake_api.url)
+    uploader.upload_async(make_score("p1", 0))
+
+    assert uploader.outbox.wait_until_empty(10)
+    assert fake_api.put_count == 3
+    assert uploader.outbox.failures == 0
+    assert len(uploaded_scores(fake_api)) == 1
+
+
+def test_scores_survive_a_restart(fake_api, make_uploader):
+    offline = make_uploader("http://127.0.0.1:9")
+    offline.upload_async(make_score("p1", 0))
+    offline.outbox.stop(5)
+    assert offline.outbox.pending_count() == 1
+
+    # Next launch: the leftover score is drained as soon as the worker starts
+    uploader = make_uploader(fake_api.url)
+    uploader.outbox.start()
+    assert uploader.outbox.wait_until_empty(10)
+    assert [s["player_id"] for s in uploaded_scores(fake_api)] == ["p1"]
+
+
+def test_sha_conflict_is_merged_again(fake_api, make_uploader):
+    other = {"player_id": "other", "name": "other", "score": 5, "wave": 1,
+             "mode": "normal", "timestamp": "2025-10-01T11:00:00"}
+
+    def concurrent_writer(path):
+        # Another client updates the leaderboard between our GET and our PUT
+        fake_api.before_put = None
+        fake_api.write_file(path, {"scores": [other]})
+
+    fake_api.before_put = concurrent_writer
+    uploader = make_uploader(fake_api.url)
+    success, message, _ = uploader.upload_leaderboard({"scores": [make_score("p1", 0)]})
+
+    assert success, message
+    assert fake_api.conflict_count == 1
+    assert {s["player_id"] for s in uploaded_scores(fake_api)} == {"p1", "other"}
+
+
+def test_concurrent_uploaders_lose_no_score(fake_api, make_uploader):
+    fake_api.latency = 0.01
+    uploaders = [make_uploader(fake_api.url, f"outbox{n}") for n in range(4)]
+
+    def play(n, uploader):
+        for i in range(20):
+            uploader.upload_async(make_score(f"p{n}", i))
+
+    threads = [threading.Thread(target=play, args=(n, u)) for n, u in enumerate(uploaders)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for uploader in uploaders:
+        assert uploader.outbox.wait_until_empty(30)
+
+    scores = uploaded_scores(fake_api)
+    assert len(scores) == 80
+    assert len({(s["player_id"], s["timestamp"]) for s in scores}) == 80
+
+
+def test_token_is_decrypted_by_the_upload_worker(fake_api, make_uploader):
+    uploader = make_uploader(fake_api.url)
+    uploader.config["token"] = None
+    decrypted_on = []
+
+    def fake_decrypt():
+        decrypted_on.append(threading.current_thread().name)
+        return "lazy-token"
+
+    uploader._get_secure_token = fake_decrypt
+    assert uploader.is_configured()
+    uploader.upload_async(make_score("p1", 0))
+
+    assert uploader.outbox.wait_until_empty(10)
+    assert decrypted_on == ["upload-outbox"]
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_new_score_does_not_cut_the_backoff(fake_api, make_uploader):
+    fake_api.fail_next_puts = 1
+    uploader = make_uploader(fake_api.url)
+    uploader.outbox.base_delay = uploader.outbox.max_delay = 0.6  # First retry after 0.3 to 0.6 s
+    uploader.upload_async(make_score("p1", 0))
+    assert wait_for(lambda: uploader.outbox.failures == 1)
+
+    for i in range(1, 4):
+        uploader.upload_async(make_score("p1", i))
+    time.sleep(0.1)
+    assert fake_api.put_count == 1  # Still backing off
+
+    assert uploader.outbox.wait_until_empty(10)
+    assert fake_api.put_count == 2  # The retry took all four scores at once
+    assert len(uploaded_scores(fake_api)) == 4
+
+
+def test_permanent_error_pauses_until_config_changes(fake_api, make_uploader, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # save_config writes github_config.json
+    fake_api.fail_status = 401
+    fake_api.fail_next_puts = 100
+    uploader = make_uploader(fake_api.url)
+    uploader.upload_async(make_score("p1", 0))
+    assert wait_for(lambda: uploader.outbox.paused)
+
+    uploader.upload_async(make_score("p1", 1))
+    time.sleep(0.2)
+    assert fake_api.put_count == 1 and uploader.outbox.pending_count() == 2
+
+    fake_api.fail_next_puts = 0
+    uploader.save_config()
+    assert uploader.outbox.wait_until_empty(10)
+    assert uploader.outbox.paused is None
+    assert len(uploaded_scores(fake_api)) == 2
+
+
+def test_auto_upload_off_keeps_scores_queued_without_pausing(fake_api, make_uploader):
+    uploader = make_uploader(fake_api.url)
+    uploader.config["auto_upload"] = False
+    uploader.outbox.enqueue(make_score("p1", 0))  # Left over from when it was on
+    assert wait_for(lambda: uploader.outbox.failures >= 1)
+    assert uploader.outbox.paused is None and uploader.outbox.pending_count() == 1
+
+    uploader.config["auto_upload"] = True  # Any path: the next retry uploads the score
+    assert uploader.outbox.wait_until_empty(10)
+    assert len(uploaded_scores(fake_api)) == 1
+
+
+@pytest.mark.parametrize("status, retryable", [(500, True), (401, False)])
+def test_unreadable_remote_board_is_never_overwritten(fake_api, make_uploader, status, retryable):
+    fake_api.write_file(LEADERBOARD_FILE, {"scores": [make_score("other", 0)]})
+    fake_api.fail_status = status
+    fake_api.fail_next_gets = 1
+    uploader = make_uploader(fake_api.url)
+    success, message, can_retry = uploader.upload_leaderboard({"scores": [make_score("p1", 0)]})
+    assert not success and can_retry == retryable and str(status) in message
+    assert fake_api.put_count == 0
+
+    fake_api.files[LEADERBOARD_FILE] = (b"not json", "bad-sha")  # Malformed body
+    success, message, can_retry = uploader.upload_leaderboard({"scores": [make_score("p1", 0)]})
+    assert not success and can_retry and fake_api.put_count == 0